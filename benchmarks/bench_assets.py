@@ -0,0 +1,83 @@
+"""Bobot gambar dan waktu render per halaman: aset asli vs varian WebP statis.
+
+Bobot halaman dihitung dari ``static/manifest.json`` (varian yang dipilih
+browser untuk kolom selebar ``--width`` px). Waktu render diukur di sisi
+server dengan ``AppTest``: render pertama lalu median beberapa rerun, di
+proses baru untuk setiap mode (``DETEKSI_STATIC_ASSETS=0`` = ``st.image``
+file asli seperti sebelumnya).
+
+    python -m deteksi_sms.assets build
+    python benchmarks/bench_assets.py --reruns 5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DRIVER = """
+import json, statistics, sys, time
+from streamlit.testing.v1 import AppTest
+from deteksi_sms.halaman import PAGES
+reruns = int(sys.argv[1])
+result = {}
+for page in ["Login", *PAGES]:
+    if page == "Aplikasi Deteksi SMS":
+        continue  # tidak ada gambar; animasi hasil hanya muncul setelah deteksi
+    at = AppTest.from_file("aplikasi_sms.py", default_timeout=300)
+    if page != "Login":
+        at.session_state.logged_in = True
+        at.session_state.user = "danny"
+        at.query_params["halaman"] = page
+    times = []
+    for _ in range(reruns + 1):
+        t0 = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - t0)
+    result[page] = {"first": times[0], "rerun": statistics.median(times[1:]),
+                    "error": [str(e.value) for e in at.exception]}
+print(json.dumps(result))
+"""
+
+
+def render_times(static: bool, reruns: int, env: dict) -> dict:
+    env = dict(env, DETEKSI_STATIC_ASSETS="1" if static else "0")
+    out = subprocess.run([sys.executable, "-c", DRIVER, str(reruns)], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--width", type=int, default=960, help="lebar kolom konten di browser (px)")
+    args = parser.parse_args()
+
+    from deteksi_sms import assets
+
+    weights = {page: (original, optimized) for page, original, optimized in assets.report(width=args.width)}
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+        env["DETEKSI_USER_STORE"] = f"sqlite:{os.path.join(tmp, 'users.db')}"
+        before = render_times(False, args.reruns, env)
+        after = render_times(True, args.reruns, env)
+
+    print(f"{'halaman':<22}{'bobot asli':>12}{'WebP':>10}{'render asli':>14}{'statis':>9}"
+          f"{'rerun asli':>13}{'statis':>9}")
+    for page in before:
+        original, optimized = weights[page]
+        b, a = before[page], after[page]
+        print(f"{page:<22}{original / 1024:>9.0f} KB{optimized / 1024:>7.0f} KB"
+              f"{b['first'] * 1000:>11.0f} ms{a['first'] * 1000:>6.0f} ms"
+              f"{b['rerun'] * 1000:>10.0f} ms{a['rerun'] * 1000:>6.0f} ms")
+        for error in b["error"] + a["error"]:
+            print("   error:", error)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Indeks kampanye (MinHash/LSH): latensi query, hit rate dan memori pada 1 juta pesan.
+
+Indeks diisi dengan ``--messages`` pesan sintetis (``benchmarks/synthetic.py``)
+lewat jalur yang sama dengan aplikasi (``cached_scores`` dengan scoring
+penuh untuk pesan yang tidak cocok), lalu diukur dengan ``--queries`` varian
+baru (seed lain, tanpa duplikat persis):
+
+- latensi ``lookup_many`` satu pesan (p50/p95/p99) pada indeks yang sudah penuh;
+- latensi ``score_texts`` satu pesan dengan vs tanpa indeks;
+- hit rate dan kecocokan label hit dengan hasil model penuh;
+- throughput per batch dengan vs tanpa indeks;
+- memori klaster terukur (``sys.getsizeof``) vs perkiraan ``CLUSTER_BYTES``.
+
+    python benchmarks/bench_campaign.py --messages 1000000
+    python benchmarks/bench_campaign.py --messages 200000 --max-mb 2   # uji eviction
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+BATCH = 2_000
+
+
+def _percentiles(seconds: list) -> str:
+    ms = np.array(seconds) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return f"p50 {p50:.3f} ms  p95 {p95:.3f} ms  p99 {p99:.3f} ms"
+
+
+def _batches(rows, size: int = BATCH):
+    batch = []
+    for text, _ in rows:
+        batch.append(text)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def measured_bytes(index) -> int:
+    """Memori struktur indeks (matriks signature, bucket, objek klaster)."""
+    total = index._signatures.nbytes + sum(sys.getsizeof(bucket) for bucket in index._buckets)
+    total += sys.getsizeof(index._clusters)
+    for cluster in index._clusters.values():
+        total += sys.getsizeof(cluster) + sys.getsizeof(cluster.keys) + sys.getsizeof(cluster.example)
+        total += sys.getsizeof(cluster.scores) + sum(sys.getsizeof(key) for key in cluster.keys)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--max-mb", type=float, default=None, help="batas memori indeks (default DETEKSI_CAMPAIGN_MAX_MB)")
+    parser.add_argument("--threshold", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    os.chdir(ROOT)
+
+    from deteksi_sms import artifacts, campaign, metrics
+    from deteksi_sms.batch import _score_unique, score_texts
+    from deteksi_sms.cache import cached_scores
+    from deteksi_sms.preprocessing import get_preprocessor
+    from synthetic import generate
+
+    metrics.ENABLED = False
+    scorer, vectorizer = artifacts.load_model_and_vectorizer()
+    preprocessor = get_preprocessor()
+    options = {}
+    if args.max_mb is not None:
+        options["max_memory_mb"] = args.max_mb
+    if args.threshold is not None:
+        options["threshold"] = args.threshold
+    index = campaign.CampaignIndex(preprocessor.casefolding, "bench", **options)
+
+    def full(texts):
+        return _score_unique(texts, preprocessor, vectorizer, scorer)
+
+    started = time.perf_counter()
+    for batch in _batches(generate(args.messages, seed=args.seed)):
+        cached_scores(batch, index, full)
+    build = time.perf_counter() - started
+    stats = index.stats()
+    print(f"indeks diisi {args.messages:,} pesan dalam {build:.1f} s ({args.messages / build:,.0f} pesan/s)")
+    print(f"  klaster {stats['clusters']:,} / {stats['max_clusters']:,}, hit rate {stats['hit_rate']:.3f}, "
+          f"eviction {stats['evictions']:,}, pendek {stats['skipped_short']:,}")
+    measured = measured_bytes(index)
+    print(f"  memori terukur {measured / 2**20:.1f} MB (matriks signature {index._signatures.nbytes / 2**20:.1f} MB "
+          f"dialokasikan penuh), perkiraan {stats['memory_mb_est']:.1f} MB, "
+          f"{(measured - index._signatures.nbytes) / max(1, stats['clusters']) + 4 * campaign.NUM_PERM:,.0f} "
+          f"byte/klaster (CLUSTER_BYTES {campaign.CLUSTER_BYTES:,})")
+
+    queries = [text for text, _ in generate(args.queries, seed=args.seed + 1, duplicates=0)]
+    hits_before = index.hits
+    lookup, with_index, without_index = [], [], []
+    for text in queries:
+        t0 = time.perf_counter()
+        index.lookup_many([text])
+        t1 = time.perf_counter()
+        lookup.append(t1 - t0)
+    hit_rate = (index.hits - hits_before) / len(queries)
+    for text in queries:
+        t0 = time.perf_counter()
+        score_texts([text], preprocessor, vectorizer, scorer, campaigns=index)
+        t1 = time.perf_counter()
+        score_texts([text], preprocessor, vectorizer, scorer)
+        t2 = time.perf_counter()
+        with_index.append(t1 - t0)
+        without_index.append(t2 - t1)
+    print(f"query satu pesan ({len(queries):,} varian baru, hit rate {hit_rate:.3f})")
+    print(f"  lookup_many            : {_percentiles(lookup)}")
+    print(f"  score_texts + indeks   : {_percentiles(with_index)}")
+    print(f"  score_texts tanpa      : {_percentiles(without_index)}")
+
+    found, _ = index.lookup_many(queries)
+    full_labels, _ = full(queries)
+    hit_rows = sorted(found)
+    agreement = np.mean([found[i][0] == full_labels[i] for i in hit_rows]) if hit_rows else float("nan")
+    print(f"kecocokan label hit vs model penuh: {agreement:.4f} ({len(hit_rows):,} hit)")
+
+    throughput = {}
+    for name, campaigns in (("tanpa indeks", None), ("dengan indeks", index)):
+        started = time.perf_counter()
+        for batch in _batches((text, None) for text in queries):
+            score_texts(batch, preprocessor, vectorizer, scorer, campaigns=campaigns)
+        throughput[name] = len(queries) / (time.perf_counter() - started)
+    print("throughput batch: " + ", ".join(f"{name} {value:,.0f} pesan/s" for name, value in throughput.items()))
+
+
+if __name__ == "__main__":
+    main()
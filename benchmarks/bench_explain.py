@@ -0,0 +1,98 @@
+"""Ongkos penjelasan token pemicu (``deteksi_sms.explain``) di jalur batch.
+
+Membandingkan ``_score_unique`` (preprocess + transform + predict) dengan
+dan tanpa ``Explainer`` pada pesan sintetis unik, lalu mencocokkan hasil
+``Explainer.explain`` dan ``trigger_words`` dengan perhitungan naif per
+baris (inversi vocabulary + bobot pasangan) untuk memastikan keduanya sama.
+
+    python benchmarks/bench_explain.py --messages 50000
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def naive_explain(scorer, vectorizer, X, labels, top_k: int):
+    """Per baris dengan dict: bentuk yang dihindari ``Explainer``."""
+    inverse = {idx: term for term, idx in vectorizer.vocabulary.items()}
+    classes = list(scorer.classes_)
+    result = []
+    for row, label in enumerate(labels.tolist()):
+        c = classes.index(label)
+        start, end = X.indptr[row], X.indptr[row + 1]
+        weights = {}
+        for idx, value in zip(X.indices[start:end].tolist(), X.data[start:end].tolist()):
+            if scorer.scheme == "ovo":
+                w = sum(scorer.coef_t[idx, k] * (1 if i == c else -1)
+                        for k, (i, j) in enumerate(scorer.pairs) if c in (i, j))
+            else:
+                w = scorer.coef_t[idx, c]
+            if value * w > 0:
+                weights[inverse[idx]] = value * w
+        result.append(sorted(weights.items(), key=lambda kv: -kv[1])[:top_k])
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--batch", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    os.chdir(ROOT)
+
+    from deteksi_sms import explain, metrics, registry
+    from deteksi_sms.batch import _score_unique
+    from deteksi_sms.preprocessing import get_preprocessor
+    from synthetic import generate
+
+    metrics.ENABLED = False
+    loaded = registry.ModelRegistry().load(registry.ModelRegistry().active())
+    preprocessor = get_preprocessor()
+    texts = list(dict.fromkeys(text for text, _ in generate(args.messages, seed=7, duplicates=0)))
+    batches = [texts[i:i + args.batch] for i in range(0, len(texts), args.batch)]
+    _score_unique(texts, preprocessor, loaded.vectorizer, loaded.scorer)  # cache stemmer hangat
+
+    def run(explainer):
+        started = time.perf_counter()
+        for batch in batches:
+            result = _score_unique(batch, preprocessor, loaded.vectorizer, loaded.scorer, explainer)
+            if explainer is not None:
+                result[2].trigger_words()
+        return time.perf_counter() - started
+
+    plain, explained = [], []
+    for _ in range(args.repeat):
+        plain.append(run(None))
+        explained.append(run(loaded.explainer))
+    base, with_explain = statistics.median(plain), statistics.median(explained)
+    print(f"{len(texts):,} pesan unik, batch {args.batch:,}")
+    print(f"  tanpa penjelasan : {base:6.2f} s ({len(texts) / base:,.0f} pesan/s)")
+    print(f"  dengan penjelasan: {with_explain:6.2f} s ({len(texts) / with_explain:,.0f} pesan/s)")
+    print(f"  overhead         : {with_explain / base - 1:+.1%}")
+
+    sample = texts[:2_000]
+    X = loaded.vectorizer.transform(preprocessor.process_many(sample))
+    labels = loaded.scorer.predict(X)
+    explanations = loaded.explainer.explain(X, labels)
+    fast = [explanations[i] for i in range(len(explanations))]
+    slow = naive_explain(loaded.scorer, loaded.vectorizer, X, labels, explain.TOP_K)
+    words = [", ".join(term for term, _ in row) for row in slow]
+    mismatches = sum(
+        [term for term, _ in a] != [term for term, _ in b] or not np.allclose([w for _, w in a], [w for _, w in b])
+        for a, b in zip(fast, slow)
+    ) + sum(a != b for a, b in zip(explanations.trigger_words(), words))
+    print(f"  cocok dengan perhitungan naif: {len(sample) - mismatches:,}/{len(sample):,}")
+    raise SystemExit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
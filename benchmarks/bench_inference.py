@@ -0,0 +1,96 @@
+"""Benchmark inference dense (toarray + SVC.predict) vs sparse (LinearSVCScorer).
+
+Setiap kombinasi mode x jumlah pesan dijalankan di proses terpisah supaya
+peak RSS (ru_maxrss) tidak saling memengaruhi.
+
+    python benchmarks/bench_inference.py
+    python benchmarks/bench_inference.py --sizes 1 1000 100000 --repeat 5
+"""
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import resource
+import subprocess
+import sys
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+MODEL_FILE = os.path.join(ROOT, "Model", "model_fraud.sav")
+CLEAN_DATA = os.path.join(ROOT, "clean_data.csv")
+
+
+def load_messages(n: int) -> list:
+    """Ambil n pesan (sudah di-preprocess) dari clean_data.csv, diulang bila kurang."""
+    import pandas as pd
+
+    texts = pd.read_csv(CLEAN_DATA)["clean_text"].fillna("").tolist()
+    return [texts[i % len(texts)] for i in range(n)]
+
+
+def run_child(mode: str, n: int, repeat: int) -> dict:
+    warnings.filterwarnings("ignore")
+    from deteksi_sms import artifacts
+    from deteksi_sms.inference import LinearSVCScorer
+
+    with open(MODEL_FILE, "rb") as f:
+        svc = pickle.load(f)
+    vectorizer = artifacts.load_model_and_vectorizer(os.path.join(ROOT, "Model"))[1]
+    scorer = LinearSVCScorer.from_svc(svc)
+    messages = load_messages(n)
+
+    if mode == "dense":
+        def predict():
+            return svc.predict(vectorizer.transform(messages).toarray())
+    else:
+        def predict():
+            return scorer.predict(vectorizer.transform(messages))
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        labels = predict()
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    return {
+        "mode": mode,
+        "n": n,
+        "best_s": best,
+        "msg_per_s": n / best,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "labels_sha1": hashlib.sha1(labels.astype("int64").tobytes()).hexdigest(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 1_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "N"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child[0], int(args.child[1]), args.repeat)))
+        return
+
+    print(f"{'n':>8} {'mode':>6} {'detik':>9} {'pesan/detik':>12} {'peak RSS MB':>12}")
+    for n in args.sizes:
+        results = {}
+        for mode in ("dense", "sparse"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", mode, str(n), "--repeat", str(args.repeat)],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            results[mode] = r = json.loads(out.strip().splitlines()[-1])
+            print(f"{n:>8} {mode:>6} {r['best_s']:>9.4f} {r['msg_per_s']:>12,.0f} {r['peak_rss_mb']:>12.1f}")
+        if results["dense"]["labels_sha1"] != results["sparse"]["labels_sha1"]:
+            sys.exit(f"Prediksi dense dan sparse berbeda untuk n={n}")
+
+
+if __name__ == "__main__":
+    main()
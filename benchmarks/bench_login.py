@@ -0,0 +1,73 @@
+"""Latensi dan throughput login dengan parameter hashing yang dipakai aplikasi.
+
+Setiap "sesi" adalah thread yang melakukan login (verifikasi password)
+beberapa kali lewat thread pool hashing di ``deteksi_sms.passwords``.
+Parameter biaya bisa diubah lewat environment variable, misalnya
+``DETEKSI_SCRYPT_N=32768``.
+
+    python benchmarks/bench_login.py --sessions 32 --logins 4
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=32)
+    parser.add_argument("--logins", type=int, default=4, help="login per sesi")
+    args = parser.parse_args()
+
+    from deteksi_sms import passwords
+
+    stored = passwords.hash_password("rahasia123")
+    print("format hash  :", stored.split("$")[0], stored.split("$")[1])
+    print(f"thread pool  : {passwords.HASH_WORKERS} worker, maks {passwords.HASH_MAX_PENDING} antrian")
+
+    started = time.perf_counter()
+    assert passwords.verify_password("rahasia123", stored)
+    print(f"1 verifikasi : {(time.perf_counter() - started) * 1000:.1f} ms (thread script langsung)")
+
+    latencies, busy = [], []
+    lock = threading.Lock()
+    barrier = threading.Barrier(args.sessions + 1)
+
+    def session():
+        barrier.wait()
+        for _ in range(args.logins):
+            t0 = time.perf_counter()
+            try:
+                passwords.verify_password_pooled("rahasia123", stored)
+            except passwords.HashingBusy:
+                with lock:
+                    busy.append(1)
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - t0)
+
+    threads = [threading.Thread(target=session) for _ in range(args.sessions)]
+    for t in threads:
+        t.start()
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    barrier.wait()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    ms = np.array(latencies) * 1000
+    print(f"{args.sessions} sesi x {args.logins} login: {len(latencies)} sukses, {len(busy)} ditolak (sibuk)")
+    print(f"latensi p50 {np.percentile(ms, 50):.0f} ms, p95 {np.percentile(ms, 95):.0f} ms, "
+          f"p99 {np.percentile(ms, 99):.0f} ms")
+    print(f"throughput {len(latencies) / wall:.1f} login/detik, CPU {cpu:.2f} s, wall {wall:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
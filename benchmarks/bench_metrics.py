@@ -0,0 +1,65 @@
+"""Ongkos instrumentasi ``deteksi_sms.metrics`` di jalur deteksi.
+
+Mengukur (1) biaya satu ``with metrics.timer(...)`` kosong dan (2) waktu
+``score_texts`` untuk satu pesan (kasus request interaktif, tempat ongkos
+relatif paling besar) dengan pencatatan aktif vs ``DETEKSI_METRICS=0``.
+
+    python benchmarks/bench_metrics.py --repeat 2000
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def per_call(fn, repeat: int) -> float:
+    """Median detik per panggilan dari 5 putaran ``repeat`` kali."""
+    rounds = []
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        rounds.append((time.perf_counter() - started) / repeat)
+    return statistics.median(rounds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+    os.chdir(ROOT)
+
+    from deteksi_sms import artifacts, metrics
+    from deteksi_sms.batch import score_texts
+    from deteksi_sms.preprocessing import get_preprocessor
+
+    scorer, vectorizer = artifacts.load_model_and_vectorizer()
+    preprocessor = get_preprocessor()
+    text = ["Selamat nomor anda mendapatkan hadiah undian 100 juta, klik link berikut"]
+
+    def empty_timer():
+        with metrics.timer("bench"):
+            pass
+
+    def detect():
+        score_texts(text, preprocessor, vectorizer, scorer)
+
+    detect()
+    timer_cost = per_call(empty_timer, args.repeat * 50)
+    metrics.ENABLED = True
+    enabled = per_call(detect, args.repeat)
+    metrics.ENABLED = False
+    disabled = per_call(detect, args.repeat)
+
+    print(f"timer kosong          : {timer_cost * 1e6:8.2f} µs")
+    print(f"score_texts (metrik)  : {enabled * 1e6:8.1f} µs")
+    print(f"score_texts (tanpa)   : {disabled * 1e6:8.1f} µs")
+    print(f"overhead              : {(enabled - disabled) * 1e6:8.1f} µs ({enabled / disabled - 1:+.1%})")
+
+
+if __name__ == "__main__":
+    main()
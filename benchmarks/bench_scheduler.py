@@ -0,0 +1,75 @@
+"""Simulasi banyak sesi yang mendeteksi SMS bersamaan: langsung vs BatchScheduler.
+
+Setiap "sesi" adalah thread yang mengirim beberapa pesan satu per satu,
+seperti pengguna yang menekan "Cek Deteksi". Yang dibandingkan adalah total
+CPU time proses dan wall time untuk seluruh request.
+
+    python benchmarks/bench_scheduler.py --sessions 200 --messages 20
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import threading
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+DATASET = os.path.join(ROOT, "Dataset", "dataset_spam_sms.csv")
+
+
+def run_sessions(classify, n_sessions: int, n_messages: int, messages: list) -> dict:
+    barrier = threading.Barrier(n_sessions + 1)
+
+    def session(seed):
+        rnd = random.Random(seed)
+        barrier.wait()
+        for _ in range(n_messages):
+            # Angka acak membuat setiap pesan unik, sama seperti input pengguna sungguhan
+            classify([f"{rnd.choice(messages)} {rnd.randint(0, 10**9)}"])
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(n_sessions)]
+    for t in threads:
+        t.start()
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    barrier.wait()
+    for t in threads:
+        t.join()
+    return {"cpu_s": time.process_time() - cpu_start, "wall_s": time.perf_counter() - wall_start}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=20, help="pesan per sesi")
+    parser.add_argument("--max-wait-ms", type=float, default=3.0)
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore")
+
+    from deteksi_sms import artifacts
+    from deteksi_sms.batch import score_texts
+    from deteksi_sms.preprocessing import TextPreprocessor
+    from deteksi_sms.scheduler import BatchScheduler
+
+    model, vectorizer = artifacts.load_model_and_vectorizer(os.path.join(ROOT, "Model"))
+    preprocessor = TextPreprocessor.from_files(os.path.join(ROOT, "Dataset", "key_norm.csv"))
+    with open(DATASET, encoding="utf-8", newline="") as f:
+        messages = [row["teks"] for row in csv.DictReader(f)]
+    preprocessor.process_many(messages)  # isi cache stemming dulu
+
+    def score_fn(texts):
+        return score_texts(texts, preprocessor, vectorizer, model)
+
+    scheduler = BatchScheduler(score_fn, max_wait_ms=args.max_wait_ms)
+    total = args.sessions * args.messages
+    for name, classify in (("langsung", score_fn), ("scheduler", scheduler.classify)):
+        r = run_sessions(classify, args.sessions, args.messages, messages)
+        print(f"{name:>10}: CPU {r['cpu_s']:.2f} s, wall {r['wall_s']:.2f} s, "
+              f"{total / r['wall_s']:,.0f} pesan/detik")
+    print("metrik scheduler:", scheduler.metrics())
+
+
+if __name__ == "__main__":
+    main()
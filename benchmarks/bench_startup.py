@@ -0,0 +1,81 @@
+"""Waktu render pertama (cold start) halaman login dan setiap halaman menu.
+
+Setiap pengukuran berjalan di proses Python baru, seperti container yang
+baru dinyalakan: streamlit di-import dulu (tidak dihitung), lalu
+aplikasi_sms.py dijalankan sekali lewat ``AppTest`` dan diukur waktunya.
+Dicatat juga apakah modul berat (sklearn, pandas, st_aggrid) ikut dimuat.
+
+    python benchmarks/bench_startup.py --repeat 3
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+HEAVY_MODULES = ("sklearn", "pandas", "st_aggrid", "scipy")
+
+DRIVER = """
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t_streamlit = time.perf_counter() - t0
+page = sys.argv[1]
+at = AppTest.from_file("aplikasi_sms.py", default_timeout=300)
+if page != "Login":
+    at.session_state.logged_in = True
+    at.session_state.user = "danny"
+    at.query_params["halaman"] = page
+t1 = time.perf_counter()
+at.run()
+render = time.perf_counter() - t1
+print(json.dumps({
+    "streamlit_import_s": t_streamlit,
+    "first_render_s": render,
+    "error": [str(e.value) for e in at.exception],
+    "heavy": [m for m in %r if m in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def measure(page: str, env: dict) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", DRIVER, page], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="jumlah proses baru per halaman")
+    args = parser.parse_args()
+
+    from deteksi_sms.halaman import PAGES
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+        # Store akun terpisah dari Model/users.db; diisi dulu supaya seed akun bawaan tidak ikut terukur
+        env["DETEKSI_USER_STORE"] = f"sqlite:{os.path.join(tmp, 'users.db')}"
+        measure("Login", env)
+
+        print(f"{'halaman':<24}{'render p50':>12}{'min':>9}{'max':>9}  modul berat")
+        for page in ["Login", *PAGES]:
+            runs = [measure(page, env) for _ in range(args.repeat)]
+            errors = [e for r in runs for e in r["error"]]
+            times = np.array([r["first_render_s"] for r in runs]) * 1000
+            heavy = ", ".join(runs[-1]["heavy"]) or "-"
+            print(f"{page:<24}{np.median(times):>9.0f} ms{times.min():>6.0f} ms{times.max():>6.0f} ms  {heavy}")
+            if errors:
+                print("   error:", errors[0])
+        print(f"(import streamlit sendiri: {runs[-1]['streamlit_import_s'] * 1000:.0f} ms, tidak termasuk di atas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Memori per pekerja dan waktu start untuk 1, 4 dan 16 proses pekerja.
+
+Setiap pekerja adalah proses Python baru yang memuat model, melakukan satu
+transform + predict (seperti warm-up ``registry.ModelRegistry.load``), lalu
+menunggu. Setelah semua pekerja siap, ``/proc/<pid>/smaps_rollup`` dan
+``/proc/<pid>/smaps`` setiap pekerja dibaca:
+
+- RSS, PSS (halaman bersama dibagi rata antar proses) dan USS (halaman privat);
+- tambahan memori per pekerja = (total PSS N pekerja - PSS 1 pekerja) / (N - 1);
+- RSS/PSS khusus mapping file artefak model (bobot, IDF, vocabulary).
+
+Mode:
+
+- ``pickle``: jalur lama, SVC di-unpickle dan TF-IDF di-fit ulang dari korpus;
+- ``dict``: format ringkas dengan ``TfidfVectorizer`` sklearn (vocabulary dict per proses);
+- ``shared``: format ringkas dengan ``SharedTfidfVectorizer`` (semua array mmap).
+
+``--vocab-size`` membuat model sintetis dengan vocabulary sebesar itu di
+folder sementara (mode ``pickle`` dilewati), untuk melihat skala memori pada
+model yang jauh lebih besar dari model bawaan (~1 ribu term).
+
+    python benchmarks/bench_workers.py
+    python benchmarks/bench_workers.py --vocab-size 500000 --workers 1 4
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DRIVER = """
+import json, sys, time, warnings
+t0 = time.perf_counter()
+warnings.filterwarnings("ignore")
+from deteksi_sms import artifacts
+mode, model_dir = sys.argv[1], sys.argv[2]
+if mode == "pickle":
+    from deteksi_sms.inference import LinearSVCScorer
+    model, vocabulary = artifacts.load_pickled(model_dir)
+    scorer = LinearSVCScorer.from_svc(model)
+    vectorizer = artifacts.fit_vectorizer(vocabulary, artifacts.load_training_corpus())
+else:
+    scorer, vectorizer = artifacts.load_compact(model_dir, use_shared=mode == "shared")
+scorer.predict(vectorizer.transform(["selamat anda mendapatkan hadiah pulsa gratis", "halo apa kabar"]))
+print(json.dumps({"startup_s": time.perf_counter() - t0, "sklearn": "sklearn" in sys.modules}), flush=True)
+sys.stdin.read()
+"""
+
+
+def _kb(value: str) -> float:
+    return int(value.split()[0]) / 1024
+
+
+def memory(pid: int, model_dir: str) -> dict:
+    """RSS/PSS/USS proses (MB) dan RSS/PSS mapping file di ``model_dir``."""
+    with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+        rollup = dict(line.split(":", 1) for line in f if ":" in line and not line[0].isdigit())
+    result = {
+        "rss": _kb(rollup["Rss"]), "pss": _kb(rollup["Pss"]),
+        "uss": _kb(rollup["Private_Clean"]) + _kb(rollup["Private_Dirty"]),
+        "model_rss": 0.0, "model_pss": 0.0,
+    }
+    model_dir = os.path.realpath(model_dir)
+    in_model = False
+    with open(f"/proc/{pid}/smaps", "r") as f:
+        for line in f:
+            head = line.split(None, 5)
+            if "-" in head[0] and not head[0].endswith(":"):
+                in_model = len(head) == 6 and os.path.dirname(head[5].strip()) == model_dir
+            elif in_model and head[0] in ("Rss:", "Pss:"):
+                result["model_" + head[0][:-1].lower()] += _kb(line.split(":", 1)[1])
+    return result
+
+
+def run_workers(mode: str, n: int, model_dir: str, env: dict) -> dict:
+    started = time.perf_counter()
+    workers = [
+        subprocess.Popen([sys.executable, "-c", DRIVER, mode, model_dir], cwd=ROOT, env=env,
+                         stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        for _ in range(n)
+    ]
+    try:
+        ready = [json.loads(worker.stdout.readline()) for worker in workers]
+        all_ready = time.perf_counter() - started
+        usage = [memory(worker.pid, model_dir) for worker in workers]
+    finally:
+        for worker in workers:
+            worker.stdin.close()
+            worker.wait()
+    summary = {key: float(np.mean([u[key] for u in usage])) for key in usage[0]}
+    summary.update(
+        workers=n, total_pss=sum(u["pss"] for u in usage), all_ready_s=all_ready,
+        startup_s=float(np.median([r["startup_s"] for r in ready])), sklearn=ready[0]["sklearn"],
+    )
+    return summary
+
+
+def synthetic_model(model_dir: str, vocab_size: int, seed: int = 0) -> None:
+    """Model linear OvO 3 kelas dengan ``vocab_size`` term acak (format ringkas)."""
+    from deteksi_sms import artifacts
+    from deteksi_sms.inference import LinearSVCScorer
+    from deteksi_sms.train import make_vectorizer
+
+    rng = np.random.default_rng(seed)
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    lengths = rng.integers(4, 13, vocab_size)
+    terms = set()
+    while len(terms) < vocab_size:
+        terms.update("".join(rng.choice(letters, n)) for n in lengths[: vocab_size - len(terms)])
+    vocabulary = {term: i for i, term in enumerate(sorted(terms))}
+    idf = rng.uniform(1.0, 10.0, vocab_size)
+    scorer = LinearSVCScorer(rng.normal(size=(vocab_size, 3)).astype(np.float32), [0.1, 0.2, 0.3], [0, 1, 2])
+    artifacts.export_compact(scorer, make_vectorizer(vocabulary, idf), model_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--modes", nargs="+", default=["pickle", "dict", "shared"],
+                        choices=["pickle", "dict", "shared"])
+    parser.add_argument("--vocab-size", type=int, default=None, help="model sintetis dengan vocabulary sebesar ini")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    env["DETEKSI_METRICS"] = "0"
+    with tempfile.TemporaryDirectory() as tmp:
+        model_dir, modes = os.path.join(ROOT, "Model"), args.modes
+        if args.vocab_size:
+            model_dir, modes = tmp, [mode for mode in modes if mode != "pickle"]
+            synthetic_model(model_dir, args.vocab_size)
+            size = sum(os.path.getsize(os.path.join(tmp, name)) for name in os.listdir(tmp))
+            print(f"model sintetis: {args.vocab_size:,} term, artefak {size / 2**20:.1f} MB")
+
+        print(f"{'mode':<8}{'N':>4}{'start p50':>11}{'semua siap':>12}{'RSS':>9}{'PSS':>9}{'USS':>9}"
+              f"{'model RSS/PSS':>16}{'tambahan/pekerja':>18}  sklearn")
+        for mode in modes:
+            base = None
+            for n in args.workers:
+                r = run_workers(mode, n, model_dir, env)
+                base = r if base is None else base
+                extra = (r["total_pss"] - base["total_pss"]) / (n - base["workers"]) if n > base["workers"] else r["pss"]
+                print(f"{mode:<8}{n:>4}{r['startup_s'] * 1000:>8.0f} ms{r['all_ready_s']:>10.2f} s"
+                      f"{r['rss']:>6.1f} MB{r['pss']:>6.1f} MB{r['uss']:>6.1f} MB"
+                      f"{r['model_rss']:>7.2f}/{r['model_pss']:.2f} MB{extra:>15.1f} MB  {'ya' if r['sklearn'] else '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Load test lokal untuk layanan HTTP ``deteksi_sms.service``.
+
+Menjalankan server di subprocess (kecuali ``--url`` diberikan), lalu
+mengirim request POST /classify secara bersamaan dan melaporkan latensi
+p50/p99 serta throughput.
+
+    python benchmarks/load_test_service.py --requests 5000 --concurrency 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATASET = os.path.join(ROOT, "Dataset", "dataset_spam_sms.csv")
+
+
+def load_messages() -> list:
+    import csv
+
+    with open(DATASET, encoding="utf-8", newline="") as f:
+        return [row["teks"] for row in csv.DictReader(f)]
+
+
+def wait_until_ready(url: str, timeout: float = 120.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(url + "/health", timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server {url} tidak siap dalam {timeout} detik")
+
+
+async def run_load(url: str, messages: list, n_requests: int, concurrency: int, batch: int) -> dict:
+    from tornado.httpclient import AsyncHTTPClient
+
+    client = AsyncHTTPClient(max_clients=concurrency)
+    rnd = random.Random(0)
+    latencies = []
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one():
+        texts = rnd.choices(messages, k=batch)
+        body = json.dumps({"text": texts[0]} if batch == 1 else {"texts": texts})
+        async with sem:
+            start = time.perf_counter()
+            await client.fetch(url + "/classify", method="POST", body=body,
+                               headers={"Content-Type": "application/json"})
+            latencies.append(time.perf_counter() - start)
+
+    # Pemanasan supaya cache stemming dan koneksi siap
+    await asyncio.gather(*(one() for _ in range(min(concurrency, 50))))
+    latencies.clear()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(n_requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": n_requests,
+        "concurrency": concurrency,
+        "messages_per_request": batch,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(0.99 * (len(latencies) - 1))] * 1000,
+        "requests_per_s": n_requests / elapsed,
+        "messages_per_s": n_requests * batch / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="URL server yang sudah berjalan (default: jalankan sendiri)")
+    parser.add_argument("--port", type=int, default=8601)
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=1, help="jumlah pesan per request")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        url = f"http://127.0.0.1:{args.port}"
+        server = subprocess.Popen(
+            [sys.executable, "-m", "deteksi_sms.service", "--port", str(args.port),
+             "--max-wait-ms", str(args.max_wait_ms)],
+            cwd=ROOT, stdout=subprocess.DEVNULL,
+        )
+    try:
+        wait_until_ready(url)
+        result = asyncio.run(run_load(url, load_messages(), args.requests, args.concurrency, args.batch))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
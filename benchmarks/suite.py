@@ -0,0 +1,323 @@
+"""Suite benchmark offline: preprocessing, vectorisasi, inferensi, cold start, login.
+
+Korpus diperbesar dari ``Dataset/dataset_spam_sms.csv`` dengan
+``benchmarks/synthetic.py`` (default 100 ribu pesan, ``--messages 1000000``
+untuk ukuran produksi). ``clean_data.csv`` (hasil preprocessing notebook)
+dipakai sebagai korpus nyata untuk latensi transform/predict. Setiap kasus
+berjalan di proses Python baru supaya peak RSS dan cold start tidak saling
+memengaruhi.
+
+Hasil ditulis sebagai JSON. Dengan ``--baseline`` setiap metrik
+dibandingkan dengan hasil tersimpan; metrik yang memburuk lebih dari
+``--tolerance`` dilaporkan sebagai regresi dan exit code menjadi 1.
+
+    python benchmarks/suite.py --out hasil.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json
+    python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+    python benchmarks/suite.py --cases login cold_start --messages 1000000
+
+Arah metrik diambil dari namanya: ``*_per_s`` makin besar makin baik,
+``*_ms``, ``*_s`` dan ``*_mb`` makin kecil makin baik. Selisih absolut yang
+sangat kecil (``NOISE_FLOOR``) tidak dihitung sebagai regresi.
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+CLEAN_DATA = os.path.join(ROOT, "clean_data.csv")
+LATENCY_SAMPLES = 2_000
+TOLERANCE = 0.15
+
+# Selisih absolut di bawah batas ini dianggap derau (mis. p99 predict ~0,03 ms)
+NOISE_FLOOR = {"_ms": 0.05, "_s": 0.01, "_mb": 5.0}
+
+# Urutan penting: ``preprocess`` menulis teks bersih yang dipakai ``vectorize``/``inference``
+CASES = ("cold_start", "preprocess", "vectorize", "inference", "end_to_end", "login")
+
+
+def _percentiles(seconds: list, prefix: str) -> dict:
+    ordered = sorted(seconds)
+
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))] * 1000
+
+    return {f"{prefix}_p50_ms": pick(50), f"{prefix}_p95_ms": pick(95), f"{prefix}_p99_ms": pick(99)}
+
+
+def _latency(fn, items, prefix: str) -> dict:
+    """Latensi per item (satu panggilan ``fn`` per item)."""
+    timings = []
+    for item in items:
+        started = time.perf_counter()
+        fn(item)
+        timings.append(time.perf_counter() - started)
+    return _percentiles(timings, prefix)
+
+
+def _read_texts(path: str) -> list:
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return [row["teks"] for row in csv.DictReader(f)]
+
+
+def _read_lines(path: str) -> list:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().split("\n")[:-1]
+
+
+def _seed_clean_texts() -> list:
+    with open(CLEAN_DATA, "r", encoding="utf-8", newline="") as f:
+        return [row["clean_text"] for row in csv.DictReader(f)]
+
+
+def case_cold_start(work: str, samples: int) -> dict:
+    started = time.perf_counter()
+    from deteksi_sms import artifacts
+    imported = time.perf_counter()
+    artifacts.load_model_and_vectorizer(os.path.join(ROOT, "Model"))
+    loaded = time.perf_counter()
+    artifacts.load_model_and_vectorizer(os.path.join(ROOT, "Model"))
+    warm = time.perf_counter()
+    from deteksi_sms.preprocessing import TextPreprocessor
+    t0 = time.perf_counter()
+    TextPreprocessor.from_files()
+    return {
+        "import_s": imported - started,
+        "load_model_and_vectorizer_s": loaded - imported,
+        "reload_s": warm - loaded,
+        "preprocessor_init_s": time.perf_counter() - t0,
+    }
+
+
+def case_preprocess(work: str, samples: int) -> dict:
+    from deteksi_sms.preprocessing import TextPreprocessor
+
+    texts = _read_texts(os.path.join(work, "corpus.csv"))
+    pre = TextPreprocessor.from_files()
+    started = time.perf_counter()
+    clean = pre.process_many(texts)
+    elapsed = time.perf_counter() - started
+    with open(os.path.join(work, "clean.txt"), "w", encoding="utf-8") as f:
+        f.writelines(text + "\n" for text in clean)
+
+    result = {"messages": len(texts), "msg_per_s": len(texts) / elapsed}
+    # Throughput per langkah pada sampel, masing-masing dengan masukan hasil langkah sebelumnya
+    sample = texts[:max(samples * 10, 1)]
+    for step in ("casefolding", "text_normalize", "remove_stop_word", "steaming"):
+        fn = getattr(pre, step)
+        started = time.perf_counter()
+        sample = [fn(text) for text in sample]
+        result[f"{step}_msg_per_s"] = len(sample) / (time.perf_counter() - started)
+    # Latensi dengan preprocessor baru (cache stemmer kosong) = pesan pertama setelah start
+    result.update(_latency(TextPreprocessor.from_files(), texts[-samples:], "latency_cold_cache"))
+    result.update(_latency(pre, texts[-samples:], "latency"))
+    return result
+
+
+def case_vectorize(work: str, samples: int) -> dict:
+    from deteksi_sms import artifacts
+
+    _, vectorizer = artifacts.load_model_and_vectorizer(os.path.join(ROOT, "Model"))
+    clean = _read_lines(os.path.join(work, "clean.txt"))
+    started = time.perf_counter()
+    X = vectorizer.transform(clean)
+    elapsed = time.perf_counter() - started
+    seed = _seed_clean_texts()
+    result = {"messages": len(clean), "msg_per_s": len(clean) / elapsed, "nnz_per_msg": X.nnz / max(1, len(clean))}
+    result.update(_latency(lambda text: vectorizer.transform([text]), clean[:samples], "latency"))
+    result.update(_latency(lambda text: vectorizer.transform([text]), seed, "seed_latency"))
+    return result
+
+
+def case_inference(work: str, samples: int) -> dict:
+    from deteksi_sms import artifacts
+
+    scorer, vectorizer = artifacts.load_model_and_vectorizer(os.path.join(ROOT, "Model"))
+    X = vectorizer.transform(_read_lines(os.path.join(work, "clean.txt")))
+    started = time.perf_counter()
+    scorer.predict(X)
+    elapsed = time.perf_counter() - started
+    rows = [X[i] for i in range(min(samples, X.shape[0]))]
+    seed = vectorizer.transform(_seed_clean_texts())
+    result = {"messages": X.shape[0], "msg_per_s": X.shape[0] / elapsed}
+    result.update(_latency(scorer.predict, rows, "latency"))
+    result.update(_latency(scorer.predict, [seed[i] for i in range(seed.shape[0])], "seed_latency"))
+    return result
+
+
+def case_end_to_end(work: str, samples: int) -> dict:
+    from deteksi_sms import artifacts
+    from deteksi_sms.batch import CHUNK_SIZE, score_texts
+    from deteksi_sms.preprocessing import TextPreprocessor
+
+    scorer, vectorizer = artifacts.load_model_and_vectorizer(os.path.join(ROOT, "Model"))
+    pre = TextPreprocessor.from_files()
+    texts = _read_texts(os.path.join(work, "corpus.csv"))
+    started = time.perf_counter()
+    for start in range(0, len(texts), CHUNK_SIZE):
+        score_texts(texts[start:start + CHUNK_SIZE], pre, vectorizer, scorer)
+    elapsed = time.perf_counter() - started
+    result = {"messages": len(texts), "msg_per_s": len(texts) / elapsed}
+    result.update(_latency(lambda text: score_texts([text], pre, vectorizer, scorer), texts[:samples], "latency"))
+    return result
+
+
+def case_login(work: str, samples: int) -> dict:
+    from deteksi_sms import passwords
+    from deteksi_sms.userstore import SQLiteUserStore
+
+    def median_s(fn, repeat=5):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings)
+
+    stored = passwords.hash_password("rahasia123")
+    store = SQLiteUserStore(os.path.join(work, "users.db"))
+    for i in range(1_000):
+        store.create_user(f"user{i:04d}", stored)
+    names = [f"user{i % 1_000:04d}" for i in range(samples)]
+    result = {
+        "hash_s": median_s(lambda: passwords.hash_password("rahasia123")),
+        "verify_s": median_s(lambda: passwords.verify_password("rahasia123", stored)),
+    }
+    result.update(_latency(store.get_hash, names, "user_lookup"))
+    return result
+
+
+def run_case(name: str, work: str, samples: int) -> dict:
+    started = time.perf_counter()
+    result = globals()[f"case_{name}"](work, samples)
+    result["wall_s"] = time.perf_counter() - started
+    result["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return result
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def direction(metric: str) -> int:
+    """+1 bila makin besar makin baik, -1 bila makin kecil makin baik, 0 bila tidak dibandingkan."""
+    if metric.endswith("_per_s"):
+        return 1
+    if metric.endswith(("_ms", "_s", "_mb")):
+        return -1
+    return 0
+
+
+def compare(results: dict, baseline: dict, tolerance: float = TOLERANCE) -> list:
+    """Baris (kasus, metrik, baseline, sekarang, perubahan, regresi?) untuk metrik yang ada di keduanya."""
+    rows = []
+    for case, metrics in results.items():
+        for metric, value in metrics.items():
+            sign = direction(metric)
+            before = baseline.get(case, {}).get(metric)
+            if not sign or before is None or not before:
+                continue
+            change = (value - before) / before
+            floor = next((v for suffix, v in NOISE_FLOOR.items() if metric.endswith(suffix)), 0.0)
+            regressed = sign * change < -tolerance and abs(value - before) > floor
+            rows.append((case, metric, before, value, change, regressed))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES))
+    parser.add_argument("--messages", type=int, default=100_000, help="ukuran korpus sintetis")
+    parser.add_argument("--latency-samples", type=int, default=LATENCY_SAMPLES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="tulis hasil JSON ke file ini (default: stdout)")
+    parser.add_argument("--baseline", help="JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument("--save-baseline", help="simpan hasil run ini sebagai baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="batas perburukan relatif")
+    parser.add_argument("--child", nargs=2, metavar=("CASE", "WORK"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_case(args.child[0], args.child[1], args.latency_samples)))
+        return
+
+    import synthetic
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    env["DETEKSI_METRICS"] = "0"
+    cases = [case for case in CASES if case in args.cases]
+    if any(case in ("vectorize", "inference") for case in cases) and "preprocess" not in cases:
+        cases.insert(0, "preprocess")
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench-sms-") as work:
+        started = time.perf_counter()
+        synthetic.write_csv(os.path.join(work, "corpus.csv"), args.messages, seed=args.seed)
+        print(f"korpus sintetis {args.messages:,} pesan ({time.perf_counter() - started:.1f} s)", file=sys.stderr)
+        for case in cases:
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", case, work, "--latency-samples", str(args.latency_samples)],
+                cwd=ROOT, env=env, capture_output=True, text=True,
+            )
+            if out.returncode:
+                sys.exit(f"Kasus {case} gagal:\n{out.stderr}")
+            results[case] = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{case:<11} selesai dalam {results[case]['wall_s']:.1f} s", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "timestamp": time.time(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "messages": args.messages,
+            "latency_samples": args.latency_samples,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=1)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("messages") != args.messages:
+            print(f"Peringatan: baseline diukur dengan {baseline['meta'].get('messages'):,} pesan", file=sys.stderr)
+        rows = compare(results, baseline["results"], args.tolerance)
+        regressions = [row for row in rows if row[5]]
+        print(f"\n{'kasus':<11} {'metrik':<34} {'baseline':>12} {'sekarang':>12} {'ubah':>8}", file=sys.stderr)
+        for case, metric, before, value, change, regressed in rows:
+            flag = "  REGRESI" if regressed else ""
+            print(f"{case:<11} {metric:<34} {before:>12.4g} {value:>12.4g} {change:>+8.1%}{flag}", file=sys.stderr)
+        print(f"\n{len(regressions)} regresi (toleransi {args.tolerance:.0%})", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Paket pendukung aplikasi deteksi SMS spam (dipakai aplikasi_sms.py dan training)."""
@@ -0,0 +1,328 @@
+"""Format artefak model yang ringkas (tanpa pickle).
+
+SVC linear dari notebook disimpan sebagai pickle 1,3 MB karena ikut membawa
+semua support vector, padahal untuk prediksi cukup bobot one-vs-one dan
+intercept-nya. Vectorizer juga disimpan dalam keadaan sudah di-fit, sehingga
+aplikasi tidak perlu lagi ``fit(["dummy data"])`` dan bobot IDF-nya sama
+dengan saat training. ``export`` menyimpan:
+
+- ``model_fraud.weights.npy``: bobot float32 berbentuk (n_features, n_pairs),
+  dimuat dengan ``np.load(mmap_mode='r')``;
+- ``model_fraud.idf.npy``: array ``idf_`` TF-IDF hasil fit korpus training;
+- ``model_fraud.vocab.npy`` + ``model_fraud.columns.npy``: vocabulary sebagai
+  tabel string terurut + indeks kolom (lihat ``deteksi_sms.vectorizer``);
+- ``model_fraud.json``: kelas, intercept dan parameter TF-IDF.
+
+Semua array dimuat dengan mmap read-only, jadi beberapa proses pekerja
+memakai halaman page cache yang sama. Format 1 (vocabulary di dalam JSON)
+masih bisa dimuat; ``migrate`` menulis ulang folder format 1 ke format 2.
+
+Pemakaian:
+
+    python -m deteksi_sms.artifacts export
+    python -m deteksi_sms.artifacts migrate
+    python -m deteksi_sms.artifacts verify
+"""
+import argparse
+import hashlib
+import json
+import os
+import pickle
+
+import numpy as np
+
+from deteksi_sms import vectorizer as shared
+from deteksi_sms.inference import LinearSVCScorer
+
+MODEL_DIR = "Model"
+PICKLE_MODEL = "model_fraud.sav"
+PICKLE_VOCAB = "new_selected_feature_tf-idf.sav"
+COMPACT_WEIGHTS = "model_fraud.weights.npy"
+COMPACT_META = "model_fraud.json"
+COMPACT_IDF = "model_fraud.idf.npy"
+
+# Korpus hasil preprocessing yang dipakai notebook untuk fit TF-IDF
+TRAINING_CORPUS = "clean_data.csv"
+
+FORMAT_VERSION = 2
+# Format 1: vocabulary berupa dict di model_fraud.json
+SUPPORTED_FORMATS = (1, 2)
+
+# Parameter TfidfVectorizer yang memengaruhi hasil transform
+TFIDF_PARAMS = (
+    "decode_error", "lowercase", "token_pattern", "ngram_range", "analyzer",
+    "norm", "use_idf", "smooth_idf", "sublinear_tf",
+)
+
+
+def load_training_corpus(path: str = TRAINING_CORPUS) -> list:
+    """Kolom clean_text dari clean_data.csv (baris kosong terbaca NaN di pandas)."""
+    import pandas as pd
+
+    return pd.read_csv(path)["clean_text"].fillna("").tolist()
+
+
+def fit_vectorizer(vocabulary: dict, corpus):
+    """Fit TF-IDF dengan vocabulary tetap, sehingga IDF dihitung dari korpus training."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    return TfidfVectorizer(decode_error="replace", vocabulary=vocabulary).fit(corpus)
+
+
+def _staging_path(model_dir: str, name: str) -> str:
+    return os.path.join(model_dir, f".{name}.{os.getpid()}.tmp")
+
+
+def export_compact(model, vectorizer, model_dir: str = MODEL_DIR) -> None:
+    """Simpan model linear + TF-IDF yang sudah di-fit ke format ringkas di ``model_dir``.
+
+    ``model`` boleh SVC linear dari notebook, model linear sklearn lain, atau
+    ``LinearSVCScorer`` yang sudah jadi.
+
+    File lama tidak pernah ditimpa di tempat: semua file ditulis dulu ke nama
+    sementara di folder yang sama lalu di-``os.replace`` satu per satu (meta
+    terakhir), sehingga proses yang sedang mmap file lama tetap membaca isi
+    lama yang utuh. Untuk mengganti model yang sedang dilayani sekaligus
+    (tanpa jeda antar file), pakai ``ModelRegistry.publish`` + ``activate``.
+    """
+    if isinstance(model, LinearSVCScorer):
+        scorer = model
+    elif hasattr(model, "kernel"):
+        scorer = LinearSVCScorer.from_svc(model)
+    else:
+        scorer = LinearSVCScorer.from_linear(model)
+    table, columns = shared.vocabulary_arrays(vectorizer)
+    arrays = {
+        COMPACT_WEIGHTS: scorer.coef_t.astype(np.float32),
+        COMPACT_IDF: np.array(vectorizer.idf_, dtype=np.float64),
+        shared.VOCAB_TABLE: table,
+        shared.VOCAB_COLUMNS: columns,
+    }
+    params = vectorizer.get_params()
+    meta = {
+        "format": FORMAT_VERSION,
+        "kernel": "linear",
+        "scheme": scorer.scheme,
+        "classes": scorer.classes_.tolist(),
+        "intercept": scorer.intercept_.tolist(),
+        "tfidf": {key: params[key] for key in TFIDF_PARAMS},
+    }
+    staged = []
+    try:
+        for name, array in arrays.items():
+            staged.append((_staging_path(model_dir, name), name))
+            with open(staged[-1][0], "wb") as f:
+                np.save(f, array)
+        staged.append((_staging_path(model_dir, COMPACT_META), COMPACT_META))
+        with open(staged[-1][0], "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+    except BaseException:
+        for tmp, _ in staged:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        raise
+    for tmp, name in staged:
+        os.replace(tmp, os.path.join(model_dir, name))
+
+
+
+def has_compact(model_dir: str = MODEL_DIR) -> bool:
+    names = (COMPACT_WEIGHTS, COMPACT_IDF, COMPACT_META)
+    return all(os.path.exists(os.path.join(model_dir, name)) for name in names)
+
+
+def has_shared_vocabulary(model_dir: str = MODEL_DIR) -> bool:
+    names = (shared.VOCAB_TABLE, shared.VOCAB_COLUMNS)
+    return all(os.path.exists(os.path.join(model_dir, name)) for name in names)
+
+
+def artifact_files(model_dir: str = MODEL_DIR) -> list:
+    """File artefak yang benar-benar dimuat oleh ``load_model_and_vectorizer``."""
+    if not has_compact(model_dir):
+        names = (PICKLE_MODEL, PICKLE_VOCAB)
+    elif has_shared_vocabulary(model_dir):
+        names = (COMPACT_WEIGHTS, COMPACT_IDF, shared.VOCAB_TABLE, shared.VOCAB_COLUMNS, COMPACT_META)
+    else:
+        names = (COMPACT_WEIGHTS, COMPACT_IDF, COMPACT_META)
+    return [os.path.join(model_dir, name) for name in names]
+
+
+# Checksum terakhir per (path, mtime, ukuran) supaya file tidak di-hash ulang bila tidak berubah
+_checksum_memo = {}
+
+
+def artifact_checksum(model_dir: str = MODEL_DIR) -> str:
+    """SHA-256 gabungan isi file artefak model."""
+    stamp = tuple((path, os.stat(path).st_mtime_ns, os.stat(path).st_size) for path in artifact_files(model_dir))
+    checksum = _checksum_memo.get(stamp)
+    if checksum is None:
+        digest = hashlib.sha256()
+        for path, _, _ in stamp:
+            digest.update(os.path.basename(path).encode("utf-8"))
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+        checksum = _checksum_memo[stamp] = digest.hexdigest()
+    return checksum
+
+
+def _build_vectorizer(meta: dict, idf, vocabulary: dict):
+    """TfidfVectorizer siap pakai dari parameter + idf tersimpan, tanpa fit."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    params = dict(meta["tfidf"])
+    params["ngram_range"] = tuple(params["ngram_range"])
+    vectorizer = TfidfVectorizer(vocabulary=vocabulary, **params)
+    vectorizer.idf_ = idf
+    return vectorizer
+
+
+def load_compact(model_dir: str = MODEL_DIR, use_shared: bool = None):
+    """Muat scorer + vectorizer dari format ringkas (array di-mmap, bukan disalin).
+
+    Format 2 memakai ``SharedTfidfVectorizer`` (vocabulary mmap, tanpa dict
+    per proses) kecuali ``use_shared=False``/``DETEKSI_SHARED_VECTORIZER=0``
+    atau parameter TF-IDF-nya tidak didukung; format 1 selalu TfidfVectorizer.
+    """
+    with open(os.path.join(model_dir, COMPACT_META), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("format") not in SUPPORTED_FORMATS:
+        raise ValueError(f"Format artefak tidak dikenal: {meta.get('format')}")
+    weights = np.load(os.path.join(model_dir, COMPACT_WEIGHTS), mmap_mode="r")
+    idf = np.load(os.path.join(model_dir, COMPACT_IDF), mmap_mode="r")
+    scorer = LinearSVCScorer(weights, meta["intercept"], meta["classes"], meta.get("scheme", "ovo"))
+    if meta["format"] == 1:
+        return scorer, _build_vectorizer(meta, idf, meta["vocabulary"])
+    if use_shared is None:
+        use_shared = shared.ENABLED
+    if use_shared and shared.supports(meta["tfidf"]):
+        return scorer, shared.SharedTfidfVectorizer.load(model_dir, idf, meta["tfidf"])
+    table, columns = shared.load_vocabulary(model_dir)
+    return scorer, _build_vectorizer(meta, idf, dict(zip(table.tolist(), columns.tolist())))
+
+
+def load_pickled(model_dir: str = MODEL_DIR):
+    with open(os.path.join(model_dir, PICKLE_MODEL), "rb") as f:
+        model = pickle.load(f)
+    with open(os.path.join(model_dir, PICKLE_VOCAB), "rb") as f:
+        vocabulary = pickle.load(f)
+    return model, vocabulary
+
+
+def load_model_and_vectorizer(model_dir: str = MODEL_DIR, corpus: str = TRAINING_CORPUS):
+    """Pakai format ringkas bila ada, kalau tidak jatuh ke pickle lama.
+
+    Pada jalur pickle, IDF dihitung ulang dari korpus training (bukan dari
+    dokumen dummy) supaya fitur tetap sama dengan saat training.
+    """
+    if has_compact(model_dir):
+        return load_compact(model_dir)
+    model, vocabulary = load_pickled(model_dir)
+    vectorizer = fit_vectorizer(vocabulary, load_training_corpus(corpus))
+    return LinearSVCScorer.from_svc(model), vectorizer
+
+
+def verify_model(model_dir: str = MODEL_DIR, dataset: str = "Dataset/dataset_spam_sms.csv") -> int:
+    """Bandingkan prediksi format ringkas dengan pickle di seluruh dataset.
+
+    Mengembalikan jumlah pesan yang prediksinya berbeda.
+    """
+    import pandas as pd
+
+    from deteksi_sms.preprocessing import get_preprocessor
+
+    model, vocabulary = load_pickled(model_dir)
+    scorer, vectorizer = load_compact(model_dir)
+    if vectorizer.vocabulary != vocabulary:
+        raise ValueError("Vocabulary format ringkas berbeda dengan pickle")
+
+    texts = get_preprocessor().process_many(pd.read_csv(dataset)["teks"].astype(str))
+    features = vectorizer.transform(texts)
+    return int((model.predict(features.toarray()) != scorer.predict(features)).sum())
+
+
+def verify_shared(model_dir: str = MODEL_DIR, dataset: str = "Dataset/dataset_spam_sms.csv") -> int:
+    """Bandingkan ``SharedTfidfVectorizer`` dengan TfidfVectorizer di seluruh dataset.
+
+    Mengembalikan jumlah baris yang matriks fiturnya tidak identik (bit per bit).
+    """
+    import pandas as pd
+
+    from deteksi_sms.preprocessing import get_preprocessor
+
+    _, fast = load_compact(model_dir, use_shared=True)
+    _, reference = load_compact(model_dir, use_shared=False)
+    if not isinstance(fast, shared.SharedTfidfVectorizer):
+        raise ValueError("Artefak tidak memuat vocabulary bersama (jalankan migrate)")
+    texts = get_preprocessor().process_many(pd.read_csv(dataset)["teks"].astype(str))
+    a, b = fast.transform(texts), reference.transform(texts)
+    if not np.array_equal(a.indptr, b.indptr):
+        return int((np.diff(a.indptr) != np.diff(b.indptr)).sum())
+    differs = (a.indices != b.indices) | (a.data != b.data)
+    return len(np.unique(np.repeat(np.arange(a.shape[0]), np.diff(a.indptr))[differs]))
+
+
+def verify_vectorizer(model_dir: str = MODEL_DIR, corpus: str = TRAINING_CORPUS) -> float:
+    """Bandingkan fitur vectorizer tersimpan dengan ``x_kbest_feature`` di notebook.
+
+    Langkah notebook diulang: TF-IDF unigram di-fit pada clean_text, lalu
+    SelectKBest(chi2, k=3000) memilih kolom. Mengembalikan selisih absolut
+    maksimum antara kedua matriks fitur.
+    """
+    import pandas as pd
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.feature_selection import SelectKBest, chi2
+
+    _, vectorizer = load_compact(model_dir)
+    texts = load_training_corpus(corpus)
+    labels = pd.read_csv(corpus)["label"]
+
+    vec_tf_idf = TfidfVectorizer(ngram_range=(1, 1)).fit(texts)
+    x_train = vec_tf_idf.transform(texts).toarray()
+    chi2_feature = SelectKBest(chi2, k=min(3000, x_train.shape[1]))
+    x_kbest_feature = chi2_feature.fit_transform(x_train, labels)
+
+    # Urutkan kolom sesuai indeks vocabulary yang tersimpan
+    selected = vec_tf_idf.get_feature_names_out()[chi2_feature.get_support()]
+    expected = pd.DataFrame(x_kbest_feature, columns=selected)
+    order = sorted(vectorizer.vocabulary, key=vectorizer.vocabulary.get)
+    if set(order) != set(selected):
+        raise ValueError("Vocabulary tersimpan berbeda dengan fitur hasil SelectKBest")
+    actual = vectorizer.transform(texts).toarray()
+    return float(np.abs(actual - expected[order].to_numpy()).max())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ekspor/verifikasi artefak model ringkas")
+    parser.add_argument("command", choices=["export", "migrate", "verify"])
+    parser.add_argument("--model-dir", default=MODEL_DIR)
+    parser.add_argument("--dataset", default="Dataset/dataset_spam_sms.csv")
+    parser.add_argument("--corpus", default=TRAINING_CORPUS)
+    args = parser.parse_args()
+
+    if args.command == "export":
+        model, vocabulary = load_pickled(args.model_dir)
+        vectorizer = fit_vectorizer(vocabulary, load_training_corpus(args.corpus))
+        export_compact(model, vectorizer, args.model_dir)
+        for path in [os.path.join(args.model_dir, PICKLE_MODEL)] + artifact_files(args.model_dir):
+            print(f"{path}: {os.path.getsize(path):,} byte")
+    elif args.command == "migrate":
+        # Sumber mmap dari file yang sama: export_compact menulis file baru lalu os.replace,
+        # jadi mapping lama tetap utuh selama array sumber dibaca
+        scorer, vectorizer = load_compact(args.model_dir, use_shared=False)
+        export_compact(scorer, vectorizer, args.model_dir)
+        for path in artifact_files(args.model_dir):
+            print(f"{path}: {os.path.getsize(path):,} byte")
+    else:
+        max_diff = verify_vectorizer(args.model_dir, args.corpus)
+        print(f"Selisih maksimum fitur TF-IDF vs x_kbest_feature: {max_diff:.3g}")
+        mismatches = verify_model(args.model_dir, args.dataset)
+        print(f"Prediksi berbeda: {mismatches}")
+        differs = verify_shared(args.model_dir, args.dataset)
+        print(f"Baris fitur vocabulary bersama yang berbeda dari TfidfVectorizer: {differs}")
+        if mismatches or differs or max_diff > 1e-12:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
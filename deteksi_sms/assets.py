@@ -0,0 +1,238 @@
+"""Build dan penyajian aset gambar halaman statis.
+
+Gambar asli di ``Assets/`` berukuran besar (PNG 1918 px, GIF 3,7 MB) dan
+dikirim ulang lewat ``st.image`` pada setiap rerun. ``build`` membuat varian
+WebP yang sudah diperkecil (GIF menjadi WebP animasi) di ``static/`` dengan
+nama berisi hash isi file, plus ``static/manifest.json``.
+
+Folder ``static/`` disajikan langsung oleh Streamlit
+(``server.enableStaticServing`` di ``.streamlit/config.toml``). URL aset
+diberi ``?v=<hash>`` sehingga Tornado mengirim header cache jangka panjang;
+isi baru selalu mendapat nama baru.
+
+Hanya WebP yang dipakai: handler static Streamlit menyajikan ekstensi lain
+(AVIF, MP4, SVG) sebagai ``text/plain``.
+
+Pemakaian:
+
+    python -m deteksi_sms.assets build
+    python -m deteksi_sms.assets report
+"""
+import argparse
+import hashlib
+import html
+import io
+import json
+import os
+from functools import lru_cache
+
+ASSETS_DIR = "Assets"
+STATIC_DIR = "static"
+MANIFEST = "manifest.json"
+STATIC_URL = "./app/static"
+
+# Lebar varian gambar diam dan gambar animasi (tidak pernah lebih lebar dari aslinya)
+WIDTHS = (480, 960, 1440)
+ANIMATED_WIDTHS = (360, 640)
+QUALITY = 80
+ANIMATED_QUALITY = 60
+
+# Setel DETEKSI_STATIC_ASSETS=0 untuk kembali memakai file asli lewat st.image
+USE_STATIC = os.environ.get("DETEKSI_STATIC_ASSETS", "1") != "0"
+
+# Aset yang ditampilkan per halaman (untuk laporan bobot halaman)
+PAGE_ASSETS = {
+    "Login": ["smslogo.png"],
+    "Informasi SMS Spam": ["spamsms.png", "notification.gif", "thinking.gif"],
+    "Panduan Aplikasi": ["LANGKAH1.png", "LANGKAH2.png", "LANGKAH3.png"],
+    "Aplikasi Deteksi SMS": [],
+    "Tentang Saya": ["PROFILE.jpg"],
+}
+
+# Lebar yang dipilih browser untuk kolom konten layout "wide" (dipakai laporan)
+REPORT_WIDTH = 960
+
+
+def _encode(image, animated: bool, frames=None, durations=None) -> bytes:
+    buffer = io.BytesIO()
+    if animated:
+        frames[0].save(
+            buffer, "WEBP", save_all=True, append_images=frames[1:], duration=durations,
+            loop=0, quality=ANIMATED_QUALITY, method=6,
+        )
+    else:
+        image.save(buffer, "WEBP", quality=QUALITY, method=6)
+    return buffer.getvalue()
+
+
+def _variants(path: str):
+    """Yield (lebar, tinggi, bytes WebP) untuk setiap ukuran varian ``path``."""
+    from PIL import Image, ImageSequence
+
+    with Image.open(path) as image:
+        animated = getattr(image, "n_frames", 1) > 1
+        widths = ANIMATED_WIDTHS if animated else WIDTHS
+        targets = sorted({min(w, image.width) for w in widths})
+        if animated:
+            frames = [frame.convert("RGBA") for frame in ImageSequence.Iterator(image)]
+            durations = [frame.info.get("duration", 100) for frame in ImageSequence.Iterator(image)]
+        else:
+            still = image.convert("RGBA" if "A" in image.getbands() or image.mode == "P" else "RGB")
+
+        for width in targets:
+            height = round(image.height * width / image.width)
+            if animated:
+                resized = [f.resize((width, height), Image.LANCZOS) for f in frames]
+                yield width, height, _encode(None, True, resized, durations)
+            else:
+                yield width, height, _encode(still.resize((width, height), Image.LANCZOS), False)
+
+
+def build(assets_dir: str = ASSETS_DIR, static_dir: str = STATIC_DIR) -> dict:
+    """Buat varian WebP ber-hash untuk semua file di ``assets_dir`` dan tulis manifest."""
+    os.makedirs(static_dir, exist_ok=True)
+    manifest = {}
+    for name in sorted(os.listdir(assets_dir)):
+        path = os.path.join(assets_dir, name)
+        if not os.path.isfile(path):
+            continue
+        stem = os.path.splitext(name)[0].lower()
+        variants = []
+        for width, height, data in _variants(path):
+            # Varian kecil yang tidak lebih ringan dari varian lebih lebar tidak ada gunanya
+            # (mis. PNG transparan kecil yang hasil resize-nya justru lebih berat)
+            variants = [v for v in variants if v["bytes"] < len(data)]
+            digest = hashlib.sha256(data).hexdigest()[:12]
+            filename = f"{stem}.{width}.{digest}.webp"
+            variants.append({"file": filename, "width": width, "height": height,
+                             "bytes": len(data), "hash": digest, "data": data})
+        for variant in variants:
+            with open(os.path.join(static_dir, variant["file"]), "wb") as f:
+                f.write(variant.pop("data"))
+        manifest[name] = {"original_bytes": os.path.getsize(path), "variants": variants}
+
+    # Hapus varian lama yang tidak lagi ada di manifest
+    current = {v["file"] for entry in manifest.values() for v in entry["variants"]}
+    for filename in os.listdir(static_dir):
+        if filename.endswith(".webp") and filename not in current:
+            os.remove(os.path.join(static_dir, filename))
+    with open(os.path.join(static_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    return manifest
+
+
+@lru_cache(maxsize=None)
+def load_manifest(static_dir: str = STATIC_DIR) -> dict:
+    try:
+        with open(os.path.join(static_dir, MANIFEST), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _url(variant: dict) -> str:
+    return f"{STATIC_URL}/{variant['file']}?v={variant['hash']}"
+
+
+def image_html(name: str, caption: str = None, manifest: dict = None) -> str:
+    """``<figure>`` responsif (srcset) untuk aset ``name``, atau ``None`` bila belum di-build."""
+    entry = (manifest if manifest is not None else load_manifest()).get(name)
+    if not entry:
+        return None
+    variants = entry["variants"]
+    largest = variants[-1]
+    srcset = ", ".join(f"{_url(v)} {v['width']}w" for v in variants)
+    alt = html.escape(caption or name)
+    figcaption = (
+        f'<figcaption style="text-align:center;font-size:14px;opacity:.6;">{html.escape(caption)}</figcaption>'
+        if caption else ""
+    )
+    return (
+        f'<figure style="margin:0 0 1rem 0;">'
+        f'<img src="{_url(largest)}" srcset="{srcset}" sizes="(max-width: 1200px) 100vw, 1200px" '
+        f'width="{largest["width"]}" height="{largest["height"]}" alt="{alt}" loading="lazy" decoding="async" '
+        f'style="width:100%;height:auto;border-radius:4px;">'
+        f"{figcaption}</figure>"
+    )
+
+
+def image(name: str, caption: str = None) -> None:
+    """Pengganti ``st.image(f"Assets/{name}", caption=..., use_container_width=True)``."""
+    import streamlit as st
+
+    markup = image_html(name, caption) if USE_STATIC else None
+    if markup is None:
+        st.image(os.path.join(ASSETS_DIR, name), caption=caption, use_container_width=True)
+    else:
+        st.markdown(markup, unsafe_allow_html=True)
+
+
+# Animasi hasil deteksi (pengganti iframe lottie.host): CSS murni, tanpa request jaringan
+# Satu baris tanpa baris kosong: HTML ini disisipkan di tengah blok HTML st.markdown
+_ANIMATION_CSS = (
+    "<style>"
+    "@keyframes sms-pop { 0% { transform: scale(.6); opacity: 0; } 60% { transform: scale(1.1); opacity: 1; }"
+    " 100% { transform: scale(1); } }"
+    "@keyframes sms-pulse { 0%, 100% { box-shadow: 0 0 0 0 var(--sms-ring); } 50% { box-shadow: 0 0 0 14px transparent; } }"
+    "@keyframes sms-shake { 0%, 100% { transform: rotate(0); } 20%, 60% { transform: rotate(-10deg); }"
+    " 40%, 80% { transform: rotate(10deg); } }"
+    ".sms-anim { display: flex; align-items: center; justify-content: center; border-radius: 50%; flex: none;"
+    " margin: 10px; animation: sms-pop .5s ease-out, sms-pulse 2s ease-in-out .5s infinite; }"
+    ".sms-anim span { animation: sms-shake 1.6s ease-in-out .5s infinite; }"
+    "</style>"
+)
+
+RESULT_ANIMATIONS = {
+    # jenis: (ikon, warna lingkaran, warna pulsa)
+    "kosong": ("⚠️", "#F1C40F33", "#F1C40F88"),
+    0: ("✅", "#17723333", "#17723388"),
+    1: ("🚨", "#D9000033", "#D9000088"),
+    2: ("🏷️", "#3773D633", "#3773D688"),
+}
+
+
+def result_animation(kind, size: int = 120) -> str:
+    """HTML animasi lokal untuk hasil deteksi ``kind`` (label 0/1/2 atau ``"kosong"``)."""
+    icon, background, ring = RESULT_ANIMATIONS[kind]
+    return (
+        f'{_ANIMATION_CSS}<div class="sms-anim" style="width:{size * 0.8:.0f}px;height:{size * 0.8:.0f}px;'
+        f'background:{background};--sms-ring:{ring};font-size:{size * 0.4:.0f}px;"><span>{icon}</span></div>'
+    )
+
+
+def report(assets_dir: str = ASSETS_DIR, width: int = REPORT_WIDTH) -> list:
+    """Bobot gambar per halaman: file asli vs varian WebP yang dipilih browser pada ``width``."""
+    manifest = load_manifest()
+    rows = []
+    for page, names in PAGE_ASSETS.items():
+        original = sum(os.path.getsize(os.path.join(assets_dir, name)) for name in names)
+        optimized = 0
+        for name in names:
+            variants = manifest[name]["variants"]
+            chosen = next((v for v in variants if v["width"] >= width), variants[-1])
+            optimized += chosen["bytes"]
+        rows.append((page, original, optimized))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build/laporan aset statis")
+    parser.add_argument("command", choices=["build", "report"])
+    parser.add_argument("--assets-dir", default=ASSETS_DIR)
+    parser.add_argument("--static-dir", default=STATIC_DIR)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        manifest = build(args.assets_dir, args.static_dir)
+        for name, entry in manifest.items():
+            sizes = ", ".join(f"{v['width']}px {v['bytes'] / 1024:.0f} KB" for v in entry["variants"])
+            print(f"{name}: {entry['original_bytes'] / 1024:.0f} KB -> {sizes}")
+    else:
+        print(f"{'halaman':<24}{'asli':>10}{'WebP':>10}{'hemat':>8}")
+        for page, original, optimized in report(args.assets_dir):
+            saved = 1 - optimized / original if original else 0.0
+            print(f"{page:<24}{original / 1024:>7.0f} KB{optimized / 1024:>7.0f} KB{saved:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
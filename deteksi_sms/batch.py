@@ -0,0 +1,183 @@
+"""Deteksi SMS dalam jumlah besar dari file CSV/XLSX.
+
+File dibaca per chunk, lalu setiap chunk di-preprocess, di-vectorize menjadi
+satu matriks sparse dan diprediksi dengan satu kali panggilan ``predict``.
+Memori yang dipakai mengikuti ukuran chunk, bukan ukuran file.
+"""
+import pandas as pd
+
+from deteksi_sms import metrics
+from deteksi_sms.cache import cached_scores
+
+# Label hasil prediksi model (sama dengan kolom label di dataset)
+LABELS = {0: "SMS NORMAL", 1: "SMS PENIPUAN", 2: "SMS PROMO"}
+
+# Nama kolom teks di Dataset/dataset_spam_sms.csv
+TEXT_COLUMN = "teks"
+
+CHUNK_SIZE = 2_000
+
+
+def _is_excel(filename: str) -> bool:
+    return filename.lower().endswith((".xlsx", ".xlsm"))
+
+
+def read_columns(file, filename: str) -> list:
+    """Baca nama kolom saja (tanpa membaca isi file)."""
+    if _is_excel(filename):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(file, read_only=True)
+        try:
+            header = next(wb.active.iter_rows(max_row=1, values_only=True), ())
+        finally:
+            wb.close()
+        columns = [str(c) for c in header if c is not None]
+    else:
+        columns = list(pd.read_csv(file, nrows=0).columns)
+    file.seek(0)
+    return columns
+
+
+def guess_text_column(columns) -> str:
+    """Pakai kolom ``teks`` kalau ada, kalau tidak kolom pertama."""
+    return TEXT_COLUMN if TEXT_COLUMN in columns else columns[0]
+
+
+def _iter_excel_chunks(file, text_column: str, chunksize: int):
+    from openpyxl import load_workbook
+
+    wb = load_workbook(file, read_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = [str(c) for c in next(rows, ())]
+        idx = header.index(text_column)
+        chunk = []
+        for row in rows:
+            value = row[idx] if idx < len(row) else None
+            chunk.append("" if value is None else str(value))
+            if len(chunk) == chunksize:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        wb.close()
+
+
+def iter_message_chunks(file, filename: str, text_column: str, chunksize: int = CHUNK_SIZE):
+    """Yield list teks SMS per chunk dari file CSV atau XLSX."""
+    if _is_excel(filename):
+        yield from _iter_excel_chunks(file, text_column, chunksize)
+        return
+
+    reader = pd.read_csv(
+        file,
+        usecols=[text_column],
+        dtype=str,
+        keep_default_na=False,
+        chunksize=chunksize,
+    )
+    for frame in reader:
+        yield frame[text_column].tolist()
+
+
+def _score_unique(texts, preprocessor, vectorizer, model, explainer=None):
+    with metrics.timer("preprocess"):
+        clean = preprocessor.process_many(text.strip() for text in texts)
+    with metrics.timer("transform"):
+        features = vectorizer.transform(clean)
+    with metrics.timer("predict"):
+        scores = model.decision_function(features)
+        labels = model.predict_from_scores(scores)
+    metrics.incr("messages_scored", len(texts))
+    if explainer is None:
+        return labels, scores
+    with metrics.timer("explain"):
+        explanations = explainer.explain(features, labels)
+    return labels, scores, explanations
+
+
+def score_texts(texts, preprocessor, vectorizer, model, cache=None, campaigns=None, checksum=None):
+    """Label dan skor keputusan (one-vs-one) untuk banyak pesan sekaligus.
+
+    ``model`` adalah scorer dari ``deteksi_sms.inference`` yang menerima CSR.
+    Pesan yang identik (umum pada kampanye spam) hanya diproses sekali, dan
+    bila ``cache`` (``ResultCache``) diberikan, pesan yang sudah pernah
+    dideteksi tidak diproses lagi. Bila ``campaigns`` (``CampaignIndex``)
+    diberikan, varian dari kampanye yang sudah dikenal langsung mendapat
+    label klasternya; hanya pesan baru yang lewat preprocess+vectorize+predict.
+    ``checksum`` adalah checksum artefak ``model``, supaya cache dan indeks
+    kampanye hanya memakai hasil dari model yang sama.
+    """
+    codes, uniques = pd.factorize(pd.Series(texts, dtype=object), use_na_sentinel=False)
+    uniques = [str(text) for text in uniques]
+
+    def score_fn(miss):
+        return _score_unique(miss, preprocessor, vectorizer, model)
+
+    if campaigns is not None:
+        score_full = score_fn
+
+        def score_fn(miss):
+            return cached_scores(miss, campaigns, score_full, checksum)
+
+    if cache is None:
+        labels, scores = score_fn(uniques)
+    else:
+        labels, scores = cached_scores(uniques, cache, score_fn, checksum)
+    return labels[codes], scores[codes]
+
+
+def explain_texts(texts, preprocessor, vectorizer, model, explainer, cache=None, checksum=None):
+    """Seperti ``score_texts``, ditambah kata pemicu per pesan (``Explainer.explain``).
+
+    Hasilnya (label, skor, array teks token pemicu dipisah koma). Penjelasan
+    butuh baris TF-IDF, jadi setiap pesan unik lewat jalur penuh; ``cache``
+    hanya diisi (untuk deteksi berikutnya), tidak dibaca.
+    """
+    codes, uniques = pd.factorize(pd.Series(texts, dtype=object), use_na_sentinel=False)
+    uniques = [str(text) for text in uniques]
+    labels, scores, explanations = _score_unique(uniques, preprocessor, vectorizer, model, explainer)
+    if cache is not None:
+        cache.put_many(uniques, labels, scores, checksum)
+    return labels[codes], scores[codes], explanations.trigger_words()[codes]
+
+
+def classify_texts(texts, preprocessor, vectorizer, model, cache=None, campaigns=None, checksum=None):
+    """Klasifikasi banyak pesan sekaligus, hasilnya array label."""
+    return score_texts(texts, preprocessor, vectorizer, model, cache, campaigns, checksum)[0]
+
+
+def classify_file(file, filename: str, text_column: str, preprocessor, vectorizer, model,
+                  chunksize: int = CHUNK_SIZE, progress=None, cache=None, campaigns=None,
+                  explainer=None, checksum=None) -> pd.DataFrame:
+    """Klasifikasi seluruh isi file per chunk.
+
+    ``progress`` (opsional) dipanggil dengan jumlah pesan yang sudah selesai.
+    Dengan ``explainer`` hasilnya punya kolom ``kata_pemicu`` (token yang
+    paling mendorong label, dipisah koma).
+    """
+    frames = []
+    done = 0
+    for texts in iter_message_chunks(file, filename, text_column, chunksize):
+        if explainer is None:
+            labels = classify_texts(texts, preprocessor, vectorizer, model, cache, campaigns, checksum)
+            frames.append(pd.DataFrame({TEXT_COLUMN: texts, "label": labels}))
+        else:
+            labels, _, words = explain_texts(texts, preprocessor, vectorizer, model, explainer, cache, checksum)
+            frames.append(pd.DataFrame({TEXT_COLUMN: texts, "label": labels, "kata_pemicu": words}))
+        done += len(texts)
+        if progress is not None:
+            progress(done)
+
+    if not frames:
+        empty = {TEXT_COLUMN: [], "label": [], "kategori": []}
+        if explainer is not None:
+            empty["kata_pemicu"] = []
+        return pd.DataFrame(empty)
+    result = pd.concat(frames, ignore_index=True)
+    result["kategori"] = pd.Categorical(result["label"].map(LABELS), categories=list(LABELS.values()))
+    if explainer is not None:
+        result = result[[TEXT_COLUMN, "label", "kategori", "kata_pemicu"]]
+    return result
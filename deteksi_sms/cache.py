@@ -0,0 +1,203 @@
+"""Cache hasil deteksi untuk teks SMS yang berulang.
+
+Kampanye spam mengirim teks yang sama ke banyak penerima, dan pengguna sering
+menempel pesan yang sama berkali-kali. Hasil deteksi disimpan dengan kunci
+hash dari teks yang sudah dinormalisasi (huruf kecil, spasi di awal/akhir
+dibuang; keduanya tidak mengubah hasil preprocessing):
+
+- tier memori: LRU + TTL dengan batas memori;
+- tier SQLite (opsional): bertahan setelah restart.
+
+Setiap entri terikat ke checksum artefak model yang menghitungnya: hasil
+hanya disimpan dan dibaca bila checksum model pemanggil sama dengan model
+cache saat ini, dan ``invalidate`` (dipanggil saat ``registry.HotModel``
+berganti versi) membuang seluruh isi cache.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+# Bisa diatur lewat environment variable tanpa mengubah kode
+MAX_MEMORY_MB = float(os.environ.get("DETEKSI_CACHE_MAX_MB", 64))
+TTL_SECONDS = float(os.environ.get("DETEKSI_CACHE_TTL", 24 * 3600))
+SQLITE_PATH = os.environ.get("DETEKSI_CACHE_DB") or None
+
+# Perkiraan memori satu entri (kunci digest, tuple skor, node OrderedDict)
+ENTRY_BYTES = 320
+
+
+def cache_key(text: str) -> bytes:
+    """Digest dari teks yang dinormalisasi murah (tanpa preprocessing penuh).
+
+    Spasi di tengah sengaja tidak dirapikan karena regex URL di casefolding
+    bergantung pada satu spasi persis.
+    """
+    normalized = text.lower().strip()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+
+class ResultCache:
+    """LRU + TTL di memori dengan tier SQLite opsional.
+
+    ``model`` adalah checksum artefak model yang sedang dipakai. Argumen
+    ``model`` di ``get``/``put_many`` adalah checksum model yang benar-benar
+    menghitung (atau akan menghitung) hasilnya; bila berbeda dengan model
+    cache (mis. batch lama selesai tepat setelah pergantian versi), hasilnya
+    tidak dibaca maupun disimpan.
+    """
+
+    def __init__(self, model: str, max_memory_mb: float = MAX_MEMORY_MB,
+                 ttl_seconds: float = TTL_SECONDS, sqlite_path: str = SQLITE_PATH):
+        self.max_entries = max(1, int(max_memory_mb * 1024 * 1024 // ENTRY_BYTES))
+        self.ttl = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._model = model
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        self._db = None
+        if sqlite_path:
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key BLOB PRIMARY KEY, model TEXT NOT NULL, label INTEGER NOT NULL,"
+                " scores TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            self._db.execute("DELETE FROM results WHERE model != ? OR expires < ?", (self._model, time.time()))
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    def invalidate(self, model: str) -> None:
+        """Pindah ke model ``model``: semua hasil model lain dibuang."""
+        with self._lock:
+            if model == self._model:
+                return
+            self._model = model
+            self._entries.clear()
+            self.invalidations += 1
+            if self._db is not None:
+                self._db.execute("DELETE FROM results WHERE model != ?", (model,))
+
+    def get(self, text: str, model: str = None):
+        """(label, scores) bila ada di cache untuk ``model`` (default model cache), kalau tidak ``None``."""
+        key = cache_key(text)
+        with self._lock:
+            if model is not None and model != self._model:
+                self.misses += 1
+                return None
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] >= time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1], entry[2]
+                del self._entries[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT label, scores, expires FROM results WHERE key = ? AND model = ? AND expires >= ?",
+                    (key, self._model, time.time()),
+                ).fetchone()
+                if row is not None:
+                    label, scores = row[0], tuple(json.loads(row[1]))
+                    self._store(key, label, scores, row[2])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return label, scores
+
+            self.misses += 1
+            return None
+
+    def _store(self, key, label, scores, expires):
+        self._entries[key] = (expires, label, scores)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def put_many(self, texts, labels, scores, model: str = None) -> None:
+        """Simpan hasil yang dihitung oleh ``model`` (default model cache)."""
+        expires = time.time() + self.ttl
+        rows = []
+        with self._lock:
+            if model is not None and model != self._model:
+                return
+            for text, label, row in zip(texts, labels, scores):
+                key = cache_key(text)
+                label, row = int(label), tuple(float(s) for s in row)
+                self._store(key, label, row, expires)
+                rows.append((key, self._model, label, json.dumps(row), expires))
+            if self._db is not None and rows:
+                self._db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)", rows)
+
+    def put(self, text: str, label, scores, model: str = None) -> None:
+        self.put_many([text], [label], [scores], model)
+
+    def lookup_many(self, texts, model: str = None):
+        """Pisahkan ``texts`` menjadi hasil yang sudah ada dan indeks yang belum."""
+        found, missing = {}, []
+        for i, text in enumerate(texts):
+            hit = self.get(text, model)
+            if hit is None:
+                missing.append(i)
+            else:
+                found[i] = hit
+        return found, missing
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "memory_mb_est": len(self._entries) * ENTRY_BYTES / (1024 * 1024),
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+def cached_scores(texts, cache, score_fn, model: str = None):
+    """``score_fn`` hanya untuk teks yang belum ada di cache; hasil digabung urut.
+
+    ``model`` adalah checksum model yang dipakai ``score_fn``, diteruskan ke
+    ``lookup_many``/``put_many`` (``ResultCache`` maupun ``CampaignIndex``).
+    """
+    scope = {} if model is None else {"model": model}
+    found, missing = cache.lookup_many(texts, **scope)
+    if not missing:
+        labels = np.array([found[i][0] for i in range(len(texts))])
+        return labels, np.array([found[i][1] for i in range(len(texts))], dtype=float)
+
+    miss_texts = [texts[i] for i in missing]
+    miss_labels, miss_scores = score_fn(miss_texts)
+    cache.put_many(miss_texts, miss_labels, miss_scores, **scope)
+
+    labels = np.empty(len(texts), dtype=np.asarray(miss_labels).dtype)
+    scores = np.empty((len(texts), np.asarray(miss_scores).shape[1]), dtype=float)
+    labels[missing], scores[missing] = miss_labels, miss_scores
+    for i, (label, row) in found.items():
+        labels[i], scores[i] = label, row
+    return labels, scores
@@ -0,0 +1,281 @@
+"""Indeks kampanye near-duplicate (MinHash + LSH) untuk pesan yang masuk.
+
+Kampanye spam (undian, "EXTRA KUOTA", ...) datang sebagai ribuan variasi
+kecil dari satu template: nominal, nomor telepon, link dan sapaan berbeda.
+Setiap pesan yang sudah diklasifikasi disimpan sebagai klaster dengan
+signature MinHash dari shingle 2-kata teks hasil ``casefolding`` (huruf
+kecil, URL/angka/tanda baca dibuang; bagian yang paling sering berubah
+antar varian). Pesan baru yang estimasi Jaccard-nya dengan sebuah klaster
+>= ``THRESHOLD`` langsung mendapat label dan skor klaster itu dan dihitung
+ke kampanye tersebut; hanya pesan baru yang lewat preprocessing penuh,
+vectorize dan predict.
+
+- LSH: ``NUM_PERM`` permutasi dibagi ``BANDS`` band; kandidat diambil dari
+  bucket band yang sama lalu diverifikasi dengan signature lengkap.
+- Batas memori: jumlah klaster dibatasi dari ``DETEKSI_CAMPAIGN_MAX_MB``;
+  klaster yang paling lama tidak terlihat dikeluarkan lebih dulu, dan
+  klaster yang tidak terlihat selama ``DETEKSI_CAMPAIGN_TTL`` detik dibuang.
+- Seperti ``ResultCache``, indeks terikat ke checksum model: klaster hanya
+  dibaca dan ditambahkan bila checksum model pemanggil sama dengan model
+  indeks, dan ``invalidate`` (dipanggil saat ``registry.HotModel`` berganti
+  versi) mengosongkan indeks.
+
+``CampaignIndex`` punya ``lookup_many``/``put_many`` yang sama dengan
+``ResultCache``, jadi bisa dipakai dengan ``cache.cached_scores``.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from deteksi_sms import metrics
+
+# Bisa diatur lewat environment variable tanpa mengubah kode
+ENABLED = os.environ.get("DETEKSI_CAMPAIGN", "1") != "0"
+MAX_MEMORY_MB = float(os.environ.get("DETEKSI_CAMPAIGN_MAX_MB", 64))
+TTL_SECONDS = float(os.environ.get("DETEKSI_CAMPAIGN_TTL", 7 * 24 * 3600))
+THRESHOLD = float(os.environ.get("DETEKSI_CAMPAIGN_THRESHOLD", 0.7))
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_WORDS = 2
+
+# Pesan dengan token lebih sedikit dari ini terlalu pendek untuk dicocokkan
+MIN_TOKENS = 4
+
+# Perkiraan memori satu klaster (baris signature, 16 entri bucket, objek, contoh teks)
+CLUSTER_BYTES = 2_600
+EXAMPLE_CHARS = 160
+
+# Permutasi: hashing multiply-shift ((a*x + b) mod 2^64) >> 32, tanpa modulo bilangan prima
+_rng = np.random.default_rng(20250101)
+_A = (_rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64) << np.uint64(1) | np.uint64(1))[:, None]
+_B = _rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64)[:, None]
+_BAND_MIX = _rng.integers(1, 1 << 63, ROWS, dtype=np.uint64)
+_SHINGLE_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def signatures(token_lists: list) -> np.ndarray:
+    """Signature MinHash (n, NUM_PERM) uint32 untuk beberapa pesan sekaligus.
+
+    Shingle 2-kata di-hash dari hash token (``hash`` bawaan Python; indeks
+    hanya hidup di memori satu proses, jadi tidak perlu stabil antar proses)
+    dan semua pesan diproses dalam satu operasi numpy. Setiap pesan harus
+    punya minimal ``SHINGLE_WORDS`` token.
+    """
+    if not token_lists:
+        return np.empty((0, NUM_PERM), dtype=np.uint32)
+    lengths = np.fromiter(map(len, token_lists), dtype=np.int64, count=len(token_lists))
+    hashed = np.array([hash(token) for tokens in token_lists for token in tokens], dtype=np.int64).view(np.uint64)
+    pairs = hashed[:-1] * _SHINGLE_MIX ^ hashed[1:]
+    # Buang pasangan yang melintasi batas pesan (token terakhir pesan + token pertama pesan berikutnya)
+    keep = np.ones(len(pairs), dtype=bool)
+    keep[np.cumsum(lengths)[:-1] - 1] = False
+    pairs = pairs[keep]
+    x = (pairs >> np.uint64(32)) ^ (pairs & np.uint64(0xFFFFFFFF))
+    starts = np.concatenate(([0], np.cumsum(lengths - 1)[:-1]))
+    permuted = (_A * x + _B) >> np.uint64(32)
+    return np.minimum.reduceat(permuted, starts, axis=1).T.astype(np.uint32)
+
+
+def band_keys(sigs: np.ndarray) -> np.ndarray:
+    """Kunci bucket (n, BANDS) uint64 dari signature."""
+    banded = sigs.astype(np.uint64).reshape(len(sigs), BANDS, ROWS)
+    return (banded * _BAND_MIX).sum(axis=2)
+
+
+class _Cluster:
+    __slots__ = ("id", "slot", "keys", "label", "scores", "count", "first_seen", "last_seen", "example")
+
+    def __init__(self, cluster_id, slot, keys, label, scores, example, now):
+        self.id = cluster_id
+        self.slot = slot
+        self.keys = keys
+        self.label = label
+        self.scores = scores
+        self.count = 1
+        self.first_seen = self.last_seen = now
+        self.example = example[:EXAMPLE_CHARS]
+
+
+class CampaignIndex:
+    """Indeks MinHash/LSH dengan batas memori, LRU + TTL, terikat checksum model.
+
+    ``normalize(text) -> str`` adalah preprocessing ringan sebelum shingling
+    (di aplikasi: ``TextPreprocessor.casefolding``). ``model`` adalah checksum
+    artefak model yang sedang dipakai; argumen ``model`` di
+    ``lookup_many``/``put_many`` adalah checksum model yang benar-benar
+    menghitung hasilnya, dan bila berbeda klaster tidak dibaca maupun ditambah
+    (sama seperti ``ResultCache``).
+    """
+
+    def __init__(self, normalize, model: str, max_memory_mb: float = MAX_MEMORY_MB,
+                 ttl_seconds: float = TTL_SECONDS, threshold: float = THRESHOLD,
+                 min_tokens: int = MIN_TOKENS):
+        if min_tokens <= SHINGLE_WORDS:
+            raise ValueError(f"min_tokens ({min_tokens}) harus lebih besar dari SHINGLE_WORDS ({SHINGLE_WORDS})")
+        self.normalize = normalize
+        self.min_tokens = min_tokens
+        self.max_clusters = max(1, int(max_memory_mb * 1024 * 1024 // CLUSTER_BYTES))
+        self.ttl = ttl_seconds
+        self.threshold = threshold
+        self._clusters = OrderedDict()
+        self._buckets = [{} for _ in range(BANDS)]
+        # Signature semua klaster dalam satu matriks supaya verifikasi kandidat satu operasi numpy
+        self._signatures = np.zeros((self.max_clusters, NUM_PERM), dtype=np.uint32)
+        self._free = list(range(self.max_clusters - 1, -1, -1))
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._model = model
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    def invalidate(self, model: str) -> None:
+        """Pindah ke model ``model``: semua klaster model lain dibuang."""
+        with self._lock:
+            if model == self._model:
+                return
+            self._model = model
+            self._reset()
+            self.invalidations += 1
+
+    def _reset(self):
+        self._clusters.clear()
+        for bucket in self._buckets:
+            bucket.clear()
+        self._free = list(range(self.max_clusters - 1, -1, -1))
+
+    def _prepare(self, texts):
+        """(indeks pesan yang cukup panjang, signature, kunci band)."""
+        token_lists, usable = [], []
+        for i, text in enumerate(texts):
+            tokens = self.normalize(text).split()
+            if len(tokens) >= self.min_tokens:
+                usable.append(i)
+                token_lists.append(tokens)
+        sigs = signatures(token_lists)
+        return usable, sigs, band_keys(sigs).tolist()
+
+    def _match_many(self, sigs, keys) -> dict:
+        """{baris: klaster} dengan estimasi Jaccard tertinggi >= ``threshold``."""
+        rows, ids = [], []
+        for row, row_keys in enumerate(keys):
+            candidates = set(map(dict.get, self._buckets, row_keys))
+            candidates.discard(None)
+            rows.extend([row] * len(candidates))
+            ids.extend(candidates)
+        if not rows:
+            return {}
+        slots = [self._clusters[cluster_id].slot for cluster_id in ids]
+        similarity = np.count_nonzero(self._signatures[slots] == sigs[rows], axis=1) / NUM_PERM
+        best, best_sim = {}, {}
+        for row, cluster_id, sim in zip(rows, ids, similarity.tolist()):
+            if sim >= self.threshold and sim > best_sim.get(row, 0.0):
+                best[row], best_sim[row] = cluster_id, sim
+        return {row: self._clusters[cluster_id] for row, cluster_id in best.items()}
+
+    def lookup_many(self, texts, model: str = None):
+        """Pisahkan ``texts`` menjadi hasil dari klaster yang cocok dan indeks yang belum.
+
+        Untuk ``model`` selain model indeks tidak ada yang cocok.
+        """
+        with metrics.timer("campaign_lookup"):
+            usable, sigs, keys = self._prepare(texts)
+            found = {}
+            now = time.time()
+            with self._lock:
+                matches = {} if model is not None and model != self._model else self._match_many(sigs, keys)
+                for row, cluster in matches.items():
+                    cluster.count += 1
+                    cluster.last_seen = now
+                    self._clusters.move_to_end(cluster.id)
+                    found[usable[row]] = (cluster.label, cluster.scores)
+                self.hits += len(found)
+                self.misses += len(usable) - len(found)
+                self.skipped += len(texts) - len(usable)
+        metrics.incr("campaign_hits", len(found))
+        missing = [i for i in range(len(texts)) if i not in found]
+        return found, missing
+
+    def put_many(self, texts, labels, scores, model: str = None) -> None:
+        """Jadikan pesan yang diklasifikasi penuh oleh ``model`` (default model indeks) klaster baru.
+
+        Pesan yang sudah cocok dengan klaster yang ada hanya menambah hitungannya.
+        """
+        usable, sigs, keys = self._prepare(texts)
+        now = time.time()
+        with self._lock:
+            if model is not None and model != self._model:
+                return
+            for row, i in enumerate(usable):
+                match = self._match_many(sigs[row:row + 1], keys[row:row + 1])
+                if match:
+                    # Varian lain dari kampanye yang sama sudah masuk di batch ini
+                    match[0].count += 1
+                    match[0].last_seen = now
+                    continue
+                if not self._free:
+                    self._evict(now, room=1)
+                slot = self._free.pop()
+                self._signatures[slot] = sigs[row]
+                cluster = _Cluster(self._next_id, slot, keys[row], int(labels[i]),
+                                   tuple(float(s) for s in scores[i]), texts[i], now)
+                self._next_id += 1
+                self._clusters[cluster.id] = cluster
+                for bucket, key in zip(self._buckets, cluster.keys):
+                    bucket[key] = cluster.id
+            self._evict(now)
+
+    def _evict(self, now, room: int = 0):
+        """Buang klaster kedaluwarsa dan klaster tertua di atas batas (dipanggil dengan lock)."""
+        while self._clusters:
+            cluster = next(iter(self._clusters.values()))
+            if len(self._clusters) + room <= self.max_clusters and cluster.last_seen >= now - self.ttl:
+                break
+            self._clusters.popitem(last=False)
+            for bucket, key in zip(self._buckets, cluster.keys):
+                if bucket.get(key) == cluster.id:
+                    del bucket[key]
+            self._free.append(cluster.slot)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def campaigns(self, min_count: int = 2, limit: int = 100) -> list:
+        """Klaster dengan anggota >= ``min_count``, urut jumlah pesan terbanyak."""
+        with self._lock:
+            rows = [
+                {"id": c.id, "label": c.label, "count": c.count, "first_seen": c.first_seen,
+                 "last_seen": c.last_seen, "example": c.example}
+                for c in self._clusters.values() if c.count >= min_count
+            ]
+        rows.sort(key=lambda row: -row["count"])
+        return rows[:limit]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "clusters": len(self._clusters),
+                "max_clusters": self.max_clusters,
+                "messages": sum(c.count for c in self._clusters.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "skipped_short": self.skipped,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "memory_mb_est": len(self._clusters) * CLUSTER_BYTES / (1024 * 1024),
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,70 @@
+"""Koreksi label dari pengguna (append-only).
+
+Setiap koreksi ditulis sebagai satu baris JSON di ``Model/feedback.jsonl``
+dan tidak pernah diubah atau dihapus; ``deteksi_sms.online`` membacanya
+berdasarkan posisi baris untuk pembaruan model bertahap.
+"""
+import json
+import os
+import threading
+import time
+
+FEEDBACK_FILE = "Model/feedback.jsonl"
+
+
+class FeedbackStore:
+    """File JSONL append-only; aman dipakai dari banyak thread dalam satu proses.
+
+    Antar proses, setiap koreksi ditulis dengan satu ``write`` pada file
+    yang dibuka ``O_APPEND`` sehingga baris tidak saling menimpa.
+    """
+
+    def __init__(self, path: str = FEEDBACK_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def append(self, text: str, predicted: int, label: int, user: str = None, model: str = None) -> dict:
+        """Catat bahwa ``text`` diprediksi ``predicted`` padahal label benarnya ``label``."""
+        record = {
+            "ts": time.time(),
+            "user": user,
+            "text": text,
+            "predicted": int(predicted),
+            "label": int(label),
+            "model": model,
+        }
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        return record
+
+    def records(self, start: int = 0, stop: int = None) -> list:
+        """Koreksi di baris ``start`` sampai sebelum ``stop`` (baris rusak dilewati)."""
+        result = []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for i, line in enumerate(f):
+                    if stop is not None and i >= stop:
+                        break
+                    if i < start:
+                        continue
+                    try:
+                        result.append(json.loads(line))
+                    except ValueError:
+                        result.append(None)
+        except FileNotFoundError:
+            return []
+        return [r for r in result if r is not None]
+
+    def count(self) -> int:
+        try:
+            with open(self.path, "rb") as f:
+                return sum(1 for _ in f)
+        except FileNotFoundError:
+            return 0
@@ -0,0 +1,24 @@
+"""Halaman menu aplikasi_sms.py; setiap modul punya ``render()``.
+
+Modul halaman di-import saat halaman itu dipilih, sehingga dependensi
+berat (sklearn, pandas, AgGrid, model) hanya dimuat oleh halaman deteksi.
+"""
+import importlib
+
+# Urutan sama dengan option_menu di sidebar: nama menu -> modul halaman
+PAGES = {
+    "Informasi SMS Spam": "deteksi_sms.halaman.informasi",
+    "Panduan Aplikasi": "deteksi_sms.halaman.panduan",
+    "Aplikasi Deteksi SMS": "deteksi_sms.halaman.deteksi",
+    "Tentang Saya": "deteksi_sms.halaman.tentang",
+}
+
+# Halaman tambahan yang hanya muncul di menu akun admin
+ADMIN_PAGES = {
+    "Kinerja Aplikasi": "deteksi_sms.halaman.kinerja",
+}
+
+
+def load_page(name: str):
+    """Import modul halaman ``name`` (sekali per proses, berikutnya dari sys.modules)."""
+    return importlib.import_module(PAGES.get(name) or ADMIN_PAGES[name])
@@ -0,0 +1,387 @@
+"""Halaman "Aplikasi Deteksi SMS".
+
+Satu-satunya halaman yang butuh model, sklearn dan pandas; modul ini baru
+di-import (dan model baru dimuat) saat halaman ini dibuka.
+"""
+import pandas as pd
+import streamlit as st
+from st_aggrid import GridOptionsBuilder, AgGrid, GridUpdateMode
+
+from deteksi_sms import assets, campaign, metrics, online, registry
+from deteksi_sms.batch import LABELS, classify_file, guess_text_column, read_columns, score_texts
+from deteksi_sms.cache import ResultCache
+from deteksi_sms.feedback import FeedbackStore
+from deteksi_sms.preprocessing import TextPreprocessor
+from deteksi_sms.scheduler import BatchScheduler
+
+
+# Load saved model and vectorizer
+@st.cache_resource
+def load_model():
+    # Format ringkas (bobot, idf_ dan tabel vocabulary .npy, semua mmap) bila ada, kalau tidak pickle lama.
+    # Vectorizer sudah membawa IDF hasil training, jadi tidak perlu fit ulang di sini.
+    # Model berupa scorer yang langsung menerima matriks sparse (tanpa toarray).
+    # HotModel mengikuti versi aktif registry (Model/registry/ACTIVE): versi baru dimuat dan
+    # di-warm-up di thread latar belakang lalu dipasang sekaligus untuk semua sesi, tanpa restart.
+    return registry.HotModel("Model")
+
+def load_model_and_vectorizer():
+    return load_model().get()
+
+# Load preprocessing (regex, key_norm, stopword, stemmer) sekali per proses
+@st.cache_resource
+def load_preprocessor():
+    return TextPreprocessor.from_files()
+
+# Antrian inferensi bersama untuk semua sesi: request deteksi yang datang
+# bersamaan digabung menjadi satu kali vectorize+predict
+@st.cache_resource
+def load_scheduler():
+    hot = load_model()
+    pre = load_preprocessor()
+
+    def score_fn(texts):
+        # Model diambil per batch supaya versi baru langsung terpakai; snapshot ikut
+        # dikembalikan supaya hasil di-cache dengan checksum model yang menghitungnya
+        loaded = hot.snapshot()
+        labels, scores = score_texts(texts, pre, loaded.vectorizer, loaded.scorer,
+                                     campaigns=load_campaign_index(), checksum=loaded.checksum)
+        return labels, scores, loaded
+
+    return BatchScheduler(score_fn)
+
+# Cache hasil deteksi untuk teks yang berulang, dikosongkan saat HotModel memasang versi baru
+@st.cache_resource
+def load_result_cache():
+    hot = load_model()
+    cache = ResultCache(hot.checksum())
+    hot.subscribe(lambda loaded: cache.invalidate(loaded.checksum))
+    return cache
+
+# Indeks kampanye near-duplicate (MinHash/LSH) bersama untuk semua sesi; None bila DETEKSI_CAMPAIGN=0.
+# Seperti cache hasil, dikosongkan saat HotModel memasang versi baru
+@st.cache_resource
+def load_campaign_index():
+    if not campaign.ENABLED:
+        return None
+    hot = load_model()
+    index = campaign.CampaignIndex(load_preprocessor().casefolding, hot.checksum())
+    hot.subscribe(lambda loaded: index.invalidate(loaded.checksum))
+    return index
+
+def clear_detection_caches():
+    load_result_cache().clear()
+    if load_campaign_index() is not None:
+        load_campaign_index().clear()
+
+# Koreksi label dari pengguna (append-only, dipakai pembelajaran online)
+@st.cache_resource
+def load_feedback_store():
+    return FeedbackStore()
+
+def detect_sms(text):
+    """Deteksi satu pesan: cek cache dulu, kalau belum ada lewat antrian inferensi."""
+    with metrics.timer("detect"):
+        result_cache = load_result_cache()
+        hit = result_cache.get(text)
+        if hit is not None:
+            metrics.incr("detect_cache_hits")
+            return hit[0]
+        labels, scores, loaded = load_scheduler().classify([text])
+        result_cache.put(text, labels[0], scores[0], loaded.checksum)
+        return labels[0]
+
+def explain_sms(text, label):
+    """(token, bobot) yang paling mendorong ``label`` untuk satu pesan."""
+    with metrics.timer("explain_sms"):
+        loaded = load_model().snapshot()
+        features = loaded.vectorizer.transform([load_preprocessor()(text)])
+        return loaded.explainer.explain(features, [label])[0]
+
+def explanation_ui(text, label):
+    """Token pemicu di bawah kartu hasil: kata dasar + kontribusinya ke skor kelas."""
+    explanation = explain_sms(text, label)
+    if not explanation:
+        st.caption("Tidak ada kata yang dikenali model sebagai pemicu hasil ini.")
+        return
+    chips = " · ".join(f"`{term}` +{weight:.2f}" for term, weight in explanation)
+    st.markdown(f"**Kata pemicu:** {chips}")
+    st.caption("Kata dasar hasil preprocessing; angka adalah kontribusi kata ke skor kategori hasil deteksi.")
+
+# Jumlah baris maksimal yang dikirim ke AgGrid (file hasil tetap lengkap)
+GRID_MAX_ROWS = 5_000
+
+def bulk_detection_ui():
+    """Mode unggah file: klasifikasi seluruh isi CSV/XLSX per chunk."""
+    uploaded = st.file_uploader("Unggah file SMS (CSV/XLSX)", type=["csv", "xlsx"])
+    if uploaded is None:
+        return
+
+    columns = read_columns(uploaded, uploaded.name)
+    if not columns:
+        st.warning("File tidak memiliki kolom.")
+        return
+    text_column = st.selectbox("Kolom teks SMS", columns, index=columns.index(guess_text_column(columns)))
+    result_key = (uploaded.file_id, text_column)
+
+    explain = st.checkbox("Sertakan kata pemicu", value=True, key="batch_explain",
+                          help="Kolom kata_pemicu untuk filter; setiap pesan unik lewat model (cache tidak dibaca)")
+    if st.button("Deteksi File"):
+        # Satu snapshot supaya model, vectorizer dan penjelasan berasal dari versi yang sama
+        loaded = load_model().snapshot()
+        status = st.empty()
+        with metrics.timer("classify_file"):
+            result = classify_file(
+                uploaded, uploaded.name, text_column, load_preprocessor(), loaded.vectorizer, loaded.scorer,
+                progress=lambda n: status.caption(f"{n:,} pesan diproses…"),
+                cache=load_result_cache(), campaigns=load_campaign_index(),
+                explainer=loaded.explainer if explain else None, checksum=loaded.checksum,
+            )
+        status.empty()
+        triggers = None
+        if "kata_pemicu" in result:
+            triggers = result["kata_pemicu"].str.split(", ").explode().value_counts().drop("", errors="ignore")
+        st.session_state.batch_result = (result_key, result, triggers)
+
+    # Hasil disimpan di session_state supaya filter/unduh tidak memproses ulang file
+    saved = st.session_state.get("batch_result")
+    if saved is None or saved[0] != result_key:
+        return
+    result, triggers = saved[1], saved[2]
+
+    counts = result["kategori"].value_counts()
+    for col, label in zip(st.columns(len(LABELS)), LABELS.values()):
+        col.metric(label, f"{int(counts.get(label, 0)):,}")
+
+    selected = st.multiselect("Filter kategori", list(LABELS.values()), default=list(LABELS.values()))
+    view = result[result["kategori"].isin(selected)]
+    if triggers is not None:
+        # Pilihan diurutkan dari kata pemicu yang paling sering muncul
+        words = st.multiselect("Filter kata pemicu", triggers.index.tolist(), key="batch_trigger_filter",
+                               format_func=lambda word: f"{word} ({triggers[word]:,})")
+        if words:
+            view = view[view["kata_pemicu"].str.split(", ").map(set(words).intersection).astype(bool)]
+    if len(view) > GRID_MAX_ROWS:
+        st.caption(f"Menampilkan {GRID_MAX_ROWS:,} dari {len(view):,} baris, unduh CSV untuk hasil lengkap.")
+
+    gb = GridOptionsBuilder.from_dataframe(view)
+    gb.configure_default_column(filter=True, sortable=True, resizable=True)
+    gb.configure_column("teks", flex=1, wrapText=True, autoHeight=True)
+    gb.configure_pagination(paginationAutoPageSize=False, paginationPageSize=50)
+    AgGrid(
+        view.head(GRID_MAX_ROWS),
+        gridOptions=gb.build(),
+        update_mode=GridUpdateMode.NO_UPDATE,
+        height=500,
+        key="batch_grid",
+    )
+
+    st.download_button(
+        "Unduh Hasil (CSV)",
+        data=view.to_csv(index=False).encode("utf-8"),
+        file_name="hasil_deteksi_sms.csv",
+        mime="text/csv",
+    )
+
+def campaign_ui():
+    """Mode kampanye: klaster near-duplicate dari pesan yang sudah dideteksi, terbanyak dulu."""
+    index = load_campaign_index()
+    if index is None:
+        st.info("Indeks kampanye tidak aktif (DETEKSI_CAMPAIGN=0).")
+        return
+    stats = index.stats()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Klaster", f"{stats['clusters']:,}")
+    col2.metric("Pesan dikenali", f"{stats['hits']:,}")
+    col3.metric("Hit rate", f"{stats['hit_rate']:.0%}")
+
+    min_count = st.number_input("Minimal jumlah pesan", min_value=2, value=2, step=1, key="campaign_min")
+    selected = st.multiselect("Filter kategori", list(LABELS.values()), default=list(LABELS.values()),
+                              key="campaign_filter")
+    rows = index.campaigns(int(min_count), limit=500)
+    if not rows:
+        st.caption("Belum ada kampanye: deteksi pesan (satu per satu atau unggah file) untuk mengisi indeks.")
+        return
+    table = pd.DataFrame(rows)
+    table["kategori"] = table["label"].map(LABELS)
+    for column in ("first_seen", "last_seen"):
+        table[column] = pd.to_datetime(table[column], unit="s").dt.strftime("%Y-%m-%d %H:%M")
+    table = table[table["kategori"].isin(selected)]
+    table = table.rename(columns={"count": "jumlah pesan", "first_seen": "pertama", "last_seen": "terakhir",
+                                  "example": "contoh"})
+    st.dataframe(table[["kategori", "jumlah pesan", "pertama", "terakhir", "contoh"]],
+                 use_container_width=True, hide_index=True)
+
+def feedback_ui(text, predicted):
+    """Kontrol koreksi di bawah hasil deteksi; koreksi dicatat ke store append-only."""
+    predicted = int(predicted)
+    with st.expander("Hasil deteksi salah? Kirim koreksi"):
+        options = list(LABELS)
+        label = st.radio("Label yang benar", options, index=options.index(predicted),
+                         format_func=LABELS.get, horizontal=True, key="feedback_label")
+        if st.button("Kirim Koreksi", key="feedback_send"):
+            sent = st.session_state.setdefault("feedback_sent", set())
+            if label == predicted:
+                st.info("Label sama dengan hasil deteksi, tidak ada yang dikoreksi.")
+            elif (text, label) in sent:
+                st.info("Koreksi ini sudah dikirim.")
+            else:
+                hot = load_model()
+                load_feedback_store().append(text, predicted, label, st.session_state.get("user"), hot.version)
+                sent.add((text, label))
+                st.success("Terima kasih, koreksi tersimpan dan dipakai pada pembaruan model berikutnya.")
+
+def online_learning_panel():
+    """Pembaruan model dari koreksi + rollback (bagian dari Panel Admin)."""
+    hot = load_model()
+    models = registry.ModelRegistry("Model")
+    st.caption(f"Pembelajaran online: versi aktif **{models.active()}**, "
+               f"{load_feedback_store().count()} koreksi tercatat")
+    col1, col2 = st.columns(2)
+    if col1.button("Perbarui", key="online_update", help="Latih dari koreksi baru; dipromosikan bila akurasi uji tidak turun"):
+        report = online.update_from_feedback(load_preprocessor(), "Model")
+        hot.refresh()
+        # Proses lain mengosongkan cache-nya sendiri saat checksum artefak berubah
+        clear_detection_caches()
+        if report["status"] == "kosong":
+            st.info("Belum ada koreksi baru.")
+        else:
+            st.write(f"{report['version']} {report['status']}: akurasi uji "
+                     f"{report['holdout_accuracy']:.3f} (sebelumnya {report['parent_holdout_accuracy']:.3f})")
+    if col2.button("Rollback", key="online_rollback", disabled=models.active() == registry.BASE_VERSION):
+        st.write(f"Versi aktif sekarang: {models.rollback()}")
+        hot.refresh()
+        clear_detection_caches()
+    history = models.history()
+    if history:
+        rows = [{"version": m["version"], "asal": m["source"], "parent": m["parent"],
+                 "holdout_accuracy": m["metrics"].get("holdout_accuracy"), "checksum": m["checksum"][:12]}
+                for m in history]
+        st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+
+def admin_panel():
+    """Metrik antrian inferensi dan cache (isi expander "Panel Admin" di sidebar)."""
+    st.caption("Antrian inferensi (micro-batching)")
+    st.dataframe(pd.Series(load_scheduler().metrics(), name="nilai"), use_container_width=True)
+    st.caption("Cache hasil deteksi")
+    st.dataframe(pd.Series(load_result_cache().stats(), name="nilai"), use_container_width=True)
+    if load_campaign_index() is not None:
+        st.caption("Indeks kampanye")
+        st.dataframe(pd.Series(load_campaign_index().stats(), name="nilai"), use_container_width=True)
+    online_learning_panel()
+
+
+def render():
+    st.title('Sistem Deteksi SMS Spam')
+
+    # Model dimuat saat halaman dibuka (sekali per proses), bukan saat tombol pertama ditekan
+    load_scheduler()
+
+    st.markdown(
+        """
+        <style>
+        textarea {
+            font-size: 20px !important;
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    mode = st.radio("Mode Deteksi", ["Satu Pesan", "Unggah File (CSV/XLSX)", "Kampanye"], horizontal=True)
+
+    if mode == "Unggah File (CSV/XLSX)":
+        bulk_detection_ui()
+    elif mode == "Kampanye":
+        campaign_ui()
+    else:
+        sms_text = st.text_area("Masukkan Teks SMS Dibawah Ini")
+        checked = st.button('Cek Deteksi')
+        if checked:
+            st.session_state.checked_text = sms_text.strip()
+        # Hasil tetap tampil saat rerun (mis. setelah kirim koreksi) selama teksnya tidak diubah
+        if checked or (sms_text.strip() != "" and st.session_state.get("checked_text") == sms_text.strip()):
+            clean_teks = sms_text.strip()
+
+            if clean_teks == "":
+                spam_detection = "Mohon Masukkan Pesan Teks SMS"
+                st.markdown(
+                    f"""
+                    <div style="border: 2px; border-radius: 15px; padding: 2px; display: flex; align-items: center; background-color: #1F211D;">
+                        <div style="color: #F1C40F; font-size: 25px; margin-left: 10px;"><strong>{spam_detection}</strong></div>
+                        {assets.result_animation("kosong", size=100)}
+                    </div>
+                    """,
+                    unsafe_allow_html=True
+                )
+            else:
+                predict_spam = detect_sms(clean_teks)
+
+                if predict_spam == 0:
+                    spam_detection = "SMS NORMAL"
+                    st.markdown(
+                        f"""
+                        <div style="border: 2px solid #177233; border-radius: 15px; padding: 10px; display: flex; align-items: center; background-color: #D6F9B7;">
+                            <div style="flex: 1;">
+                                <div style="color: #177233; font-size: 25px; margin-left: 10px;">
+                                    <strong>{spam_detection}</strong>
+                                </div>
+                                <div style="background-color: white; border-radius: 5px; padding: 5px; margin-top: 10px;">
+                                    <ul style="color: #177233; font-size: 18px; list-style-type: none; padding: 0; margin: 0;">
+                                        <li>Pesan SMS ini bukan termasuk pesan spam promo/penipuan</li>
+                                        <li>melainkan pesan normal pada umumnya dan aman untuk ditanggapi</li>
+                                    </ul>
+                                </div>
+                            </div>
+                            {assets.result_animation(0)}
+                        </div>
+                        """,
+                        unsafe_allow_html=True
+                    )
+
+                elif predict_spam == 1:
+                    spam_detection = "SMS PENIPUAN"
+                    st.markdown(
+                        f"""
+                        <div style="border: 2px solid #D90000; border-radius: 15px; padding: 10px; display: flex; align-items: center; background-color: #FF9590;">
+                            <div style="flex: 1;">
+                                <div style="color: #D90000; font-size: 25px; margin-left: 10px;">
+                                    <strong>{spam_detection}</strong>
+                                </div>
+                                <div style="background-color: white; border-radius: 5px; padding: 5px; margin-top: 10px;">
+                                    <ul style="color: #F00B00; font-size: 18px; list-style-type: none; padding: 0; margin: 0;">
+                                        <li>Pesan SMS ini terindikasi pesan spam penipuan</li>
+                                        <li>dikarenakan terdapat informasi yang mencurigakan</li>
+                                    </ul>
+                                </div>
+                            </div>
+                            {assets.result_animation(1)}
+                        </div>
+                        """,
+                        unsafe_allow_html=True
+                    )
+
+                elif predict_spam == 2:
+                    spam_detection = "SMS PROMO"
+                    st.markdown(
+                        f"""
+                        <div style="border: 2px solid #3773D6; border-radius: 15px; padding: 10px; display: flex; align-items: center; background-color: #C3E6FF;">
+                            <div style="flex: 1;">
+                                <div style="color: #3773D6; font-size: 25px; margin-left: 10px;">
+                                    <strong>{spam_detection}</strong>
+                                </div>
+                                <div style="background-color: white; border-radius: 5px; padding: 5px; margin-top: 10px;">
+                                    <ul style="color: #3773D6; font-size: 18px; list-style-type: none; padding: 0; margin: 0;">
+                                        <li>Pesan SMS ini adalah spam promo yang menawarkan penawaran khusus</li>
+                                        <li>untuk membeli/menggunakan promo yang diberikan</li>
+                                    </ul>
+                                </div>
+                            </div>
+                            {assets.result_animation(2)}
+                        </div>
+                        """,
+                        unsafe_allow_html=True
+                    )
+
+                explanation_ui(clean_teks, predict_spam)
+                feedback_ui(clean_teks, predict_spam)
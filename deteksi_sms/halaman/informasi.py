@@ -0,0 +1,76 @@
+"""Halaman "Informasi SMS Spam" (artikel statis, tanpa model)."""
+import streamlit as st
+
+from deteksi_sms import assets
+
+
+def render():
+    #ARTIKEL KE-1
+    st.title('Apasih SMS Spam itu?')
+    st.markdown(
+        """
+        <div style="text-align: justify;">
+            <p>Kalian pernah penasaran sebenarnya SMS spam itu apa? Apakah berbahaya? Weets, tenang dulu ya guys karena di sini saya akan menjelaskan lebih lanjut tentang isu ini, let's gooo.</p>
+            <p>Secara umum SMS spam adalah pesan teks yang tidak diinginkan yang dikirim secara besar-besaran kepada banyak penerima.</p>
+            <p>Pesan ini sering kali mengandung tawaran promosi, penipuan, atau informasi yang tidak berkaitan. SMS spam dapat mengacaukan dan menguras sumber daya pada perangkat penerima.</p>
+            <p>Oleh karena itu, dengan teknologi deteksi SMS spam, kita bisa menyaring dan mengategorikan pesan-pesan ini untuk mengurangi efek buruknya.</p> 
+        </div>
+        <br><br><br>
+        """,
+        unsafe_allow_html=True
+    )
+    assets.image("spamsms.png", caption="Gambar SMS spam")
+    st.write("<br><br>", unsafe_allow_html=True)
+
+    #ARTIKEL KE-2
+    st.title('Jenis Dan Tujuan SMS Spam')
+    assets.image("notification.gif", caption="Animasi notifikasi masuk")
+    st.write("<br>", unsafe_allow_html=True)
+    st.markdown(
+        """
+        <div style="text-align: justify;">
+            Berdasarkan penjelasan tentang arti spam yang telah disampaikan, berikut adalah beberapa tujuan spam yang perlu kita ketahui:
+        <br>
+        <h3>1. Skema Penipuan</h3>
+        <p>Beberapa SMS Spam dibuat untuk menyesatkan penerima. Contohnya, sebuah pesan bisa menginformasikan bahwa penerima telah berhasil memenangkan hadiah atau lotere, meminta mereka membayar biaya untuk mengambil hadiah itu. Hal ini dapat mengakibatkan kerugian finansial bagi penerima.</p>
+
+        <h3>2. Phishing</h3>
+        <p>SMS phishing berusaha mendapatkan informasi sensitif, seperti nomor kartu kredit atau kata sandi. Pesan ini mungkin mengarahkan penerima ke situs web palsu yang terlihat mirip dengan situs resmi, di mana mereka diminta untuk memasukkan informasi pribadi.</p>
+
+        <h3>3. Jenis Iklan Yang Menggangu</h3>
+        <p>Banyak bisnis menggunakan SMS spam untuk mengirimkan iklan tanpa izin penerima. Ini sering kali dianggap sebagai gangguan dan dapat merusak reputasi pengirim.</p>
+
+        <h3>4. Penawaran Jasa Keuangan</h3>
+        <p>Beberapa pesan menawarkan layanan keuangan, seperti pinjaman atau investasi. Banyak dari layanan ini mungkin tidak sah atau memiliki syarat yang merugikan.</p>
+        </div>
+        
+        """,
+        unsafe_allow_html=True
+    )
+    st.write("<br><br>", unsafe_allow_html=True)
+
+    #ARTIKEL KE-3
+    st.title('Dampak Buruk SMS Spam')
+    assets.image("thinking.gif", caption="Animasi memikirkan jenis pesan")
+    st.markdown(
+        """
+        <div style="text-align: justify;">
+            <p>Seperti yang kita ketahui bahwa pesan SMS yang kita terima memiliki berbagai jenis pesan-pesan yang masuk.</p>
+            <p>Namun, tahukah kalian bahwa di antara berbagai pesan yang masuk, tidak sedikit yang tergolong sebagai pesan spam.</p>
+            <p>Meskipun sekilas pesan spam tampak seperti teks biasa, pada kenyataannya pesan tersebut dapat menimbulkan dampak yang merugikan jika tidak disikapi dengan kewaspadaan.</p>
+        <br><br>
+        Selain itu, banyaknya cara penipuan yang hanya dikirim lewat SMS, jadi kami hanya ingin membagikan beberapa dampak negatif SMS Spam bagi individu, antara lain sebagai berikut:
+        <br>
+        <ol>
+            <li>Spam kerap dimanfaatkan untuk melakukan phishing, yaitu upaya penipuan yang bertujuan memperoleh informasi pribadi seperti nomor kartu kredit, kata sandi, dan data sensitif lainnya.</li>
+            <li>Beberapa pesan spam mengandung tautan atau lampiran berbahaya yang dapat menyebarkan malware dan menginfeksi perangkat penerima untuk mencuri data penting.</li>
+            <li>Korban yang tergiur oleh spam yang menawarkan hadiah, lotere, atau investasi palsu berisiko mengalami kerugian finansial yang cukup besar.</li>
+            <li>Penggunaan identitas palsu dalam pesan spam dapat menimbulkan kesalahpahaman dan merusak hubungan sosial antara pengirim dan penerima.</li>
+            <li>Spam juga dapat menghabiskan sumber daya perangkat secara tidak efisien, seperti ruang penyimpanan, baterai, dan kinerja sistem secara keseluruhan.</li>
+        </ol>
+
+        </div>
+        
+        """,
+        unsafe_allow_html=True
+    )
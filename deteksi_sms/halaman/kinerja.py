@@ -0,0 +1,106 @@
+"""Halaman "Kinerja Aplikasi" (khusus admin).
+
+Persentil latensi per tahap dari ``deteksi_sms.metrics``, memori proses,
+dan snapshot profiler sesuai permintaan: sampling semua thread proses
+(termasuk sesi pengguna lain) atau cProfile antrian inferensi.
+"""
+import sys
+
+import pandas as pd
+import streamlit as st
+
+from deteksi_sms import metrics, profiler
+from deteksi_sms.halaman import PAGES, load_page
+
+DETEKSI_PAGE = "Aplikasi Deteksi SMS"
+
+
+def _stage_table(stages: dict) -> pd.DataFrame:
+    table = pd.DataFrame.from_dict(stages, orient="index")
+    for column in ("mean", "p50", "p95", "p99", "max"):
+        table[column] = table[column] * 1000
+    table.index.name = "tahap"
+    return table[["count", "mean", "p50", "p95", "p99", "max"]]
+
+
+def latency_section():
+    snapshot = metrics.snapshot()
+    memory = snapshot["memory"]
+    col1, col2, col3 = st.columns(3)
+    col1.metric("RSS proses", f"{memory['rss_bytes'] / 2**20:,.0f} MB")
+    col2.metric("RSS puncak", f"{memory['max_rss_bytes'] / 2**20:,.0f} MB")
+    col3.metric("Uptime", f"{snapshot['uptime_seconds'] / 60:,.1f} menit")
+
+    if not snapshot["stages"]:
+        st.info("Belum ada tahap yang tercatat. Buka halaman deteksi atau login untuk mengisi metrik.")
+        return
+    table = _stage_table(snapshot["stages"])
+    st.subheader("Latensi per tahap (ms)")
+    st.bar_chart(table[["p50", "p95", "p99"]], stack=False)
+    st.dataframe(table.style.format("{:,.2f}", subset=["mean", "p50", "p95", "p99", "max"]),
+                 use_container_width=True)
+    st.caption(f"Persentil dari {metrics.WINDOW:,} sampel terakhir per tahap; count dan histogram sejak proses mulai.")
+    if snapshot["counters"]:
+        st.dataframe(pd.Series(snapshot["counters"], name="jumlah"), use_container_width=True)
+
+    with st.expander("Ekspor Prometheus"):
+        port = metrics.start_exporter()
+        if port:
+            st.caption(f"Endpoint lokal: http://{metrics.EXPORTER_HOST}:{port}/metrics")
+        else:
+            st.caption("Endpoint lokal tidak aktif di proses ini (DETEKSI_METRICS_PORT=0 atau port dipakai proses lain).")
+        st.code(metrics.prometheus_text(), language="text")
+
+
+def profiler_section():
+    st.subheader("Snapshot profiler")
+    mode = st.radio("Jenis", ["Sampling (semua thread)", "cProfile (antrian inferensi)"], horizontal=True,
+                    key="profile_mode")
+    seconds = st.slider("Durasi (detik)", 1, 30, 5, key="profile_seconds")
+
+    scheduler = None
+    if PAGES[DETEKSI_PAGE] in sys.modules:
+        scheduler = load_page(DETEKSI_PAGE).load_scheduler()
+    needs_scheduler = mode.startswith("cProfile")
+    if needs_scheduler and scheduler is None:
+        st.caption("Antrian inferensi belum berjalan (halaman deteksi belum dibuka di proses ini).")
+
+    if st.button("Ambil Snapshot", key="profile_run", disabled=needs_scheduler and scheduler is None):
+        with st.spinner(f"Merekam {seconds} detik…"):
+            if needs_scheduler:
+                st.session_state.profile_result = ("cprofile", scheduler.profile(seconds))
+            else:
+                st.session_state.profile_result = ("sampling", profiler.sample(seconds))
+
+    result = st.session_state.get("profile_result")
+    if result is None:
+        return
+    kind, data = result
+    if kind == "cprofile":
+        if not data:
+            st.info("Tidak ada batch inferensi selama perekaman.")
+        else:
+            st.code(data, language="text")
+            st.download_button("Unduh (pstats)", data, file_name="cprofile.txt", mime="text/plain")
+    else:
+        rows = profiler.top_functions(data)
+        total = sum(data.values())
+        if not rows:
+            st.info("Semua thread sedang menunggu selama perekaman.")
+        else:
+            table = pd.DataFrame(rows, columns=["fungsi", "sendiri", "total"])
+            table["total %"] = table["total"] / total * 100
+            st.dataframe(table, use_container_width=True, hide_index=True)
+        st.download_button("Unduh collapsed stacks (flamegraph)", profiler.collapsed(data),
+                           file_name="stacks.txt", mime="text/plain")
+
+
+def render():
+    if st.session_state.get("user") != "admin":
+        st.error("Halaman ini hanya untuk admin.")
+        return
+    st.title("Kinerja Aplikasi")
+    if st.button("Segarkan", key="metrics_refresh"):
+        st.rerun()
+    latency_section()
+    profiler_section()
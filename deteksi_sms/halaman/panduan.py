@@ -0,0 +1,52 @@
+"""Halaman "Panduan Aplikasi" (langkah penggunaan, tanpa model)."""
+import streamlit as st
+
+from deteksi_sms import assets
+
+
+def render():
+    st.title('Langkah-Langkah Penggunaan Aplikasi')
+    st.write("<br>", unsafe_allow_html=True)
+    #LANGKAH 1
+    st.markdown(
+        """
+        <div style="text-align: justify;">
+            Agar kalian tidak bingung saat menggunakan aplikasi deteksi ini, kami jelasin caranya, ya!😊.Sebenarnya caranya cukup sederhana, tapi tidak ada salahnya kami bantu jelaskan supaya kalian makin paham dan sekalian bisa baca-baca juga. Nah, langsung saja berikut ini langkah-langkah penggunaannya:
+        <br><br>
+        <ol start="1">
+        <li>Untuk memulai cara penggunaan aplikasi deteksi spam,langkah pertama kita pilih menu pada bagian “Aplikasi Deteksi SMS” pada halaman sidebar menu navigasi dan kita dapat melihat sebuah tampilan dari sistem deteksi SMS spam seperti gambar dibawah ini:</p>
+        </li>
+        <br>
+        """,
+        unsafe_allow_html=True
+    )
+    assets.image("LANGKAH1.png", caption="Gambar panduan pertama")
+
+    #LANGKAH 2
+    st.markdown(
+        """
+        <br><br>
+        <div style="text-align: justify;">
+        <ol start="2">
+        <li>Kemudian sekarang kita akan memasukkan sebuah teks pesan SMS kita yang ada di HP kita masing-masing dengan cara copy and paste ke area input-text area halaman deteksi.Setelah kalian sudah menginput teks yang kalian pilih, kemudian tekan tombol “Deteksi” untuk melihat hasil output yang akan ditampilkan seperti gambar dibawah ini:</p>
+        </li>
+        <br>
+        """,
+        unsafe_allow_html=True
+    )
+    assets.image("LANGKAH2.png", caption="Gambar panduan kedua")
+
+    #LANGKAH 3
+    st.markdown(
+        """
+        <br><br>
+        <div style="text-align: justify;">
+        <ol start="3">
+        <li>Yeyy, sudah deh. Hasil deteksi pesan yang tadi sudah kita input menunjukkan bahwa pesan tersebut merupakan jenis SMS normal yang artinya aman untuk direspon/ditanggapi dan tidak ada terindikasi bahwa pesan tersebut spam.</p>
+        </li>
+        <br>
+        """,
+        
+        unsafe_allow_html=True
+    )
+    assets.image("LANGKAH3.png", caption="Gambar hasil deteksi")
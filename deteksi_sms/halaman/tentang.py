@@ -0,0 +1,53 @@
+"""Halaman "Tentang Saya" (profil tim, tanpa model)."""
+import streamlit as st
+
+from deteksi_sms import assets
+
+
+def render():
+    st.markdown("""
+    <div style="text-align: center;">
+        <h2 style="color: #68ADFF;">👨‍💻 Tentang Kami</h2>
+        <p style="font-size: 17px;">Kami adalah tiga mahasiswa penuh semangat dari <strong>UNP KEDIRI</strong> yang memiliki satu misi: <em>membuat teknologi bermanfaat, mudah diakses, dan berdampak nyata.</em></p>
+        <p style="font-size: 17px;">Dikarenakan ada tugas mata kuliah Capstone Project dan kebetulan sekarang lagi marak penipuan lewat SMS, kami pun berinisiatif membuat aplikasi untuk mendeteksi pesan-pesan yang berpotensi penipuan. Semoga bisa membantu banyak orang lebih waspada!</p>    
+    </div>
+
+    <div style="background-color: #F0F8FF; padding: 20px; border-radius: 15px;">
+    <h3 style="color: #1F618D;">🚀 Tim Pengembang:</h3>
+    <ul style="font-size: 16px; list-style-type: square; color: #1A1A1A;">
+        <li><strong>🧑‍💻 Muhammad Nabil Pratama</strong> – Master di bagian pengumpulan pesan SMS untuk membangun dataset guyss.</li>
+        <li><strong>🎨 Danny Putra Ardianto</strong> – Frontend dan pembangunan bagian aplikasi SMS nya ya guyss.</li>
+    </ul>
+    </div>
+
+    <br>
+
+    <div style="background-color: #FFF7E8; padding: 20px; border-radius: 15px;">
+    <h3 style="color: #E67E22;">🎯 Misi Aplikasi</h3>
+    <p style="font-size: 16px; color: #1A1A1A;">
+        Aplikasi ini kami bangun sebagai bentuk solusi atas maraknya SMS spam, penipuan, dan promo tidak relevan. 
+        Dengan teknologi <strong>Machine Learning</strong> menggunakan algoritma <strong>Support Vector Machine (SVM)</strong> 
+        dan antarmuka <strong>Streamlit</strong>, kami ingin menghadirkan sistem deteksi SMS yang cerdas namun tetap ramah pengguna.
+    </p>
+    </div>
+
+
+    <br>
+
+    <div style="background-color: #E8F8F5; padding: 20px; border-radius: 15px;">
+        <h3 style="color: #148F77;">📬 Hubungi Kami</h3>
+        <ul style="font-size: 16px; color: #1A1A1A;">
+            <li>Email: kelompok6.smartapps@gmail.com</li>
+            <li>GitHub: <a href="https://github.com/kelompokCP-deteksisms" target="_blank">github.com/kelompokCP-deteksisms</a></li>
+        </ul>
+    </div>
+
+    <br>
+
+    <div style="text-align: center;">
+        <p style="font-size: 15px;"><em>“Karena pesan spam itu bukan cuma gangguan... tapi bisa jadi bencana 👀.”</em></p>
+    </div>
+    """, unsafe_allow_html=True)
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        assets.image("PROFILE.jpg", caption="Profil Kami")
@@ -0,0 +1,112 @@
+"""Inference model SVC linear langsung di matriks sparse TF-IDF.
+
+``SVC(kernel='linear')`` di notebook dilatih dengan array dense, sehingga
+``predict`` sklearn menolak input sparse dan aplikasi harus memanggil
+``toarray()`` dulu. Untuk kernel linear, setiap pasangan kelas (one-vs-one)
+cukup diwakili satu vektor bobot (``coef_``) dan intercept, jadi skor
+keputusan bisa dihitung sebagai perkalian CSR x bobot tanpa densifikasi.
+
+Model hasil ``deteksi_sms.train`` (SGDClassifier, hinge loss) memakai skema
+one-vs-rest: satu kolom bobot per kelas dan prediksi = skor terbesar.
+"""
+from itertools import combinations
+
+import numpy as np
+
+
+SCHEMES = ("ovo", "ovr")
+
+
+class LinearSVCScorer:
+    """Pengganti ``SVC.predict`` untuk kernel linear yang menerima CSR.
+
+    Voting one-vs-one mengikuti libsvm: skor > 0 memberi suara ke kelas
+    pertama pasangan, selain itu ke kelas kedua, dan jika seri dipilih
+    kelas dengan indeks terkecil. SVC biner dinormalkan ke arah yang sama
+    saat ``from_svc``, sehingga ``explain.Explainer`` dan ``online`` cukup
+    mengikuti satu konvensi tanda. Untuk ``scheme="ovr"`` (model linear
+    sklearn lain, mis. SGDClassifier) dipilih kelas dengan skor terbesar.
+    """
+
+    def __init__(self, coef_t, intercept, classes, scheme: str = "ovo"):
+        # Bobot disimpan (n_features, n_pairs) supaya X @ coef_t langsung jadi
+        # skor per baris; array C-contiguous (termasuk hasil mmap) tidak disalin
+        if scheme not in SCHEMES:
+            raise ValueError(f"Skema tidak dikenal: {scheme}")
+        coef_t = np.ascontiguousarray(coef_t)
+        self.scheme = scheme
+        self.classes_ = np.asarray(classes)
+        n_classes = len(self.classes_)
+        if scheme == "ovo":
+            self.pairs = list(combinations(range(n_classes), 2))
+            expected = len(self.pairs)
+        else:
+            self.pairs = []
+            expected = 1 if n_classes == 2 else n_classes
+        if coef_t.shape[1] != expected:
+            raise ValueError(
+                f"bobot punya {coef_t.shape[1]} kolom, seharusnya {expected} untuk skema {scheme}"
+            )
+        self.coef_t = coef_t
+        self.intercept_ = np.asarray(intercept, dtype=np.float64)
+        self._vote_first = np.array([i for i, _ in self.pairs])
+        self._vote_second = np.array([j for _, j in self.pairs])
+
+    @classmethod
+    def from_svc(cls, model):
+        if getattr(model, "kernel", None) != "linear":
+            raise ValueError("LinearSVCScorer hanya mendukung SVC dengan kernel='linear'")
+        coef, intercept = model.coef_, model.intercept_
+        if hasattr(coef, "toarray"):
+            # SVC yang di-fit dengan input sparse menyimpan coef_ sebagai matriks sparse
+            coef = coef.toarray()
+        if len(model.classes_) == 2:
+            # SVC biner membalik tanda coef_/intercept_ publik (skor > 0 = kelas kedua),
+            # padahal voting di sini mengikuti one-vs-one multikelas (skor > 0 = kelas pertama)
+            coef, intercept = -coef, -intercept
+        scorer = cls(coef.T, intercept, model.classes_)
+        # Support vector selalu tersedia: cek voting sama dengan SVC.predict
+        support = model.support_vectors_
+        if support.shape[0] and not np.array_equal(scorer.predict(support), model.predict(support)):
+            raise ValueError("Prediksi LinearSVCScorer berbeda dengan SVC.predict pada support vector")
+        return scorer
+
+    @classmethod
+    def from_linear(cls, model):
+        """Dari model linear sklearn one-vs-rest (SGDClassifier, LinearSVC, ...)."""
+        return cls(model.coef_.T, model.intercept_, model.classes_, scheme="ovr")
+
+    @property
+    def score_names(self) -> list:
+        """Nama kolom skor: ``"0v1"`` per pasangan (ovo) atau label kelas (ovr)."""
+        if self.scheme == "ovo":
+            return [f"{self.classes_[i]}v{self.classes_[j]}" for i, j in self.pairs]
+        if len(self.classes_) == 2:
+            return [str(self.classes_[1])]
+        return [str(label) for label in self.classes_]
+
+    @property
+    def n_features_in_(self) -> int:
+        return self.coef_t.shape[0]
+
+    def decision_function(self, X):
+        """Skor keputusan, bentuk (n_samples, n_pairs) atau (n_samples, n_classes)."""
+        return np.asarray(X @ self.coef_t) + self.intercept_
+
+    def predict(self, X):
+        return self.predict_from_scores(self.decision_function(X))
+
+    def predict_from_scores(self, scores):
+        """Prediksi dari skor ``decision_function`` yang sudah dihitung."""
+        if self.scheme == "ovr":
+            if scores.shape[1] == 1:
+                return self.classes_[(scores[:, 0] > 0).astype(int)]
+            return self.classes_[np.argmax(scores, axis=1)]
+        n_samples, n_classes = scores.shape[0], len(self.classes_)
+        winners = np.where(scores > 0, self._vote_first, self._vote_second)
+        votes = np.zeros((n_samples, n_classes), dtype=np.int32)
+        rows = np.arange(n_samples)
+        for k in range(len(self.pairs)):
+            votes[rows, winners[:, k]] += 1
+        return self.classes_[np.argmax(votes, axis=1)]
+
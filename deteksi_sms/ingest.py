@@ -0,0 +1,403 @@
+"""Klasifikasi streaming untuk dump SMS besar (JSONL, CSV, XML backup Android).
+
+Pengganti ``pd.read_csv`` seluruh file seperti di notebook: record dibaca
+satu per satu oleh generator, dikelompokkan per chunk, lalu setiap chunk
+di-preprocess, di-vectorize (sparse) dan diprediksi di process pool dengan
+model versi aktif registry. Hasil ditulis berurutan sesuai input, jadi
+memori mengikuti ``--chunksize`` x ``--workers``, bukan ukuran file.
+
+- Format dari ekstensi (``.jsonl``/``.ndjson``, ``.csv``, ``.xml``) atau
+  ``--format``. XML mengikuti format "SMS Backup & Restore" Android
+  (``<smses><sms body=".." address=".." date=".." .../></smses>``).
+- Output CSV atau JSONL (dari ekstensi ``--out``): ``record`` (nomor urut
+  input), kolom ``--keep``, ``teks``, ``label``, ``kategori``, skor per
+  kelas dengan ``--scores`` dan ``kata_pemicu`` (token yang paling
+  mendorong label, ``deteksi_sms.explain``) dengan ``--explain``.
+- Checkpoint ``<out>.checkpoint.json`` ditulis berkala dan saat dihentikan
+  (Ctrl-C). ``--resume`` melanjutkan dari sana: output dipotong ke posisi
+  checkpoint, JSONL/CSV langsung di-seek ke offset byte, XML dilewati per
+  record. Versi model dicatat; resume dengan versi lain ditolak.
+- Baris JSONL yang rusak (bukan JSON valid) dilewati dan offset byte-nya
+  di-log (logger ``deteksi_sms.ingest``); jumlahnya ada di checkpoint
+  (``skipped``) dan ringkasan akhir, jadi satu baris rusak tidak
+  menghentikan run.
+
+    python -m deteksi_sms.ingest dump.jsonl --out hasil.csv
+    python -m deteksi_sms.ingest sms-backup.xml --out hasil.jsonl --workers 8 --resume
+"""
+import argparse
+import csv
+import itertools
+import json
+import logging
+import os
+import resource
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree import ElementTree
+
+from deteksi_sms import artifacts
+from deteksi_sms.batch import LABELS, TEXT_COLUMN
+from deteksi_sms.preprocessing import KEY_NORM_FILE
+
+CHUNK_SIZE = 5_000
+CHECKPOINT_INTERVAL = 5.0
+PROGRESS_INTERVAL = 1.0
+
+FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "jsonl", ".csv": "csv", ".xml": "xml"}
+
+# Nama field teks yang dicoba berurutan bila --text-field tidak diberikan
+TEXT_FIELDS = (TEXT_COLUMN, "text", "body", "message", "pesan")
+
+# Kolom yang ikut disalin ke output bila --keep tidak diberikan
+DEFAULT_KEEP = {"jsonl": (), "csv": (), "xml": ("address", "date", "type")}
+
+_worker = None
+
+logger = logging.getLogger("deteksi_sms.ingest")
+
+
+def detect_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"Format {path} tidak dikenali, pakai --format jsonl/csv/xml")
+    return FORMATS[ext]
+
+
+def guess_text_field(fields) -> str:
+    for name in TEXT_FIELDS:
+        if name in fields:
+            return name
+    raise ValueError(f"Field teks tidak ditemukan di {list(fields)[:10]}, pakai --text-field")
+
+
+def _lines(f, offset: int):
+    """Baris biner ``f`` mulai ``offset``, beserta offset byte setelah baris itu."""
+    f.seek(offset)
+    for line in f:
+        offset += len(line)
+        yield line, offset
+
+
+def read_jsonl(path: str, text_field: str = None, offset: int = 0, bad: list = None):
+    """Yield (record, teks, offset akhir) dari file JSON Lines.
+
+    Baris yang bukan JSON valid dilewati; offset byte awalnya ditambahkan ke
+    ``bad`` (bila diberikan) dan di-log.
+    """
+    with open(path, "rb") as f:
+        for line, end in _lines(f, offset):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                logger.warning("Baris JSONL rusak di offset byte %d dilewati: %s", end - len(line), exc)
+                if bad is not None:
+                    bad.append(end - len(line))
+                continue
+            if not isinstance(record, dict):
+                record = {TEXT_COLUMN: record}
+            text_field = text_field or guess_text_field(record)
+            text = record.get(text_field)
+            yield record, "" if text is None else str(text), end
+
+
+def read_csv(path: str, text_field: str = None, offset: int = 0):
+    """Yield (record, teks, offset akhir) dari CSV ber-header (field multi-baris didukung)."""
+    with open(path, "rb") as f:
+        header_line = f.readline()
+        header = next(csv.reader([header_line.decode("utf-8-sig")]))
+        idx = header.index(text_field or guess_text_field(header))
+        state = {"end": max(offset, len(header_line))}
+
+        def decoded():
+            # csv.reader hanya menarik baris sebanyak yang dibutuhkan satu record,
+            # jadi state["end"] saat record di-yield adalah akhir record itu
+            for line, end in _lines(f, state["end"]):
+                state["end"] = end
+                yield line.decode("utf-8", errors="replace")
+
+        for row in csv.reader(decoded()):
+            if not row:
+                continue
+            yield dict(zip(header, row)), row[idx] if idx < len(row) else "", state["end"]
+
+
+def read_android_xml(path: str, text_field: str = None, offset: int = 0):
+    """Yield (atribut, teks, None) per elemen ``<sms>``; XML tidak bisa di-seek."""
+    text_field = text_field or "body"
+    with open(path, "rb") as f:
+        root = None
+        for event, elem in ElementTree.iterparse(f, events=("start", "end")):
+            if root is None:
+                root = elem
+            if event == "end" and elem.tag == "sms":
+                yield dict(elem.attrib), elem.get(text_field, ""), None
+                # Buang elemen yang sudah dibaca supaya pohon XML tidak tumbuh
+                root.clear()
+
+
+READERS = {"jsonl": read_jsonl, "csv": read_csv, "xml": read_android_xml}
+
+
+def iter_chunks(records, chunksize: int):
+    """Kelompokkan (record, teks, offset) menjadi list per chunk."""
+    while True:
+        chunk = list(itertools.islice(records, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _init_worker(model_dir: str, version: str, key_norm_path: str, explain: bool = False) -> None:
+    global _worker
+    from deteksi_sms.preprocessing import TextPreprocessor
+    from deteksi_sms.registry import ModelRegistry
+
+    loaded = ModelRegistry(model_dir).load(version)
+    _worker = (TextPreprocessor.from_files(key_norm_path), loaded.vectorizer, loaded.scorer,
+               loaded.explainer if explain else None)
+
+
+def _classify_chunk(texts: list):
+    """Dijalankan di proses pekerja: label, skor (dan kata pemicu) satu chunk.
+
+    Pesan identik dalam satu chunk hanya diproses sekali.
+    """
+    from deteksi_sms.batch import explain_texts, score_texts
+
+    preprocessor, vectorizer, scorer, explainer = _worker
+    if explainer is None:
+        labels, scores = score_texts(texts, preprocessor, vectorizer, scorer)
+        return labels.tolist(), scores, None
+    labels, scores, words = explain_texts(texts, preprocessor, vectorizer, scorer, explainer)
+    return labels.tolist(), scores, words.tolist()
+
+
+class _Output:
+    """Penulis output CSV/JSONL yang bisa dilanjutkan dari posisi byte tertentu."""
+
+    def __init__(self, path: str, columns: list, resume_bytes: int = 0):
+        self.path = path
+        self.columns = columns
+        self.jsonl = detect_format(path) == "jsonl"
+        if resume_bytes:
+            self.file = open(path, "r+", encoding="utf-8", newline="")
+            self.file.truncate(resume_bytes)
+            self.file.seek(resume_bytes)
+        else:
+            self.file = open(path, "w", encoding="utf-8", newline="")
+        self.writer = None if self.jsonl else csv.writer(self.file)
+        if not resume_bytes and not self.jsonl:
+            self.writer.writerow(columns)
+
+    def write(self, rows) -> None:
+        if self.jsonl:
+            self.file.writelines(json.dumps(dict(zip(self.columns, row)), ensure_ascii=False) + "\n" for row in rows)
+        else:
+            self.writer.writerows(rows)
+
+    def tell(self) -> int:
+        """Posisi byte setelah baris terakhir yang ditulis."""
+        return self.file.tell()
+
+    def sync(self, size: int = None) -> int:
+        """Flush ke disk, kembalikan ukuran file (posisi aman untuk checkpoint).
+
+        Bila ``size`` diberikan, file dipotong dulu ke posisi itu sehingga
+        baris dari chunk yang terputus di tengah jalan ikut dibuang.
+        """
+        self.file.flush()
+        if size is not None:
+            self.file.seek(size)
+            self.file.truncate()
+        os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def checkpoint_path(out: str) -> str:
+    return out + ".checkpoint.json"
+
+
+def load_checkpoint(out: str):
+    try:
+        with open(checkpoint_path(out), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(out: str, state: dict) -> None:
+    path = checkpoint_path(out)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _progress(state: dict, input_size: int, started: float, done: bool = False) -> None:
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    rate = state["session_records"] / elapsed
+    line = f"  {state['records']:,} pesan, {rate:,.0f} pesan/s"
+    if state["input_offset"] is not None and input_size:
+        line += f", {state['input_offset'] / input_size:.1%} dari {input_size / 2**20:,.0f} MB"
+    print(line, end="\n" if done else "\r", file=sys.stderr, flush=True)
+
+
+def ingest(path: str, out: str, fmt: str = None, text_field: str = None, keep=None, scores: bool = False,
+           explain: bool = False, model_dir: str = artifacts.MODEL_DIR, workers: int = None, chunksize: int = CHUNK_SIZE,
+           resume: bool = False, key_norm_path: str = KEY_NORM_FILE, quiet: bool = False) -> dict:
+    """Klasifikasikan seluruh ``path`` ke ``out``; kembalikan state checkpoint terakhir."""
+    from deteksi_sms.registry import ModelRegistry
+    from deteksi_sms.train import ordered_map
+
+    fmt = fmt or detect_format(path)
+    keep = list(DEFAULT_KEEP[fmt] if keep is None else keep)
+    workers = workers or os.cpu_count() or 1
+    registry = ModelRegistry(model_dir)
+    version = registry.active()
+    input_size = os.path.getsize(path)
+
+    state = load_checkpoint(out) if resume else None
+    if state is not None:
+        if state["done"]:
+            print(f"{path} sudah selesai diproses ({state['records']:,} pesan)", file=sys.stderr)
+            return state
+        if (state["input"], state["input_size"], state["format"]) != (os.path.abspath(path), input_size, fmt):
+            raise SystemExit("Checkpoint dibuat untuk input lain (atau input sudah berubah); jalankan tanpa --resume")
+        if state["model_version"] != version:
+            raise SystemExit(f"Checkpoint memakai model {state['model_version']}, versi aktif sekarang {version}; "
+                             "jalankan tanpa --resume supaya seluruh output memakai satu versi model")
+        text_field, keep, scores = state["text_field"], state["keep"], state["scores"]
+        explain = state.get("explain", False)
+    else:
+        state = {
+            "input": os.path.abspath(path), "input_size": input_size, "format": fmt, "text_field": text_field,
+            "keep": keep, "scores": scores, "explain": explain, "model_version": version,
+            "model_checksum": registry.manifest(version)["checksum"],
+            "records": 0, "input_offset": 0 if fmt != "xml" else None, "output_bytes": 0, "skipped": 0,
+            "done": False,
+        }
+    state.setdefault("skipped", 0)
+
+    # Offset byte baris JSONL rusak yang sudah dibaca tapi belum tercakup chunk yang tertulis
+    bad_lines = []
+    options = {"bad": bad_lines} if fmt == "jsonl" else {}
+    records = READERS[fmt](path, text_field, state["input_offset"] or 0, **options)
+    if state["input_offset"] is None and state["records"]:
+        records = itertools.islice(records, state["records"], None)
+    score_names = []
+    if scores:
+        scorer = artifacts.load_model_and_vectorizer(registry.path(version))[0]
+        score_names = [f"skor_{name}" for name in scorer.score_names]
+    columns = ["record", *keep, TEXT_COLUMN, "label", "kategori", *score_names, *(["kata_pemicu"] if explain else [])]
+    output = _Output(out, columns, state["output_bytes"])
+
+    chunks = iter_chunks(records, chunksize)
+    pending = deque()  # (record, teks, offset) per chunk yang sedang diproses pekerja, urut input
+
+    def texts_only():
+        for chunk in chunks:
+            pending.append(chunk)
+            yield [text for _, text, _ in chunk]
+
+    init_args = (model_dir, version, key_norm_path, explain)
+    if workers > 1:
+        pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=init_args)
+        results = ordered_map(pool, _classify_chunk, texts_only(), max_pending=2 * workers)
+    else:
+        pool = None
+        _init_worker(*init_args)
+        results = map(_classify_chunk, texts_only())
+
+    state["session_records"] = 0
+    started = time.perf_counter()
+    last_checkpoint = last_progress = started
+    # Posisi output setelah chunk terakhir yang tertulis utuh dan tercatat di state
+    committed = output.tell()
+    try:
+        for labels, chunk_scores, words in results:
+            chunk = pending.popleft()
+            first = state["records"]
+            output.write(
+                [first + i, *(record.get(name, "") for name in keep), text, label, LABELS.get(label, label),
+                 *(chunk_scores[i].tolist() if scores else ()), *((words[i],) if explain else ())]
+                for i, ((record, text, _), label) in enumerate(zip(chunk, labels))
+            )
+            state["records"] += len(chunk)
+            state["session_records"] += len(chunk)
+            if state["input_offset"] is not None:
+                state["input_offset"] = chunk[-1][2]
+            if bad_lines:
+                # Hanya baris rusak sebelum akhir chunk ini; sisanya milik chunk berikutnya
+                state["skipped"] += sum(1 for offset in bad_lines if offset < state["input_offset"])
+                bad_lines[:] = [offset for offset in bad_lines if offset >= state["input_offset"]]
+            committed = output.tell()
+            now = time.perf_counter()
+            if now - last_checkpoint >= CHECKPOINT_INTERVAL:
+                state["output_bytes"] = output.sync(committed)
+                save_checkpoint(out, state)
+                last_checkpoint = now
+            if not quiet and now - last_progress >= PROGRESS_INTERVAL:
+                _progress(state, input_size, started)
+                last_progress = now
+        # Baris rusak setelah record terakhir
+        state["skipped"] += len(bad_lines)
+        bad_lines.clear()
+        state["done"] = True
+    finally:
+        # Juga saat Ctrl-C: baris chunk yang belum selesai ditulis dibuang supaya
+        # output sama persis dengan chunk yang tercatat di state
+        state["output_bytes"] = output.sync(committed)
+        output.close()
+        save_checkpoint(out, state)
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    if not quiet:
+        _progress(state, input_size, started, done=True)
+    state["seconds"] = time.perf_counter() - started
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Klasifikasi streaming dump SMS (JSONL/CSV/XML Android)")
+    parser.add_argument("input")
+    parser.add_argument("--out", required=True, help="file hasil .csv atau .jsonl")
+    parser.add_argument("--format", choices=sorted(set(FORMATS.values())), default=None)
+    parser.add_argument("--text-field", default=None, help=f"default: {'/'.join(TEXT_FIELDS)} (XML: body)")
+    parser.add_argument("--keep", default=None, help="field input yang disalin ke output, dipisah koma")
+    parser.add_argument("--scores", action="store_true", help="tulis skor keputusan per kelas")
+    parser.add_argument("--explain", action="store_true", help="tulis kolom kata_pemicu")
+    parser.add_argument("--model-dir", default=artifacts.MODEL_DIR)
+    parser.add_argument("--workers", type=int, default=None, help="jumlah proses (default: jumlah CPU)")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--resume", action="store_true", help="lanjutkan dari checkpoint <out>.checkpoint.json")
+    parser.add_argument("--key-norm", default=KEY_NORM_FILE)
+    args = parser.parse_args()
+
+    keep = None if args.keep is None else [name for name in args.keep.split(",") if name]
+    try:
+        state = ingest(args.input, args.out, args.format, args.text_field, keep, args.scores, args.explain,
+                       args.model_dir, args.workers, args.chunksize, args.resume, args.key_norm)
+    except KeyboardInterrupt:
+        state = load_checkpoint(args.out)
+        print(f"\nDihentikan setelah {state['records']:,} pesan; lanjutkan dengan --resume", file=sys.stderr)
+        raise SystemExit(130)
+    if "seconds" in state:
+        peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                   resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss) / 1024
+        print(f"Selesai: {state['session_records']:,} pesan dalam {state['seconds']:.1f} detik "
+              f"({state['session_records'] / max(state['seconds'], 1e-9):,.0f} pesan/s), "
+              f"RSS puncak per proses {peak:,.0f} MB, model {state['model_version']}", file=sys.stderr)
+    if state.get("skipped"):
+        print(f"{state['skipped']:,} baris rusak dilewati (offset byte ada di log)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
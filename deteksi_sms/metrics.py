@@ -0,0 +1,250 @@
+"""Instrumentasi ringan untuk jalur panas aplikasi dan layanan.
+
+Setiap tahap (preprocessing, transform TF-IDF, predict, lookup akun, render
+halaman, ...) dicatat dengan ``timer``:
+
+    with metrics.timer("transform"):
+        X = vectorizer.transform(clean)
+
+Per tahap disimpan histogram kumulatif (bucket tetap, untuk Prometheus)
+dan ring buffer sampel terakhir (untuk p50/p95/p99). Satu observasi hanya
+``perf_counter`` + satu lock + beberapa operasi list, jadi ongkosnya
+sekitar satu mikrodetik. Counter dan memori proses ikut diekspor.
+
+Ekspor:
+
+- teks Prometheus di ``http://127.0.0.1:9464/metrics`` (``start_exporter``;
+  port dari ``DETEKSI_METRICS_PORT``, ``0`` mematikan);
+- log terstruktur (satu baris JSON per interval) ke file
+  ``DETEKSI_METRICS_LOG`` (``-`` = stderr), setiap
+  ``DETEKSI_METRICS_LOG_INTERVAL`` detik.
+
+Setel ``DETEKSI_METRICS=0`` untuk mematikan pencatatan sama sekali.
+"""
+import bisect
+import json
+import logging
+import os
+import resource
+import threading
+import time
+from collections import deque
+
+ENABLED = os.environ.get("DETEKSI_METRICS", "1") != "0"
+EXPORTER_HOST = os.environ.get("DETEKSI_METRICS_HOST", "127.0.0.1")
+EXPORTER_PORT = int(os.environ.get("DETEKSI_METRICS_PORT", 9464))
+LOG_PATH = os.environ.get("DETEKSI_METRICS_LOG") or None
+LOG_INTERVAL = float(os.environ.get("DETEKSI_METRICS_LOG_INTERVAL", 60))
+
+# Batas atas bucket histogram (detik), sama untuk semua tahap
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Jumlah sampel terakhir per tahap yang dipakai untuk persentil
+WINDOW = 2048
+
+PERCENTILES = (50, 95, 99)
+
+logger = logging.getLogger("deteksi_sms.metrics")
+
+
+class _Stage:
+    __slots__ = ("buckets", "count", "sum", "max", "recent")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=WINDOW)
+
+
+_lock = threading.Lock()
+_stages = {}
+_counters = {}
+_started = time.time()
+
+
+def observe(stage: str, seconds: float) -> None:
+    """Catat satu durasi (detik) untuk ``stage``."""
+    if not ENABLED:
+        return
+    with _lock:
+        entry = _stages.get(stage)
+        if entry is None:
+            entry = _stages[stage] = _Stage()
+        entry.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+        entry.count += 1
+        entry.sum += seconds
+        if seconds > entry.max:
+            entry.max = seconds
+        entry.recent.append(seconds)
+
+
+def incr(name: str, value: float = 1) -> None:
+    """Tambah counter ``name``."""
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+class timer:
+    """Context manager yang mencatat lama blok ke ``observe(stage, ...)``."""
+
+    __slots__ = ("stage", "started")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.stage, time.perf_counter() - self.started)
+        return False
+
+
+def reset() -> None:
+    with _lock:
+        _stages.clear()
+        _counters.clear()
+
+
+def _percentile(ordered: list, q: float) -> float:
+    """Persentil nearest-rank dari list yang sudah urut."""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+def memory() -> dict:
+    """RSS saat ini dan puncaknya (byte)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    try:
+        with open("/proc/self/statm", "r") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        rss = peak
+    return {"rss_bytes": rss, "max_rss_bytes": peak}
+
+
+def snapshot() -> dict:
+    """Ringkasan semua tahap (detik), counter dan memori proses."""
+    with _lock:
+        stages = {name: (entry.count, entry.sum, entry.max, sorted(entry.recent)) for name, entry in _stages.items()}
+        counters = dict(_counters)
+    result = {}
+    for name, (count, total, peak, ordered) in sorted(stages.items()):
+        summary = {"count": count, "mean": total / count if count else 0.0, "max": peak}
+        for q in PERCENTILES:
+            summary[f"p{q}"] = _percentile(ordered, q)
+        result[name] = summary
+    return {"uptime_seconds": time.time() - _started, "stages": result, "counters": counters, "memory": memory()}
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text() -> str:
+    """Semua metrik dalam format teks eksposisi Prometheus."""
+    with _lock:
+        stages = {name: (list(entry.buckets), entry.count, entry.sum) for name, entry in _stages.items()}
+        counters = dict(_counters)
+    lines = [
+        "# HELP deteksi_stage_seconds Latensi per tahap jalur panas",
+        "# TYPE deteksi_stage_seconds histogram",
+    ]
+    for name, (buckets, count, total) in sorted(stages.items()):
+        stage = _label(name)
+        cumulative = 0
+        for bound, n in zip(BUCKETS, buckets):
+            cumulative += n
+            lines.append(f'deteksi_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+        lines.append(f'deteksi_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {count}')
+        lines.append(f'deteksi_stage_seconds_sum{{stage="{stage}"}} {total}')
+        lines.append(f'deteksi_stage_seconds_count{{stage="{stage}"}} {count}')
+    lines += ["# HELP deteksi_events_total Jumlah kejadian", "# TYPE deteksi_events_total counter"]
+    for name, value in sorted(counters.items()):
+        lines.append(f'deteksi_events_total{{event="{_label(name)}"}} {value}')
+    mem = memory()
+    lines += [
+        "# HELP process_resident_memory_bytes RSS proses",
+        "# TYPE process_resident_memory_bytes gauge",
+        f"process_resident_memory_bytes {mem['rss_bytes']}",
+        "# HELP process_max_resident_memory_bytes RSS puncak proses",
+        "# TYPE process_max_resident_memory_bytes gauge",
+        f"process_max_resident_memory_bytes {mem['max_rss_bytes']}",
+        "# HELP process_start_time_seconds Waktu mulai proses (epoch)",
+        "# TYPE process_start_time_seconds gauge",
+        f"process_start_time_seconds {_started}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def log_snapshot() -> None:
+    """Tulis ``snapshot()`` sebagai satu baris JSON ke logger ``deteksi_sms.metrics``."""
+    logger.info(json.dumps(dict(snapshot(), event="metrics", ts=time.time(), pid=os.getpid())))
+
+
+_exporter = None
+_exporter_lock = threading.Lock()
+
+
+def _serve(host: str, port: int):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-exporter", daemon=True).start()
+    return server
+
+
+def _log_loop(interval: float):
+    while True:
+        time.sleep(interval)
+        log_snapshot()
+
+
+def start_exporter(port: int = EXPORTER_PORT, host: str = EXPORTER_HOST, log_path: str = LOG_PATH,
+                   log_interval: float = LOG_INTERVAL):
+    """Jalankan endpoint ``/metrics`` dan log berkala, sekali per proses.
+
+    Mengembalikan port endpoint, atau ``None`` bila dimatikan atau port sudah
+    dipakai (mis. proses lain di mesin yang sama).
+    """
+    global _exporter
+    with _exporter_lock:
+        if _exporter is not None:
+            return _exporter["port"]
+        _exporter = {"port": None}
+        if ENABLED and port:
+            try:
+                _exporter["port"] = _serve(host, port).server_address[1]
+            except OSError as exc:
+                logger.warning("Endpoint metrik %s:%s tidak bisa dibuka: %s", host, port, exc)
+        if ENABLED and log_path and log_interval > 0:
+            handler = logging.StreamHandler() if log_path == "-" else logging.FileHandler(log_path, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            threading.Thread(target=_log_loop, args=(log_interval,), name="metrics-log", daemon=True).start()
+        return _exporter["port"]
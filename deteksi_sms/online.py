@@ -0,0 +1,191 @@
+"""Pembelajaran online dari koreksi pengguna, dengan versi dan rollback.
+
+Koreksi di ``deteksi_sms.feedback`` dipakai untuk memperbarui bobot model
+linear secara bertahap (SGD hinge loss per mini-batch), tanpa training
+ulang notebook:
+
+- one-vs-one (SVC notebook): hanya pasangan kelas yang memuat label benar
+  yang diperbarui, sama seperti libsvm melatih setiap pasangan hanya dengan
+  data dua kelas itu;
+- one-vs-rest (hasil ``deteksi_sms.train``): kolom kelas benar didorong
+  positif, kolom kelas lain negatif.
+
+Setiap pembaruan menjadi versi baru di registry model
+(``deteksi_sms.registry``, asal ``online``). Versi baru hanya diaktifkan
+bila akurasinya pada data uji notebook
+(``train_test_split(test_size=0.2, random_state=0)`` dari
+``Dataset/dataset_spam_sms.csv``) tidak lebih buruk dari versi aktif;
+``registry.HotModel`` lalu memasangnya di aplikasi tanpa restart.
+
+Pemakaian:
+
+    python -m deteksi_sms.online status
+    python -m deteksi_sms.online update
+    python -m deteksi_sms.online rollback
+"""
+import argparse
+import json
+import threading
+
+import numpy as np
+
+from deteksi_sms import artifacts
+from deteksi_sms.feedback import FEEDBACK_FILE, FeedbackStore
+from deteksi_sms.inference import LinearSVCScorer
+from deteksi_sms.registry import ModelRegistry
+
+DATASET = "Dataset/dataset_spam_sms.csv"
+TEST_SIZE = 0.2
+RANDOM_STATE = 0
+
+# Hyperparameter SGD; baris TF-IDF sudah dinormalisasi L2, jadi satu langkah
+# menggeser skor pasangan sebesar kira-kira ``LEARNING_RATE``
+LEARNING_RATE = 0.5
+L2 = 1e-4
+EPOCHS = 10
+BATCH_SIZE = 32
+
+# Penurunan akurasi data uji yang masih diterima saat promosi
+MAX_ACCURACY_DROP = 0.0
+
+_update_lock = threading.Lock()
+
+
+def _targets(scorer: LinearSVCScorer, y) -> np.ndarray:
+    """Target hinge per kolom bobot: +1/-1, atau 0 bila kolom tidak terkait label."""
+    index = {label: i for i, label in enumerate(scorer.classes_.tolist())}
+    rows = np.array([index[label] for label in np.asarray(y).tolist()])
+    if scorer.scheme == "ovo":
+        first = np.array([i for i, _ in scorer.pairs])
+        second = np.array([j for _, j in scorer.pairs])
+        return (rows[:, None] == first).astype(float) - (rows[:, None] == second).astype(float)
+    if scorer.coef_t.shape[1] == 1:
+        return np.where(rows == 1, 1.0, -1.0)[:, None]
+    return np.where(rows[:, None] == np.arange(len(scorer.classes_)), 1.0, -1.0)
+
+
+def hinge_update(scorer: LinearSVCScorer, X, y, learning_rate: float = LEARNING_RATE, l2: float = L2,
+                 epochs: int = EPOCHS, batch_size: int = BATCH_SIZE, seed: int = 0) -> LinearSVCScorer:
+    """Scorer baru hasil SGD hinge loss pada (X, y), dimulai dari bobot ``scorer``.
+
+    Kolom yang tidak menyangkut label di mini-batch (target 0) tidak berubah.
+    Intercept sengaja tidak diperbarui: dengan sedikit koreksi, pergeseran
+    intercept memengaruhi semua pesan, bukan hanya pesan yang mirip koreksi.
+    """
+    weights = np.array(scorer.coef_t, dtype=np.float64)
+    targets = _targets(scorer, y)
+    rng = np.random.default_rng(seed)
+    n = X.shape[0]
+    for _ in range(epochs):
+        order = rng.permutation(n)
+        for start in range(0, n, batch_size):
+            idx = order[start:start + batch_size]
+            Xb, Tb = X[idx], targets[idx]
+            margins = Tb * (np.asarray(Xb @ weights) + scorer.intercept_)
+            active = Tb * ((margins < 1) & (Tb != 0))
+            touched = (Tb != 0).any(axis=0)
+            weights[:, touched] *= 1 - learning_rate * l2
+            weights += learning_rate * np.asarray(Xb.T @ active) / len(idx)
+    return LinearSVCScorer(weights, scorer.intercept_, scorer.classes_, scorer.scheme)
+
+
+def holdout_split(dataset: str = DATASET):
+    """Data uji notebook: ``train_test_split(test_size=0.2, random_state=0)``."""
+    import pandas as pd
+    from sklearn.model_selection import train_test_split
+
+    data = pd.read_csv(dataset)
+    _, x_test, _, y_test = train_test_split(
+        data["teks"].fillna("").astype(str), data["label"], test_size=TEST_SIZE, random_state=RANDOM_STATE
+    )
+    return x_test.tolist(), y_test.to_numpy()
+
+
+def accuracy(scorer, vectorizer, preprocessor, texts, labels) -> float:
+    predicted = scorer.predict(vectorizer.transform(preprocessor.process_many(texts)))
+    return float((predicted == np.asarray(labels)).mean())
+
+
+def update_from_feedback(preprocessor, model_dir: str = artifacts.MODEL_DIR, feedback_path: str = FEEDBACK_FILE,
+                         dataset: str = DATASET, max_drop: float = MAX_ACCURACY_DROP, **sgd) -> dict:
+    """Perbarui versi aktif dengan koreksi yang belum pernah dipakai.
+
+    Koreksi dihitung mulai dari posisi terakhir yang pernah dipakai versi mana
+    pun, sehingga koreksi dari versi yang sudah di-rollback tidak otomatis
+    dipakai ulang. Mengembalikan laporan (versi, akurasi, dipromosikan atau tidak).
+    """
+    with _update_lock:
+        registry = ModelRegistry(model_dir)
+        parent = registry.active()
+        start = max([m.get("feedback_end", 0) for m in registry.history()] + [0])
+        store = FeedbackStore(feedback_path)
+        # Koreksi yang masuk setelah count() dipakai update berikutnya, bukan sekarang
+        end = store.count()
+        records = store.records(start, end)
+        if not records:
+            return {"status": "kosong", "parent": parent, "feedback": 0}
+
+        scorer, vectorizer = artifacts.load_model_and_vectorizer(registry.path(parent))
+        X = vectorizer.transform(preprocessor.process_many([r["text"] for r in records]))
+        y = np.array([r["label"] for r in records])
+        candidate = hinge_update(scorer, X, y, **sgd)
+
+        texts, labels = holdout_split(dataset)
+        parent_acc = accuracy(scorer, vectorizer, preprocessor, texts, labels)
+        candidate_acc = accuracy(candidate, vectorizer, preprocessor, texts, labels)
+        promoted = candidate_acc >= parent_acc - max_drop
+        version = registry.publish(
+            candidate, vectorizer, parent=parent, source="online",
+            metrics={
+                "holdout_accuracy": candidate_acc,
+                "parent_holdout_accuracy": parent_acc,
+                "feedback_fit": float((candidate.predict(X) == y).mean()),
+            },
+            feedback_start=start, feedback_end=end, feedback=len(records), promoted=bool(promoted),
+        )
+        if promoted:
+            registry.activate(version)
+        return {
+            "status": "dipromosikan" if promoted else "ditolak",
+            "version": version,
+            "parent": parent,
+            "feedback": len(records),
+            "holdout_accuracy": candidate_acc,
+            "parent_holdout_accuracy": parent_acc,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pembelajaran online dari koreksi pengguna")
+    parser.add_argument("command", choices=["status", "update", "rollback"])
+    parser.add_argument("--model-dir", default=artifacts.MODEL_DIR)
+    parser.add_argument("--feedback", default=FEEDBACK_FILE)
+    parser.add_argument("--dataset", default=DATASET)
+    parser.add_argument("--max-drop", type=float, default=MAX_ACCURACY_DROP)
+    parser.add_argument("--learning-rate", type=float, default=LEARNING_RATE)
+    parser.add_argument("--epochs", type=int, default=EPOCHS)
+    args = parser.parse_args()
+
+    registry = ModelRegistry(args.model_dir)
+    if args.command == "status":
+        print(f"Versi aktif: {registry.active()}")
+        print(f"Koreksi tercatat: {FeedbackStore(args.feedback).count()}")
+        for meta in registry.history():
+            if meta["source"] != "online":
+                continue
+            metrics = meta["metrics"]
+            print(f"  {meta['version']} (induk {meta['parent']}): {meta['feedback']} koreksi, "
+                  f"akurasi uji {metrics['holdout_accuracy']:.4f} vs {metrics['parent_holdout_accuracy']:.4f}, "
+                  f"{'dipromosikan' if meta['promoted'] else 'ditolak'}")
+    elif args.command == "update":
+        from deteksi_sms.preprocessing import get_preprocessor
+
+        report = update_from_feedback(get_preprocessor(), args.model_dir, args.feedback, args.dataset,
+                                      args.max_drop, learning_rate=args.learning_rate, epochs=args.epochs)
+        print(json.dumps(report, indent=1))
+    else:
+        print(f"Versi aktif sekarang: {registry.rollback()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Hash password dengan salt dan biaya yang bisa diatur.
+
+Format yang disimpan (parameter ikut tersimpan per pengguna):
+
+- ``scrypt$n=16384,r=8,p=1$<salt>$<hash>`` (default, memory-hard);
+- ``pbkdf2_sha256$<iterasi>$<salt>$<hash>`` (cadangan bila OpenSSL tanpa scrypt);
+- 64 karakter hex: SHA-256 tanpa salt dari versi lama, hanya untuk verifikasi
+  dan di-upgrade saat login berhasil.
+
+Hashing dijalankan di thread pool kecil dengan batas antrian, sehingga
+lonjakan login tidak menghabiskan CPU yang dibutuhkan inference. Fungsi
+hashlib melepas GIL selama perhitungan.
+"""
+import base64
+import hashlib
+import hmac
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Parameter biaya; bisa diatur lewat environment variable tanpa mengubah kode
+SCRYPT_N = int(os.environ.get("DETEKSI_SCRYPT_N", 2 ** 14))
+SCRYPT_R = int(os.environ.get("DETEKSI_SCRYPT_R", 8))
+SCRYPT_P = int(os.environ.get("DETEKSI_SCRYPT_P", 1))
+PBKDF2_ITERATIONS = int(os.environ.get("DETEKSI_PBKDF2_ITERATIONS", 600_000))
+
+# Jumlah thread hashing dan jumlah maksimum hashing yang boleh menunggu/berjalan
+HASH_WORKERS = int(os.environ.get("DETEKSI_HASH_WORKERS", 2))
+HASH_MAX_PENDING = int(os.environ.get("DETEKSI_HASH_MAX_PENDING", 16))
+HASH_QUEUE_TIMEOUT = 10.0
+
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+HAS_SCRYPT = hasattr(hashlib, "scrypt")
+
+
+class HashingBusy(RuntimeError):
+    """Antrian hashing penuh; pengguna diminta mencoba lagi."""
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode("utf-8"), salt=salt, n=n, r=r, p=p,
+        maxmem=256 * r * n + 1024 * 1024, dklen=KEY_BYTES,
+    )
+
+
+def _pbkdf2(password: str, salt: bytes, iterations: int) -> bytes:
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations, KEY_BYTES)
+
+
+def hash_password(password: str) -> str:
+    """Hash baru dengan salt acak dan parameter biaya saat ini."""
+    salt = os.urandom(SALT_BYTES)
+    if HAS_SCRYPT:
+        key = _scrypt(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+        return f"scrypt$n={SCRYPT_N},r={SCRYPT_R},p={SCRYPT_P}${_b64(salt)}${_b64(key)}"
+    key = _pbkdf2(password, salt, PBKDF2_ITERATIONS)
+    return f"pbkdf2_sha256${PBKDF2_ITERATIONS}${_b64(salt)}${_b64(key)}"
+
+
+def _is_legacy(stored: str) -> bool:
+    return len(stored) == 64 and "$" not in stored
+
+
+def verify_password(password: str, stored: str) -> bool:
+    """Cocokkan password dengan hash tersimpan (perbandingan waktu-konstan)."""
+    if not stored:
+        return False
+    if _is_legacy(stored):
+        legacy = hashlib.sha256(password.encode("utf-8")).hexdigest()
+        return hmac.compare_digest(legacy, stored)
+
+    try:
+        scheme, params, salt, key = stored.split("$")
+        salt, key = base64.b64decode(salt), base64.b64decode(key)
+        if scheme == "scrypt":
+            cost = dict(item.split("=") for item in params.split(","))
+            actual = _scrypt(password, salt, int(cost["n"]), int(cost["r"]), int(cost["p"]))
+        elif scheme == "pbkdf2_sha256":
+            actual = _pbkdf2(password, salt, int(params))
+        else:
+            return False
+    except (ValueError, KeyError):
+        return False
+    return hmac.compare_digest(actual, key)
+
+
+def needs_rehash(stored: str) -> bool:
+    """True bila hash memakai format lama atau parameter biaya yang berbeda."""
+    if _is_legacy(stored):
+        return True
+    if HAS_SCRYPT:
+        return not stored.startswith(f"scrypt$n={SCRYPT_N},r={SCRYPT_R},p={SCRYPT_P}$")
+    return not stored.startswith(f"pbkdf2_sha256${PBKDF2_ITERATIONS}$")
+
+
+_executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="pw-hash")
+_pending = threading.BoundedSemaphore(HASH_MAX_PENDING)
+
+
+def _run(fn, *args):
+    """Jalankan ``fn`` di thread pool hashing dan tunggu hasilnya."""
+    if not _pending.acquire(timeout=HASH_QUEUE_TIMEOUT):
+        raise HashingBusy("Terlalu banyak proses login bersamaan")
+    try:
+        return _executor.submit(fn, *args).result()
+    finally:
+        _pending.release()
+
+
+def hash_password_pooled(password: str) -> str:
+    return _run(hash_password, password)
+
+
+def verify_password_pooled(password: str, stored: str) -> bool:
+    return _run(verify_password, password, stored)
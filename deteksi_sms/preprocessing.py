@@ -0,0 +1,145 @@
+"""Text preprocessing SMS yang dipakai bersama oleh training dan aplikasi.
+
+Urutan langkahnya sama persis dengan ``text_preprocessing_process`` di
+Developing-model.ipynb: casefolding -> text_normalize -> remove_stop_word ->
+steaming. Bedanya, semua sumber daya (regex, kamus normalisasi, stopword,
+stemmer) disiapkan sekali di ``TextPreprocessor`` sehingga satu pesan cukup
+diproses dengan lookup dict/set biasa.
+"""
+import csv
+import re
+from functools import lru_cache
+
+KEY_NORM_FILE = "Dataset/key_norm.csv"
+
+# Stopword tambahan buatan sendiri (sama dengan more_stopword di notebook)
+MORE_STOPWORDS = ("tsel", "gb", "rb", "btw")
+
+# Batas jumlah token yang hasil stemming-nya disimpan di cache LRU
+STEM_CACHE_SIZE = 50_000
+
+# Regex dikompilasi sekali, polanya sama dengan fungsi casefolding di notebook
+_RE_URL = re.compile(r"https?://\S+ www\.\S+")
+_RE_NUMBER = re.compile(r"[-+]?[0-9]+")
+_RE_PUNCT = re.compile(r"[^\w\s]")
+
+# Normalisasi teks versi Sastrawi (TextNormalizer.normalize_text)
+_RE_NON_ALNUM = re.compile(r"[^a-z0-9 -]", re.IGNORECASE | re.MULTILINE)
+_RE_SPACES = re.compile(r"( +)", re.IGNORECASE | re.MULTILINE)
+
+
+def load_key_norm(path: str = KEY_NORM_FILE) -> dict:
+    """Baca key_norm.csv menjadi dict ``singkat -> hasil`` (lookup O(1) per kata)."""
+    key_norm = {}
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            # Notebook mengambil baris pertama yang cocok (values[0])
+            key_norm.setdefault(row["singkat"], row["hasil"])
+    return key_norm
+
+
+def load_stopwords() -> frozenset:
+    """Stopword bahasa Indonesia dari NLTK + stopword tambahan."""
+    from nltk.corpus import stopwords
+
+    try:
+        words = stopwords.words("indonesian")
+    except LookupError:
+        import nltk
+
+        nltk.download("stopwords", quiet=True)
+        words = stopwords.words("indonesian")
+    return frozenset(words) | frozenset(MORE_STOPWORDS)
+
+
+class _SetDictionary:
+    """Kamus kata dasar Sastrawi berbasis frozenset.
+
+    ArrayDictionary bawaan Sastrawi menyimpan kata dasar di list sehingga
+    setiap ``contains`` memindai ~30 ribu kata.
+    """
+
+    def __init__(self, words):
+        self.words = frozenset(word for word in words if word and word.strip() != "")
+
+    def contains(self, word):
+        return word in self.words
+
+    def count(self):
+        return len(self.words)
+
+
+def create_stemmer():
+    """Stemmer Sastrawi dengan kamus frozenset dan tanpa cache bawaan.
+
+    CachedStemmer dari ``StemmerFactory.create_stemmer()`` tidak dibatasi
+    ukurannya, jadi cache diganti LRU di ``TextPreprocessor``.
+    """
+    from Sastrawi.Stemmer.Stemmer import Stemmer
+    from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+
+    return Stemmer(_SetDictionary(StemmerFactory().get_words()))
+
+
+class TextPreprocessor:
+    """Pipeline preprocessing yang sudah dikompilasi.
+
+    Dibuat sekali lalu dipakai berulang kali; aman dipakai dari beberapa
+    thread karena state-nya hanya dibaca (cache LRU punya lock sendiri).
+    """
+
+    def __init__(self, key_norm: dict, stopwords, stemmer, stem_cache_size: int = STEM_CACHE_SIZE):
+        self.key_norm = key_norm
+        self.stopwords = frozenset(stopwords)
+        self.stemmer = stemmer
+        self._stem_word = lru_cache(maxsize=stem_cache_size)(stemmer.stem_word)
+
+    @classmethod
+    def from_files(cls, key_norm_path: str = KEY_NORM_FILE, stem_cache_size: int = STEM_CACHE_SIZE):
+        return cls(load_key_norm(key_norm_path), load_stopwords(), create_stemmer(), stem_cache_size)
+
+    def casefolding(self, text: str) -> str:
+        text = text.lower()
+        text = _RE_URL.sub("", text)
+        text = _RE_NUMBER.sub("", text)
+        text = _RE_PUNCT.sub("", text)
+        return text.strip()
+
+    def text_normalize(self, text: str) -> str:
+        get = self.key_norm.get
+        return " ".join([get(word, word) for word in text.split()]).lower()
+
+    def remove_stop_word(self, text: str) -> str:
+        stopwords = self.stopwords
+        return " ".join([word for word in text.split() if word not in stopwords])
+
+    def steaming(self, text: str) -> str:
+        # Sama dengan stemmer.stem(text), tapi hasil per token di-cache
+        text = _RE_NON_ALNUM.sub(" ", text.lower())
+        text = _RE_SPACES.sub(" ", text).strip()
+        stem_word = self._stem_word
+        return " ".join([stem_word(word) for word in text.split(" ")])
+
+    def __call__(self, text: str) -> str:
+        text = self.casefolding(text)
+        text = self.text_normalize(text)
+        text = self.remove_stop_word(text)
+        return self.steaming(text)
+
+    def process_many(self, texts) -> list:
+        """Preprocess banyak pesan sekaligus."""
+        return [self(text) for text in texts]
+
+    def stem_cache_info(self):
+        return self._stem_word.cache_info()
+
+
+@lru_cache(maxsize=None)
+def get_preprocessor() -> TextPreprocessor:
+    """Instance bersama untuk kode di luar Streamlit (training, CLI)."""
+    return TextPreprocessor.from_files()
+
+
+def text_preprocessing_process(text: str) -> str:
+    """Pengganti langsung fungsi dengan nama sama di notebook."""
+    return get_preprocessor()(text)
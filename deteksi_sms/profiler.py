@@ -0,0 +1,74 @@
+"""Sampling profiler untuk proses yang sedang berjalan.
+
+``sample`` mengambil stack semua thread (``sys._current_frames``) setiap
+beberapa milidetik, jadi ikut mencakup sesi Streamlit lain dan thread
+antrian inferensi tanpa perlu memasang profiler sebelumnya. Hasilnya bisa
+diringkas per fungsi (``top_functions``) atau diekspor dalam format
+"collapsed stack" (``collapsed``) untuk flamegraph/speedscope.
+
+cProfile deterministik untuk batch inferensi ada di
+``BatchScheduler.profile``.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+INTERVAL = 0.005
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def sample(seconds: float, interval: float = INTERVAL) -> Counter:
+    """Hitung stack (akar -> daun) semua thread lain selama ``seconds`` detik."""
+    me = threading.get_ident()
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    stacks = Counter()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for ident, frame in sys._current_frames().items():
+            if ident == me:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_name(frame))
+                frame = frame.f_back
+            stack.append(f"thread {names.get(ident, ident)}")
+            stacks[tuple(reversed(stack))] += 1
+        time.sleep(interval)
+    return stacks
+
+
+# Frame yang berarti thread sedang menunggu, bukan bekerja
+IDLE_FUNCTIONS = ("wait (threading.py", "get (queue.py", "select (selectors.py", "_worker (thread.py",
+                  "serve_forever (socketserver.py", "_log_loop (metrics.py")
+
+
+def is_idle(stack: tuple) -> bool:
+    return stack[-1].startswith(IDLE_FUNCTIONS)
+
+
+def top_functions(stacks: Counter, limit: int = 25, include_idle: bool = False) -> list:
+    """Baris (fungsi, sampel sendiri, sampel total) urut sampel total."""
+    own, total = Counter(), Counter()
+    for stack, count in stacks.items():
+        if not include_idle and is_idle(stack):
+            continue
+        own[stack[-1]] += count
+        for name in set(stack[1:]):
+            total[name] += count
+    rows = [(name, own[name], count) for name, count in total.items()]
+    rows.sort(key=lambda row: (-row[2], -row[1]))
+    return rows[:limit]
+
+
+def collapsed(stacks: Counter, include_idle: bool = False) -> str:
+    """Format ``a;b;c jumlah`` per baris (flamegraph.pl / speedscope)."""
+    return "\n".join(
+        f"{';'.join(stack)} {count}" for stack, count in stacks.most_common()
+        if include_idle or not is_idle(stack)
+    ) + "\n"
@@ -0,0 +1,340 @@
+"""Registry model berversi dan hot-reload artefak tanpa restart.
+
+Setiap versi model adalah satu set artefak ringkas (lihat
+``deteksi_sms.artifacts``) di ``Model/registry/vNNNN/`` dengan
+``manifest.json`` berisi induk, asal (``online``, ``train``, ``import``),
+SHA-256 setiap file dan metrik evaluasi. Versi ditulis dulu ke folder
+sementara lalu di-``rename``, jadi folder ``vNNNN`` selalu lengkap.
+Versi aktif ditunjuk oleh ``Model/registry/ACTIVE`` yang diganti secara
+atomik; tanpa penunjuk, versi aktif adalah ``base`` (artefak di ``Model/``).
+
+``HotModel`` memantau penunjuk itu dari thread latar belakang. Versi baru
+dimuat, dicek checksum-nya, di-warm-up dengan beberapa prediksi, lalu
+dipasang dengan satu assignment: request yang sedang berjalan tetap
+memakai model lama sampai selesai dan tidak ada request yang melihat model
+setengah termuat.
+
+Pemakaian:
+
+    python -m deteksi_sms.registry list
+    python -m deteksi_sms.registry publish Model/baru --activate
+    python -m deteksi_sms.registry activate v0003
+    python -m deteksi_sms.registry rollback
+    python -m deteksi_sms.registry verify
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from collections import namedtuple
+
+from deteksi_sms import artifacts, metrics
+from deteksi_sms.explain import Explainer
+
+REGISTRY_DIR = "registry"
+ACTIVE_FILE = "ACTIVE"
+MANIFEST = "manifest.json"
+BASE_VERSION = "base"
+
+# Penunjuk versi aktif dicek ulang (satu ``stat``) sekali per interval ini
+CHECK_INTERVAL = 2.0
+
+# Teks (sudah di-preprocess) untuk warm-up sebelum versi baru dipasang
+WARMUP_TEXTS = (
+    "selamat nomor anda dapat hadiah undi klik link",
+    "promo paket internet kuota murah beli sekarang",
+    "nanti malam kita kumpul di rumah ya",
+)
+
+LoadedModel = namedtuple("LoadedModel", "scorer vectorizer version checksum load_seconds loaded_at explainer")
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _combined(files: dict) -> str:
+    """Checksum satu set artefak dari checksum per file (urut nama)."""
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        digest.update(f"{name}:{files[name]['sha256']}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _describe(model_dir: str) -> dict:
+    files = {
+        os.path.basename(path): {"sha256": file_sha256(path), "bytes": os.path.getsize(path)}
+        for path in artifacts.artifact_files(model_dir)
+    }
+    return {"files": files, "checksum": _combined(files)}
+
+
+class ModelRegistry:
+    """Versi model di ``<model_dir>/registry``; ``base`` adalah artefak di ``model_dir``."""
+
+    def __init__(self, model_dir: str = artifacts.MODEL_DIR):
+        self.model_dir = model_dir
+        self.root = os.path.join(model_dir, REGISTRY_DIR)
+
+    def active(self) -> str:
+        try:
+            with open(os.path.join(self.root, ACTIVE_FILE), "r", encoding="utf-8") as f:
+                return f.read().strip() or BASE_VERSION
+        except FileNotFoundError:
+            return BASE_VERSION
+
+    def path(self, version: str) -> str:
+        return self.model_dir if version == BASE_VERSION else os.path.join(self.root, version)
+
+    def stamp(self):
+        """Penanda murah untuk mendeteksi pergantian versi aktif (mtime penunjuk)."""
+        try:
+            return os.stat(os.path.join(self.root, ACTIVE_FILE)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def manifest(self, version: str) -> dict:
+        if version == BASE_VERSION:
+            # Artefak dasar tidak punya manifest; checksum dihitung dari file-nya
+            return dict(_describe(self.model_dir), version=BASE_VERSION, parent=None, source="base", metrics={})
+        with open(os.path.join(self.root, version, MANIFEST), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def versions(self) -> list:
+        if not os.path.isdir(self.root):
+            return []
+        names = [name for name in os.listdir(self.root) if name.startswith("v") and
+                 os.path.exists(os.path.join(self.root, name, MANIFEST))]
+        return sorted(names)
+
+    def history(self) -> list:
+        return [self.manifest(name) for name in self.versions()]
+
+    def publish(self, scorer, vectorizer, parent: str = None, source: str = "import",
+                metrics: dict = None, **meta) -> str:
+        """Simpan ``scorer`` + ``vectorizer`` sebagai versi baru (belum aktif) dan kembalikan namanya."""
+        os.makedirs(self.root, exist_ok=True)
+        tmp = os.path.join(self.root, f".publish.{os.getpid()}.{threading.get_ident()}.tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        try:
+            artifacts.export_compact(scorer, vectorizer, tmp)
+            manifest = {
+                **meta, **_describe(tmp), "parent": parent or self.active(), "source": source,
+                "metrics": metrics or {}, "format": artifacts.FORMAT_VERSION,
+            }
+            existing = self.versions()
+            number = int(existing[-1][1:]) + 1 if existing else 1
+            while True:
+                version = f"v{number:04d}"
+                manifest.update(version=version, created=time.time())
+                with open(os.path.join(tmp, MANIFEST), "w", encoding="utf-8") as f:
+                    json.dump(manifest, f, indent=1)
+                try:
+                    # rename folder lengkap: pembaca tidak pernah melihat versi setengah jadi
+                    os.rename(tmp, os.path.join(self.root, version))
+                    return version
+                except OSError:
+                    if not os.path.exists(os.path.join(self.root, version)):
+                        raise
+                    number += 1
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def publish_dir(self, source_dir: str, **meta) -> str:
+        """Daftarkan artefak ringkas di ``source_dir`` (mis. hasil ``deteksi_sms.train``)."""
+        scorer, vectorizer = artifacts.load_compact(source_dir)
+        return self.publish(scorer, vectorizer, **meta)
+
+    def verify(self, version: str) -> list:
+        """Nama file artefak ``version`` yang checksum-nya tidak cocok dengan manifest."""
+        if version == BASE_VERSION:
+            return []
+        expected = self.manifest(version)["files"]
+        bad = []
+        for name, entry in expected.items():
+            path = os.path.join(self.path(version), name)
+            if not os.path.exists(path) or file_sha256(path) != entry["sha256"]:
+                bad.append(name)
+        return bad
+
+    def activate(self, version: str) -> None:
+        """Jadikan ``version`` versi aktif (penunjuk ditulis secara atomik)."""
+        bad = self.verify(version)
+        if bad:
+            raise ValueError(f"Checksum artefak {version} tidak cocok: {', '.join(bad)}")
+        os.makedirs(self.root, exist_ok=True)
+        tmp = os.path.join(self.root, f".{ACTIVE_FILE}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(version)
+        os.replace(tmp, os.path.join(self.root, ACTIVE_FILE))
+
+    def rollback(self) -> str:
+        """Kembali ke versi induk dari versi aktif; mengembalikan versi yang kini aktif."""
+        active = self.active()
+        if active == BASE_VERSION:
+            raise ValueError("Versi aktif sudah versi dasar, tidak ada yang bisa di-rollback")
+        parent = self.manifest(active).get("parent") or BASE_VERSION
+        self.activate(parent)
+        return parent
+
+    def load(self, version: str) -> LoadedModel:
+        """Muat, cek checksum dan warm-up ``version``; belum dipasang ke mana pun."""
+        started = time.perf_counter()
+        bad = self.verify(version)
+        if bad:
+            raise ValueError(f"Checksum artefak {version} tidak cocok: {', '.join(bad)}")
+        scorer, vectorizer = artifacts.load_model_and_vectorizer(self.path(version))
+        # Warm-up: sentuh halaman mmap bobot/IDF dan jalur transform sebelum dipakai request
+        scorer.predict(vectorizer.transform(WARMUP_TEXTS))
+        # Array indeks->token dan bobot per kelas untuk penjelasan, dipasang bersama modelnya
+        explainer = Explainer(scorer, vectorizer)
+        checksum = self.manifest(version)["checksum"]
+        elapsed = time.perf_counter() - started
+        metrics.observe("model_load", elapsed)
+        return LoadedModel(scorer, vectorizer, version, checksum, elapsed, time.time(), explainer)
+
+
+class HotModel:
+    """Model + vectorizer versi aktif, diganti di latar belakang saat penunjuk berubah.
+
+    ``get()`` tidak pernah memuat apa pun: hanya membaca satu atribut yang
+    diganti utuh oleh thread pemantau, jadi semua sesi yang memegang objek ini
+    pindah ke versi baru bersamaan. Bila versi baru gagal dimuat (checksum
+    salah, file rusak), model lama tetap dipakai dan galatnya di ``error``.
+    """
+
+    def __init__(self, model_dir: str = artifacts.MODEL_DIR, check_interval: float = CHECK_INTERVAL,
+                 watch: bool = True):
+        self.registry = ModelRegistry(model_dir)
+        self.check_interval = check_interval
+        self.error = None
+        self._lock = threading.Lock()
+        self._stamp = self.registry.stamp()
+        self._loaded = self.registry.load(self.registry.active())
+        self._listeners = []
+        self._stop = threading.Event()
+        if watch:
+            threading.Thread(target=self._watch, name="model-registry-watch", daemon=True).start()
+
+    def _watch(self):
+        while not self._stop.wait(self.check_interval):
+            try:
+                self.refresh()
+            except Exception as exc:  # thread pemantau tidak boleh mati
+                self.error = f"{type(exc).__name__}: {exc}"
+
+    def refresh(self) -> LoadedModel:
+        """Cek penunjuk sekarang dan pasang versi baru bila berubah."""
+        with self._lock:
+            stamp = self.registry.stamp()
+            if stamp != self._stamp:
+                version = self.registry.active()
+                if version != self._loaded.version:
+                    try:
+                        self._loaded = self.registry.load(version)
+                        self.error = None
+                    except Exception as exc:
+                        self.error = f"{version}: {type(exc).__name__}: {exc}"
+                        raise
+                    self._notify(self._loaded)
+                self._stamp = stamp
+        return self._loaded
+
+    def subscribe(self, callback) -> None:
+        """``callback(loaded)`` dipanggil setiap kali versi baru selesai dipasang."""
+        self._listeners.append(callback)
+
+    def _notify(self, loaded: LoadedModel) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(loaded)
+            except Exception as exc:  # pendengar yang gagal tidak boleh membatalkan pergantian
+                self.error = f"listener: {type(exc).__name__}: {exc}"
+
+    def stop(self):
+        self._stop.set()
+
+    def snapshot(self) -> LoadedModel:
+        return self._loaded
+
+    def get(self):
+        """(scorer, vectorizer) versi aktif."""
+        loaded = self._loaded
+        return loaded.scorer, loaded.vectorizer
+
+    @property
+    def version(self) -> str:
+        return self._loaded.version
+
+    @property
+    def load_seconds(self) -> float:
+        return self._loaded.load_seconds
+
+    def checksum(self) -> str:
+        """Checksum artefak yang sedang dipakai (kunci invalidasi cache hasil)."""
+        return self._loaded.checksum
+
+
+def evaluate(scorer, vectorizer, dataset: str = None) -> dict:
+    """Akurasi ``scorer`` pada data uji notebook (lihat ``deteksi_sms.online.holdout_split``)."""
+    from deteksi_sms import online
+    from deteksi_sms.preprocessing import get_preprocessor
+
+    texts, labels = online.holdout_split(dataset or online.DATASET)
+    return {"holdout_accuracy": online.accuracy(scorer, vectorizer, get_preprocessor(), texts, labels)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Registry model berversi")
+    parser.add_argument("command", choices=["list", "publish", "activate", "rollback", "verify"])
+    parser.add_argument("target", nargs="?", help="folder artefak (publish) atau versi (activate/verify)")
+    parser.add_argument("--model-dir", default=artifacts.MODEL_DIR)
+    parser.add_argument("--activate", action="store_true", help="langsung aktifkan versi yang di-publish")
+    parser.add_argument("--no-evaluate", action="store_true", help="jangan hitung akurasi data uji saat publish")
+    args = parser.parse_args()
+
+    registry = ModelRegistry(args.model_dir)
+    if args.command == "list":
+        active = registry.active()
+        for manifest in [registry.manifest(BASE_VERSION)] + registry.history():
+            metrics = ", ".join(f"{k}={v:.4f}" for k, v in manifest["metrics"].items() if isinstance(v, float))
+            marker = "*" if manifest["version"] == active else " "
+            print(f"{marker} {manifest['version']:<6} {manifest['source']:<7} induk={manifest['parent'] or '-':<6} "
+                  f"{manifest['checksum'][:12]}  {metrics}")
+    elif args.command == "publish":
+        if not args.target:
+            parser.error("publish membutuhkan folder artefak")
+        scorer, vectorizer = artifacts.load_compact(args.target)
+        metrics = {} if args.no_evaluate else evaluate(scorer, vectorizer)
+        version = registry.publish(scorer, vectorizer, source="import", metrics=metrics,
+                                   origin=os.path.abspath(args.target))
+        print(f"Versi baru: {version} {metrics}")
+        if args.activate:
+            registry.activate(version)
+            print(f"Versi aktif: {version}")
+    elif args.command == "activate":
+        if not args.target:
+            parser.error("activate membutuhkan nama versi")
+        registry.activate(args.target)
+        print(f"Versi aktif: {args.target}")
+    elif args.command == "rollback":
+        print(f"Versi aktif sekarang: {registry.rollback()}")
+    else:
+        versions = [args.target] if args.target else registry.versions()
+        failed = {version: registry.verify(version) for version in versions}
+        for version, bad in failed.items():
+            print(f"{version}: {'OK' if not bad else 'RUSAK ' + ', '.join(bad)}")
+        if any(failed.values()):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
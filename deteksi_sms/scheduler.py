@@ -0,0 +1,180 @@
+"""Antrian inferensi bersama untuk request deteksi yang datang bersamaan.
+
+Setiap sesi Streamlit (dan setiap request di ``deteksi_sms.service``)
+biasanya hanya membawa satu pesan. Daripada memanggil vectorize+predict
+sendiri-sendiri, request dimasukkan ke satu antrian per proses. Thread
+pekerja mengumpulkan request selama jendela waktu singkat (atau sampai
+``max_batch`` pesan) lalu memprosesnya sebagai satu batch.
+"""
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+
+import numpy as np
+
+from deteksi_sms import metrics
+
+# Bisa diatur lewat environment variable tanpa mengubah kode
+MAX_BATCH = int(os.environ.get("DETEKSI_BATCH_MAX", 256))
+MAX_WAIT_MS = float(os.environ.get("DETEKSI_BATCH_WAIT_MS", 3.0))
+
+# Jumlah batch terakhir yang disimpan untuk statistik ukuran batch dan waktu tunggu
+METRICS_WINDOW = 1_000
+
+
+class BatchScheduler:
+    """Micro-batching berbasis thread untuk ``score_fn(texts) -> (labels, scores, *extra)``.
+
+    ``labels``/``scores`` dipotong per request; ``extra`` (mis. snapshot model
+    yang menghitung batch itu) diteruskan utuh ke setiap request.
+    """
+
+    def __init__(self, score_fn, max_batch: int = MAX_BATCH, max_wait_ms: float = MAX_WAIT_MS):
+        self.score_fn = score_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._batch_sizes = deque(maxlen=METRICS_WINDOW)
+        self._waits = deque(maxlen=METRICS_WINDOW)
+        self._requests = 0
+        self._messages = 0
+        self._batches = 0
+        self._max_queue_depth = 0
+        self._profiler = None
+        self._profile_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="sms-batch-scheduler", daemon=True)
+        self._thread.start()
+
+    def submit(self, texts: list) -> Future:
+        """Masukkan pesan ke antrian; hasilnya Future berisi (labels, scores, *extra)."""
+        future = Future()
+        self._queue.put((list(texts), future, time.perf_counter()))
+        depth = self._queue.qsize()
+        with self._lock:
+            self._requests += 1
+            if depth > self._max_queue_depth:
+                self._max_queue_depth = depth
+        return future
+
+    def classify(self, texts: list, timeout: float = None):
+        """Versi blocking dari ``submit``."""
+        return self.submit(texts).result(timeout)
+
+    def _collect(self):
+        items = [self._queue.get()]
+        size = len(items[0][0])
+        deadline = time.perf_counter() + self.max_wait
+        while size < self.max_batch:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            items.append(item)
+            size += len(item[0])
+        return items
+
+    @staticmethod
+    def _deliver(future: Future, result=None, exc: BaseException = None) -> None:
+        """Isi hasil/exception tanpa pernah mematikan thread pekerja."""
+        try:
+            if exc is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass
+
+    def _run(self):
+        while True:
+            # Future yang sudah dibatalkan (mis. klien HTTP terputus) dibuang;
+            # sisanya ditandai berjalan sehingga tidak bisa dibatalkan lagi
+            items = [item for item in self._collect() if item[1].set_running_or_notify_cancel()]
+            if not items:
+                continue
+            started = time.perf_counter()
+            texts = [text for batch, _, _ in items for text in batch]
+            with self._lock:
+                self._batches += 1
+                self._messages += len(texts)
+                self._batch_sizes.append(len(texts))
+                self._waits.extend(started - enqueued for _, _, enqueued in items)
+            for _, _, enqueued in items:
+                metrics.observe("queue_wait", started - enqueued)
+
+            try:
+                with self._profile_lock:
+                    profiler = self._profiler
+                    if profiler is not None:
+                        profiler.enable()
+                    try:
+                        with metrics.timer("batch"):
+                            labels, scores, *extra = self.score_fn(texts) if texts else ([], [])
+                    finally:
+                        if profiler is not None:
+                            profiler.disable()
+            except Exception as exc:
+                metrics.incr("batch_errors")
+                for _, future, _ in items:
+                    self._deliver(future, exc=exc)
+                continue
+
+            start = 0
+            for batch, future, _ in items:
+                end = start + len(batch)
+                try:
+                    result = (labels[start:end], scores[start:end], *extra)
+                except Exception as exc:
+                    self._deliver(future, exc=exc)
+                else:
+                    self._deliver(future, result)
+                start = end
+
+    def profile(self, seconds: float, limit: int = 30, sort: str = "cumulative") -> str:
+        """cProfile semua batch yang diproses selama ``seconds`` detik (teks ``pstats``).
+
+        Profiler hanya aktif di thread pekerja saat ``score_fn`` berjalan,
+        jadi yang terukur adalah inferensi semua sesi dalam jendela itu.
+        """
+        import cProfile
+        import io
+        import pstats
+
+        profiler = cProfile.Profile()
+        self._profiler = profiler
+        try:
+            time.sleep(seconds)
+        finally:
+            # Tunggu batch yang sedang diprofil selesai sebelum membaca statistiknya
+            with self._profile_lock:
+                self._profiler = None
+        stream = io.StringIO()
+        profiler.create_stats()
+        if not profiler.stats:
+            return ""
+        pstats.Stats(profiler, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+    def metrics(self) -> dict:
+        """Ringkasan ukuran batch, kedalaman antrian dan waktu tunggu."""
+        with self._lock:
+            sizes = np.array(self._batch_sizes, dtype=float)
+            waits = np.array(self._waits, dtype=float) * 1000
+            result = {
+                "requests": self._requests,
+                "messages": self._messages,
+                "batches": self._batches,
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self._max_queue_depth,
+            }
+        result["batch_size_mean"] = float(sizes.mean()) if sizes.size else 0.0
+        result["batch_size_max"] = float(sizes.max()) if sizes.size else 0.0
+        result["wait_ms_p50"] = float(np.percentile(waits, 50)) if waits.size else 0.0
+        result["wait_ms_p95"] = float(np.percentile(waits, 95)) if waits.size else 0.0
+        return result
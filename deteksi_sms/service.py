@@ -0,0 +1,187 @@
+"""Layanan HTTP tanpa UI untuk klasifikasi SMS (machine-to-machine).
+
+Memakai loader model/vectorizer dan preprocessing yang sama dengan
+aplikasi_sms.py, tetapi tanpa rerun script Streamlit. Request yang datang
+bersamaan digabung oleh ``BatchScheduler`` (micro-batching) menjadi satu kali
+vectorize+predict.
+
+    python -m deteksi_sms.service --port 8600
+
+    POST /classify  {"text": "..."}  atau  {"texts": [...]}  atau  ["...", "..."]
+    GET  /health
+    GET  /metrics   (teks Prometheus, lihat ``deteksi_sms.metrics``)
+    GET  /campaigns?min_count=2&limit=100  (kampanye near-duplicate, lihat ``deteksi_sms.campaign``)
+"""
+import argparse
+import asyncio
+import json
+import time
+from functools import lru_cache
+
+import tornado.web
+
+from deteksi_sms import artifacts, campaign, metrics, registry
+from deteksi_sms.batch import LABELS, score_texts
+from deteksi_sms.preprocessing import TextPreprocessor
+from deteksi_sms.scheduler import BatchScheduler
+
+# Batas ukuran satu micro-batch dan waktu tunggu maksimum untuk mengisinya
+MAX_BATCH = 512
+MAX_WAIT_MS = 2.0
+
+# Batas jumlah pesan dalam satu request
+MAX_TEXTS_PER_REQUEST = 10_000
+
+
+@lru_cache(maxsize=None)
+def load_resources(model_dir: str = artifacts.MODEL_DIR):
+    """Model (mengikuti versi aktif registry) dan preprocessor; dimuat sekali per proses."""
+    return registry.HotModel(model_dir), TextPreprocessor.from_files()
+
+
+def _result(label, scores, names) -> dict:
+    label = int(label)
+    return {
+        "label": label,
+        "kategori": LABELS.get(label, str(label)),
+        "scores": {name: float(score) for name, score in zip(names, scores)},
+    }
+
+
+def _parse_texts(body: bytes):
+    """Kembalikan (texts, single) dari body JSON, atau raise ValueError."""
+    payload = json.loads(body or b"null")
+    if isinstance(payload, dict):
+        if "text" in payload:
+            payload = payload["text"]
+        elif "texts" in payload:
+            payload = payload["texts"]
+    if isinstance(payload, str):
+        return [payload], True
+    if isinstance(payload, list) and all(isinstance(text, str) for text in payload):
+        if len(payload) > MAX_TEXTS_PER_REQUEST:
+            raise ValueError(f"Maksimal {MAX_TEXTS_PER_REQUEST} pesan per request")
+        return payload, False
+    raise ValueError('Body harus {"text": "..."}, {"texts": [...]} atau array string')
+
+
+class ClassifyHandler(tornado.web.RequestHandler):
+    def initialize(self, scheduler):
+        self.scheduler = scheduler
+
+    async def post(self):
+        started = time.perf_counter()
+        try:
+            texts, single = _parse_texts(self.request.body)
+        except ValueError as exc:
+            metrics.incr("http_bad_requests")
+            self.set_status(400)
+            self.finish({"error": str(exc)})
+            return
+
+        if texts:
+            labels, scores, loaded = await asyncio.wrap_future(self.scheduler.submit(texts))
+            # Nama skor dari snapshot yang sama dengan yang menghitung batch ini
+            names = loaded.scorer.score_names
+        else:
+            labels, scores, names = [], [], []
+        results = [_result(label, row, names) for label, row in zip(labels, scores)]
+        self.finish(results[0] if single else {"results": results})
+        metrics.observe("http_classify", time.perf_counter() - started)
+
+
+class HealthHandler(tornado.web.RequestHandler):
+    def initialize(self, scheduler, hot, campaigns):
+        self.scheduler = scheduler
+        self.hot = hot
+        self.campaigns = campaigns
+
+    def model_info(self) -> dict:
+        loaded = self.hot.snapshot()
+        return {"version": loaded.version, "checksum": loaded.checksum,
+                "load_seconds": loaded.load_seconds, "error": self.hot.error}
+
+    def get(self):
+        info = {"status": "ok", "model": self.model_info(), "scheduler": self.scheduler.metrics()}
+        if self.campaigns is not None:
+            info["campaigns"] = self.campaigns.stats()
+        self.finish(info)
+
+
+class CampaignsHandler(tornado.web.RequestHandler):
+    def initialize(self, campaigns):
+        self.campaigns = campaigns
+
+    def get(self):
+        if self.campaigns is None:
+            self.set_status(404)
+            self.finish({"error": "Indeks kampanye tidak aktif (DETEKSI_CAMPAIGN=0)"})
+            return
+        try:
+            min_count = int(self.get_argument("min_count", "2"))
+            limit = int(self.get_argument("limit", "100"))
+        except ValueError:
+            self.set_status(400)
+            self.finish({"error": "min_count dan limit harus bilangan bulat"})
+            return
+        rows = self.campaigns.campaigns(min_count, limit)
+        for row in rows:
+            row["kategori"] = LABELS.get(row["label"], str(row["label"]))
+        self.finish({"stats": self.campaigns.stats(), "campaigns": rows})
+
+
+class MetricsHandler(tornado.web.RequestHandler):
+    def get(self):
+        self.set_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.finish(metrics.prometheus_text())
+
+
+def make_app(model_dir: str = artifacts.MODEL_DIR, max_batch: int = MAX_BATCH,
+             max_wait_ms: float = MAX_WAIT_MS):
+    hot, preprocessor = load_resources(model_dir)
+    campaigns = None
+    if campaign.ENABLED:
+        campaigns = campaign.CampaignIndex(preprocessor.casefolding, hot.checksum())
+        hot.subscribe(lambda loaded: campaigns.invalidate(loaded.checksum))
+
+    def score_fn(texts):
+        # Snapshot diambil per batch dan ikut dikembalikan (lihat ``BatchScheduler``)
+        loaded = hot.snapshot()
+        labels, scores = score_texts(texts, preprocessor, loaded.vectorizer, loaded.scorer,
+                                     campaigns=campaigns, checksum=loaded.checksum)
+        return labels, scores, loaded
+
+    scheduler = BatchScheduler(score_fn, max_batch, max_wait_ms)
+    return tornado.web.Application([
+        (r"/classify", ClassifyHandler, {"scheduler": scheduler}),
+        (r"/health", HealthHandler, {"scheduler": scheduler, "hot": hot, "campaigns": campaigns}),
+        (r"/campaigns", CampaignsHandler, {"campaigns": campaigns}),
+        (r"/metrics", MetricsHandler),
+    ])
+
+
+async def serve(host: str, port: int, **kwargs):
+    app = make_app(**kwargs)
+    app.listen(port, address=host)
+    # /metrics sudah disajikan aplikasi ini; exporter hanya untuk log terstruktur
+    metrics.start_exporter(port=0)
+    print(f"Layanan klasifikasi SMS berjalan di http://{host}:{port}/classify")
+    await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Layanan HTTP klasifikasi SMS")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--model-dir", default=artifacts.MODEL_DIR)
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH)
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS)
+    args = parser.parse_args()
+    asyncio.run(serve(
+        args.host, args.port,
+        model_dir=args.model_dir, max_batch=args.max_batch, max_wait_ms=args.max_wait_ms,
+    ))
+
+
+if __name__ == "__main__":
+    main()
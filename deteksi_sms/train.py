@@ -0,0 +1,372 @@
+"""Pipeline training offline yang streaming dan paralel.
+
+Pengganti langkah notebook (``apply`` satu core -> DataFrame TF-IDF dense ->
+``SelectKBest(chi2)`` -> ``SVC``) untuk korpus berukuran jutaan pesan.
+Semua langkah membaca data per chunk, sehingga memori puncak mengikuti
+ukuran chunk, bukan ukuran korpus:
+
+1. CSV dibaca per chunk dan sebagian baris disisihkan sebagai data uji;
+   preprocessing + hitung document frequency (DF, hanya baris train supaya
+   data uji tidak bocor ke IDF) berjalan di process pool. Hasilnya ditulis
+   ke file kerja train dan file uji di disk.
+2. Baris train diacak ke shard berukuran ~``chunksize`` baris (shuffle
+   eksternal, shard yang terlalu besar dipecah lagi).
+3. IDF dihitung dari DF; statistik chi2 diakumulasi per kelas dari matriks
+   TF-IDF sparse per chunk, lalu ``k`` fitur terbaik dipilih (sama dengan
+   ``SelectKBest(chi2, k)``).
+4. SVM linear (``SGDClassifier`` hinge loss) dilatih dengan ``partial_fit``
+   per shard selama beberapa epoch, lalu dievaluasi pada data uji.
+5. Model, vocabulary dan IDF ditulis dalam format ringkas
+   ``deteksi_sms.artifacts`` yang dimuat ``load_model_and_vectorizer``.
+
+Pemakaian:
+
+    python -m deteksi_sms.train Dataset/dataset_spam_sms.csv --out Model/baru
+    python -m deteksi_sms.train Dataset/dataset_spam_sms.csv --out Model/baru --publish --activate
+"""
+import argparse
+import csv
+import math
+import os
+import tempfile
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from deteksi_sms import artifacts
+from deteksi_sms.preprocessing import KEY_NORM_FILE, TextPreprocessor
+
+CHUNK_SIZE = 10_000
+K_FEATURES = 3000
+
+# Parameter TF-IDF yang dipakai notebook (TfidfVectorizer default + decode_error)
+TFIDF_KWARGS = {"decode_error": "replace"}
+
+# Batas jumlah file shard yang dibuka bersamaan saat shuffle eksternal
+MAX_SHARDS = 512
+
+# Shard lebih besar dari ini (x chunksize) dipecah lagi, supaya train_sgd tetap per chunk
+MAX_SHARD_CHUNKS = 2
+
+_worker_preprocessor = None
+_worker_analyzer = None
+
+
+def _init_worker(key_norm_path: str) -> None:
+    global _worker_preprocessor, _worker_analyzer
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    _worker_preprocessor = TextPreprocessor.from_files(key_norm_path)
+    _worker_analyzer = TfidfVectorizer(**TFIDF_KWARGS).build_analyzer()
+
+
+def _preprocess_chunk(item):
+    """Dijalankan di proses pekerja: teks bersih + DF token baris train chunk ini."""
+    texts, is_test = item
+    clean = _worker_preprocessor.process_many(texts)
+    df = Counter()
+    for text, test in zip(clean, is_test.tolist()):
+        if not test:
+            df.update(set(_worker_analyzer(text)))
+    return clean, df
+
+
+def ordered_map(pool, fn, iterable, max_pending: int):
+    """Seperti ``pool.map`` tapi hanya ``max_pending`` tugas yang berjalan/menunggu.
+
+    ``Executor.map`` mengirim seluruh input sekaligus, sehingga memori
+    mengikuti ukuran input; di sini input dibaca sesuai kecepatan pekerja.
+    Urutan hasil sama dengan urutan input.
+    """
+    pending = deque()
+    for item in iterable:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _iter_labeled_chunks(path: str, text_column: str, label_column: str, chunksize: int):
+    reader = pd.read_csv(path, usecols=[text_column, label_column], chunksize=chunksize)
+    for chunk in reader:
+        chunk = chunk.dropna(subset=[label_column])
+        yield chunk[text_column].fillna("").astype(str).tolist(), chunk[label_column].astype(int).to_numpy()
+
+
+def _read_work_file(path: str, chunksize: int):
+    """Baca file kerja (clean_text, label) per chunk."""
+    reader = pd.read_csv(path, chunksize=chunksize, keep_default_na=False, dtype={"clean_text": str})
+    for chunk in reader:
+        yield chunk["clean_text"].tolist(), chunk["label"].to_numpy()
+
+
+def preprocess_corpus(path: str, work_path: str, test_path: str, text_column: str, label_column: str,
+                      chunksize: int, workers: int, holdout: float, seed: int,
+                      key_norm_path: str = KEY_NORM_FILE):
+    """Langkah 1: pisahkan data uji, preprocessing paralel, tulis (clean_text, label).
+
+    Baris train ke ``work_path``, baris uji ke ``test_path``. DF hanya dihitung
+    dari baris train. Mengembalikan (jumlah dokumen train, jumlah dokumen uji,
+    Counter DF, Counter jumlah pesan per kelas).
+    """
+    chunks = _iter_labeled_chunks(path, text_column, label_column, chunksize)
+    rng = np.random.default_rng(seed)
+    pending = deque()
+
+    def split_chunks():
+        for texts, labels in chunks:
+            is_test = rng.random(len(texts)) < holdout
+            pending.append((labels, is_test))
+            yield texts, is_test
+
+    n_train, n_test, df, class_counts = 0, 0, Counter(), Counter()
+    with open(work_path, "w", encoding="utf-8", newline="") as out, \
+            open(test_path, "w", encoding="utf-8", newline="") as test_out, \
+            ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(key_norm_path,)) as pool:
+        writers = [csv.writer(out), csv.writer(test_out)]
+        for writer in writers:
+            writer.writerow(["clean_text", "label"])
+        for clean, chunk_df in ordered_map(pool, _preprocess_chunk, split_chunks(), max_pending=2 * workers):
+            labels, is_test = pending.popleft()
+            for text, label, test in zip(clean, labels.tolist(), is_test.tolist()):
+                writers[test].writerow((text, label))
+            df.update(chunk_df)
+            class_counts.update(labels.tolist())
+            n_test += int(is_test.sum())
+            n_train += len(clean) - int(is_test.sum())
+            print(f"  preprocessing: {n_train + n_test:,} pesan", end="\r", flush=True)
+    print()
+    return n_train, n_test, df, class_counts
+
+
+def _scatter(source: str, paths: list, chunksize: int, rng) -> np.ndarray:
+    """Tulis setiap baris ``source`` ke salah satu ``paths`` secara acak; jumlah baris per file."""
+    counts = np.zeros(len(paths), dtype=np.int64)
+    files = [open(p, "w", encoding="utf-8", newline="") for p in paths]
+    try:
+        writers = [csv.writer(f) for f in files]
+        for w in writers:
+            w.writerow(["clean_text", "label"])
+        for texts, labels in _read_work_file(source, chunksize):
+            shard = rng.integers(0, len(paths), len(texts))
+            counts += np.bincount(shard, minlength=len(paths))
+            for text, label, s in zip(texts, labels.tolist(), shard.tolist()):
+                writers[s].writerow((text, label))
+    finally:
+        for f in files:
+            f.close()
+    return counts
+
+
+def shuffle_to_shards(work_path: str, shard_dir: str, n_docs: int, chunksize: int, seed: int) -> list:
+    """Langkah 2: acak baris train ke shard berisi paling banyak ~``MAX_SHARD_CHUNKS`` chunk.
+
+    Paling banyak ``MAX_SHARDS`` file dibuka sekaligus; shard yang karena batas
+    itu menjadi terlalu besar diacak lagi ke sub-shard, sehingga memori
+    ``train_sgd`` tetap mengikuti ``chunksize`` berapa pun ukuran korpus.
+    """
+    rng = np.random.default_rng(seed)
+    n_shards = min(MAX_SHARDS, max(1, math.ceil(n_docs / chunksize)))
+    paths = [os.path.join(shard_dir, f"train-{i:04d}.csv") for i in range(n_shards)]
+    pending = list(zip(paths, _scatter(work_path, paths, chunksize, rng).tolist()))
+    shards = []
+    while pending:
+        path, rows = pending.pop()
+        if rows <= MAX_SHARD_CHUNKS * chunksize:
+            shards.append(path)
+            continue
+        parts = [f"{path[:-4]}-{j:04d}.csv" for j in range(min(MAX_SHARDS, math.ceil(rows / chunksize)))]
+        counts = _scatter(path, parts, chunksize, rng)
+        os.remove(path)
+        pending.extend(zip(parts, counts.tolist()))
+    return sorted(shards)
+
+
+def compute_idf(df: Counter, n_docs: int, min_df: int = 1):
+    """Vocabulary terurut + IDF (rumus ``smooth_idf=True`` TfidfVectorizer)."""
+    terms = sorted(term for term, count in df.items() if count >= min_df)
+    counts = np.array([df[term] for term in terms], dtype=np.float64)
+    idf = np.log((1 + n_docs) / (1 + counts)) + 1
+    return {term: i for i, term in enumerate(terms)}, idf
+
+
+def make_vectorizer(vocabulary: dict, idf):
+    """TfidfVectorizer dengan vocabulary dan IDF tetap (tanpa fit)."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer(vocabulary=vocabulary, **TFIDF_KWARGS)
+    vectorizer.idf_ = np.asarray(idf, dtype=np.float64)
+    return vectorizer
+
+
+def chi2_scores(shards: list, vectorizer, classes, chunksize: int):
+    """Langkah 3: skor chi2 dari jumlah TF-IDF per kelas, diakumulasi per chunk.
+
+    Rumusnya sama dengan ``sklearn.feature_selection.chi2``: observed adalah
+    jumlah nilai fitur per kelas, expected = proporsi kelas x jumlah total fitur.
+    """
+    n_features = len(vectorizer.vocabulary)
+    observed = np.zeros((len(classes), n_features))
+    class_counts = np.zeros(len(classes))
+    class_index = {label: i for i, label in enumerate(classes)}
+    for path in shards:
+        for texts, labels in _read_work_file(path, chunksize):
+            X = vectorizer.transform(texts)
+            rows = np.array([class_index[label] for label in labels.tolist()], dtype=np.intp)
+            for i in range(len(classes)):
+                mask = rows == i
+                if mask.any():
+                    observed[i] += np.asarray(X[mask].sum(axis=0)).ravel()
+            class_counts += np.bincount(rows, minlength=len(classes))
+
+    feature_count = observed.sum(axis=0)
+    expected = np.outer(class_counts / class_counts.sum(), feature_count)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = ((observed - expected) ** 2 / expected).sum(axis=0)
+    return scores
+
+
+def select_k_best(scores, k: int):
+    """Indeks fitur terpilih, dengan aturan seri yang sama seperti ``SelectKBest``."""
+    if k >= len(scores):
+        return np.arange(len(scores))
+    scores = np.where(np.isnan(scores), np.finfo(scores.dtype).min, scores)
+    return np.sort(np.argsort(scores, kind="mergesort")[-k:])
+
+
+def train_sgd(shards: list, vectorizer, classes, epochs: int, alpha: float, seed: int):
+    """Langkah 4: SVM linear dengan ``partial_fit`` per shard (shard diacak per epoch)."""
+    from sklearn.linear_model import SGDClassifier
+
+    model = SGDClassifier(loss="hinge", alpha=alpha, random_state=seed)
+    rng = np.random.default_rng(seed)
+    for epoch in range(epochs):
+        for shard in rng.permutation(len(shards)):
+            data = pd.read_csv(shards[shard], keep_default_na=False, dtype={"clean_text": str})
+            if data.empty:
+                continue
+            order = rng.permutation(len(data))
+            X = vectorizer.transform(data["clean_text"].to_numpy()[order])
+            model.partial_fit(X, data["label"].to_numpy()[order], classes=classes)
+        print(f"  epoch {epoch + 1}/{epochs} selesai")
+    return model
+
+
+def evaluate(scorer, vectorizer, test_path: str, classes, chunksize: int):
+    """Akurasi + confusion matrix pada data uji, dihitung per chunk."""
+    class_index = {label: i for i, label in enumerate(classes)}
+    confusion = np.zeros((len(classes), len(classes)), dtype=np.int64)
+    for texts, labels in _read_work_file(test_path, chunksize):
+        predicted = scorer.predict(vectorizer.transform(texts))
+        for true, pred in zip(labels.tolist(), predicted.tolist()):
+            confusion[class_index[true], class_index[pred]] += 1
+    total = confusion.sum()
+    accuracy = float(np.trace(confusion) / total) if total else float("nan")
+    return accuracy, confusion
+
+
+def train(path: str, out_dir: str, text_column: str = "teks", label_column: str = "label",
+          chunksize: int = CHUNK_SIZE, workers: int = None, k: int = K_FEATURES, epochs: int = 5,
+          alpha: float = 1e-4, holdout: float = 0.2, seed: int = 0, min_df: int = 1,
+          key_norm_path: str = KEY_NORM_FILE, work_dir: str = None) -> dict:
+    """Jalankan seluruh pipeline dan tulis artefak ringkas ke ``out_dir``."""
+    from deteksi_sms.inference import LinearSVCScorer
+
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory(dir=work_dir, prefix="train-sms-") as tmp:
+        print(f"[1/5] Preprocessing {path} ({workers} proses, chunk {chunksize:,}, data uji {holdout:.0%})")
+        work_path, test_path = os.path.join(tmp, "clean.csv"), os.path.join(tmp, "test.csv")
+        n_train, n_test, df, class_counts = preprocess_corpus(
+            path, work_path, test_path, text_column, label_column, chunksize, workers, holdout, seed,
+            key_norm_path,
+        )
+        n_docs = n_train + n_test
+        classes = np.array(sorted(class_counts))
+        print(f"      {n_docs:,} pesan ({n_test:,} uji), {len(df):,} token unik di data train, "
+              f"kelas {dict(sorted(class_counts.items()))}")
+
+        print("[2/5] Shuffle data train ke shard")
+        shards = shuffle_to_shards(work_path, tmp, n_train, chunksize, seed)
+        os.remove(work_path)
+
+        print(f"[3/5] IDF + chi2 (k={k:,})")
+        vocabulary, idf = compute_idf(df, n_train, min_df)
+        del df
+        scores = chi2_scores(shards, make_vectorizer(vocabulary, idf), classes, chunksize)
+        selected = select_k_best(scores, k)
+        terms = sorted(vocabulary, key=vocabulary.get)
+        selected_vocab = {terms[i]: n for n, i in enumerate(selected)}
+        vectorizer = make_vectorizer(selected_vocab, idf[selected])
+        print(f"      {len(selected_vocab):,} fitur terpilih dari {len(vocabulary):,}")
+
+        print(f"[4/5] Training SGDClassifier (hinge, {epochs} epoch)")
+        scorer = LinearSVCScorer.from_linear(train_sgd(shards, vectorizer, classes, epochs, alpha, seed))
+        accuracy, confusion = evaluate(scorer, vectorizer, test_path, classes, chunksize)
+        print(f"      akurasi data uji: {accuracy:.4f}")
+        print(pd.DataFrame(confusion, index=classes, columns=classes).to_string())
+
+    print(f"[5/5] Menulis artefak ke {out_dir}")
+    os.makedirs(out_dir, exist_ok=True)
+    artifacts.export_compact(scorer, vectorizer, out_dir)
+    print(f"Selesai dalam {time.perf_counter() - started:.1f} detik")
+    return {
+        "n_docs": n_docs,
+        "n_features": len(selected_vocab),
+        "accuracy": accuracy,
+        "confusion": confusion.tolist(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Training model deteksi SMS secara streaming")
+    parser.add_argument("dataset", help="CSV berlabel (kolom teks dan label)")
+    parser.add_argument("--out", required=True,
+                        help="folder tujuan artefak ringkas (bukan folder artefak dasar; pakai --publish)")
+    parser.add_argument("--text-column", default="teks")
+    parser.add_argument("--label-column", default="label")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=None, help="jumlah proses preprocessing")
+    parser.add_argument("--k", type=int, default=K_FEATURES, help="jumlah fitur chi2 terbaik")
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--alpha", type=float, default=1e-4, help="regularisasi SGDClassifier")
+    parser.add_argument("--holdout", type=float, default=0.2, help="proporsi data uji")
+    parser.add_argument("--min-df", type=int, default=1, help="buang token dengan DF lebih kecil")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--key-norm", default=KEY_NORM_FILE)
+    parser.add_argument("--work-dir", default=None, help="folder file sementara (default: temp sistem)")
+    parser.add_argument("--publish", action="store_true", help="daftarkan hasilnya sebagai versi baru di registry model")
+    parser.add_argument("--activate", action="store_true", help="aktifkan versi yang di-publish (dengan --publish)")
+    parser.add_argument("--registry", default=artifacts.MODEL_DIR, help="folder model yang memuat registry")
+    args = parser.parse_args()
+
+    from deteksi_sms.registry import ModelRegistry
+
+    registry = ModelRegistry(args.registry)
+    out = os.path.realpath(args.out)
+    root = os.path.realpath(registry.root)
+    # Artefak dasar dan semua versi di registry (beserta checksum manifest-nya) tidak boleh ditimpa
+    if out == os.path.realpath(args.registry) or os.path.commonpath([out, root]) == root:
+        parser.error("--out tidak boleh menimpa artefak dasar atau versi di registry; "
+                     "tulis ke folder lain lalu --publish")
+
+    report = train(args.dataset, args.out, args.text_column, args.label_column, args.chunksize, args.workers,
+                   args.k, args.epochs, args.alpha, args.holdout, args.seed, args.min_df, args.key_norm,
+                   args.work_dir)
+    if args.publish:
+        version = registry.publish_dir(
+            args.out, source="train", dataset=os.path.abspath(args.dataset), n_docs=report["n_docs"],
+            metrics={"accuracy": report["accuracy"]},
+        )
+        print(f"Terdaftar di registry sebagai {version}")
+        if args.activate:
+            registry.activate(version)
+            print(f"Versi aktif: {version}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Penyimpanan akun pengguna untuk halaman login.
+
+``UserStore`` adalah antarmuka yang dipakai aplikasi_sms.py. Implementasi
+bawaan adalah ``SQLiteUserStore`` (kolom username ter-index sebagai primary
+key, mode WAL, update atomik per baris). ``JsonUserStore`` tetap tersedia
+untuk format lama ``Model/users.json``; data di file itu dimigrasikan
+sekali ke SQLite saat store pertama kali dibuka.
+
+Backend dipilih lewat environment variable ``DETEKSI_USER_STORE``:
+``sqlite:Model/users.db`` (default) atau ``json:Model/users.json``.
+"""
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+
+USERS_JSON = "Model/users.json"
+USERS_DB = "Model/users.db"
+DEFAULT_STORE = f"sqlite:{USERS_DB}"
+
+
+class UserStore(ABC):
+    """Antarmuka store akun: username -> hash password.
+
+    Backend yang belum mengimplementasikan semua method abstrak gagal saat
+    dibuat (``TypeError``), bukan saat login pertama.
+    """
+
+    @abstractmethod
+    def get_hash(self, username: str):
+        """Hash password milik ``username``, atau ``None`` bila tidak terdaftar."""
+
+    @abstractmethod
+    def create_user(self, username: str, pw_hash: str) -> bool:
+        """Tambah akun baru; ``False`` bila username sudah dipakai."""
+
+    @abstractmethod
+    def set_hash(self, username: str, pw_hash: str, expected: str = None) -> bool:
+        """Ganti hash password; bila ``expected`` diberikan, hanya jika hash lama masih sama."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Jumlah akun terdaftar."""
+
+    def seed(self, users: dict, hash_fn=None) -> None:
+        """Tambahkan akun bawaan yang belum ada.
+
+        ``users`` berisi ``{username: hash}``, atau ``{username: password}``
+        bila ``hash_fn`` diberikan; hash hanya dihitung untuk akun yang belum ada.
+        """
+        for username, value in users.items():
+            if self.get_hash(username) is None:
+                self.create_user(username, hash_fn(value) if hash_fn else value)
+
+
+class JsonUserStore(UserStore):
+    """Store format lama (satu file JSON).
+
+    Membaca tidak pernah menulis; file hanya dibaca ulang bila mtime berubah
+    dan ditulis secara atomik (file sementara + ``os.replace``).
+    """
+
+    def __init__(self, path: str = USERS_JSON):
+        self.path = path
+        self._lock = threading.Lock()
+        self._users = {}
+        self._mtime = None
+
+    def _read(self) -> dict:
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        if mtime != self._mtime:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._users = (json.load(f) or {}).get("users", {})
+            except (OSError, ValueError):
+                self._users = {}
+            self._mtime = mtime
+        return self._users
+
+    def _write(self, users: dict) -> None:
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"users": users}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def get_hash(self, username: str):
+        with self._lock:
+            return self._read().get(username)
+
+    def create_user(self, username: str, pw_hash: str) -> bool:
+        with self._lock:
+            users = dict(self._read())
+            if username in users:
+                return False
+            users[username] = pw_hash
+            self._write(users)
+            return True
+
+    def set_hash(self, username: str, pw_hash: str, expected: str = None) -> bool:
+        with self._lock:
+            users = dict(self._read())
+            if username not in users or (expected is not None and users[username] != expected):
+                return False
+            users[username] = pw_hash
+            self._write(users)
+            return True
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._read())
+
+    def items(self) -> dict:
+        with self._lock:
+            return dict(self._read())
+
+
+class SQLiteUserStore(UserStore):
+    """Store SQLite: lookup per username lewat primary key, tanpa menulis saat membaca."""
+
+    def __init__(self, path: str = USERS_DB):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._local = threading.local()
+        with self._conn() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS users ("
+                " username TEXT PRIMARY KEY, pw_hash TEXT NOT NULL,"
+                " created_at REAL NOT NULL, updated_at REAL NOT NULL) WITHOUT ROWID"
+            )
+            db.execute("CREATE TABLE IF NOT EXISTS migrations (name TEXT PRIMARY KEY, applied_at REAL NOT NULL)")
+
+    def _conn(self) -> sqlite3.Connection:
+        # Satu koneksi per thread (Streamlit menjalankan setiap sesi di thread sendiri)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get_hash(self, username: str):
+        row = self._conn().execute("SELECT pw_hash FROM users WHERE username = ?", (username,)).fetchone()
+        return row[0] if row else None
+
+    def create_user(self, username: str, pw_hash: str) -> bool:
+        now = time.time()
+        with self._conn() as db:
+            cur = db.execute(
+                "INSERT OR IGNORE INTO users (username, pw_hash, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                (username, pw_hash, now, now),
+            )
+        return cur.rowcount == 1
+
+    def set_hash(self, username: str, pw_hash: str, expected: str = None) -> bool:
+        with self._conn() as db:
+            if expected is None:
+                cur = db.execute(
+                    "UPDATE users SET pw_hash = ?, updated_at = ? WHERE username = ?",
+                    (pw_hash, time.time(), username),
+                )
+            else:
+                cur = db.execute(
+                    "UPDATE users SET pw_hash = ?, updated_at = ? WHERE username = ? AND pw_hash = ?",
+                    (pw_hash, time.time(), username, expected),
+                )
+        return cur.rowcount == 1
+
+    def count(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def migrate_from_json(self, json_path: str = USERS_JSON) -> int:
+        """Salin akun dari users.json sekali saja; mengembalikan jumlah akun yang disalin."""
+        name = f"json:{os.path.abspath(json_path)}"
+        db = self._conn()
+        if db.execute("SELECT 1 FROM migrations WHERE name = ?", (name,)).fetchone():
+            return 0
+        users = JsonUserStore(json_path).items()
+        now = time.time()
+        with db:
+            cur = db.executemany(
+                "INSERT OR IGNORE INTO users (username, pw_hash, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                [(username, pw_hash, now, now) for username, pw_hash in users.items()],
+            )
+            db.execute("INSERT OR IGNORE INTO migrations (name, applied_at) VALUES (?, ?)", (name, now))
+        return max(cur.rowcount, 0)
+
+
+def open_user_store(spec: str = None, defaults: dict = None, hash_fn=None) -> UserStore:
+    """Buka store sesuai ``spec`` (``sqlite:<path>`` atau ``json:<path>``).
+
+    Store SQLite otomatis mengambil akun dari users.json (sekali) dan akun
+    bawaan ``defaults`` yang belum ada (lihat ``UserStore.seed``).
+    """
+    spec = spec or os.environ.get("DETEKSI_USER_STORE", DEFAULT_STORE)
+    backend, _, path = spec.partition(":")
+    if backend == "json":
+        store = JsonUserStore(path or USERS_JSON)
+    elif backend == "sqlite":
+        store = SQLiteUserStore(path or USERS_DB)
+        store.migrate_from_json(USERS_JSON)
+    else:
+        raise ValueError(f"Backend user store tidak dikenal: {backend}")
+    if defaults:
+        store.seed(defaults, hash_fn)
+    return store
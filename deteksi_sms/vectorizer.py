@@ -0,0 +1,155 @@
+"""TF-IDF dengan vocabulary berupa tabel string terurut yang di-mmap.
+
+``TfidfVectorizer`` menyimpan vocabulary sebagai dict Python, jadi setiap
+proses pekerja (sesi Streamlit, layanan, pool ``ingest``) membangun salinan
+dict-nya sendiri dan memori naik sebanding jumlah pekerja. Di sini
+vocabulary disimpan sebagai dua array ``.npy`` yang dimuat dengan
+``mmap_mode='r'``:
+
+- ``model_fraud.vocab.npy``: term terurut, dtype unicode lebar tetap
+  (``<U{n}``), dicari dengan ``np.searchsorted`` untuk satu batch sekaligus;
+- ``model_fraud.columns.npy``: indeks kolom fitur setiap term (int32).
+
+Bersama bobot dan IDF (sudah ``.npy`` mmap), semua array model hanya ada
+sekali di page cache dan dipakai bersama oleh semua proses. Hasil
+``transform`` identik dengan ``TfidfVectorizer`` (tokenisasi, urutan indeks
+dan urutan operasi floating point yang sama); diperiksa oleh
+``python -m deteksi_sms.artifacts verify``.
+"""
+import os
+import re
+from itertools import chain
+
+import numpy as np
+import scipy.sparse as sp
+
+VOCAB_TABLE = "model_fraud.vocab.npy"
+VOCAB_COLUMNS = "model_fraud.columns.npy"
+
+# 0 = selalu pakai TfidfVectorizer sklearn (dict vocabulary per proses)
+ENABLED = os.environ.get("DETEKSI_SHARED_VECTORIZER", "1") != "0"
+
+# Hanya parameter ini yang didukung; selain itu pakai TfidfVectorizer sklearn
+SUPPORTED = {"analyzer": "word", "ngram_range": (1, 1)}
+
+
+def vocabulary_arrays(vectorizer):
+    """(tabel term terurut, kolom per term) dari vectorizer sklearn atau shared."""
+    if isinstance(vectorizer, SharedTfidfVectorizer):
+        # Salinan, bukan view mmap: file tujuan bisa sama dengan sumbernya
+        return np.array(vectorizer.table), np.array(vectorizer.columns)
+    vocabulary = getattr(vectorizer, "vocabulary_", None) or vectorizer.vocabulary
+    terms = sorted(vocabulary)
+    width = max(1, max(map(len, terms), default=1))
+    table = np.array(terms, dtype=f"<U{width}")
+    columns = np.array([vocabulary[term] for term in terms], dtype=np.int32)
+    return table, columns
+
+
+def load_vocabulary(model_dir: str):
+    """(tabel, kolom) sebagai array mmap read-only."""
+    table = np.load(os.path.join(model_dir, VOCAB_TABLE), mmap_mode="r")
+    columns = np.load(os.path.join(model_dir, VOCAB_COLUMNS), mmap_mode="r")
+    return table, columns
+
+
+def supports(params: dict) -> bool:
+    return all(tuple(params[key]) == value if key == "ngram_range" else params[key] == value
+               for key, value in SUPPORTED.items())
+
+
+class SharedTfidfVectorizer:
+    """Pengganti ``TfidfVectorizer.transform`` di atas vocabulary/IDF mmap.
+
+    Tidak ada dict per proses: token satu batch dicari sekaligus di tabel
+    terurut. ``vocabulary`` (dict) masih tersedia untuk kode verifikasi dan
+    ekspor, tapi dibangun hanya bila diminta.
+    """
+
+    def __init__(self, table, columns, idf, params: dict):
+        if not supports(params):
+            raise ValueError(f"Parameter TF-IDF tidak didukung: {params}")
+        self.table = table
+        self.columns = columns
+        self.idf_ = idf
+        self.params = dict(params, ngram_range=tuple(params["ngram_range"]))
+        self._findall = re.compile(params["token_pattern"]).findall
+        self._width = table.dtype.itemsize // np.dtype("<U1").itemsize
+        # Vocabulary hasil fit sklearn/train.py urut abjad, jadi kolom = posisi di tabel
+        self._identity = bool(np.array_equal(columns, np.arange(len(columns))))
+
+    @classmethod
+    def load(cls, model_dir: str, idf, params: dict):
+        table, columns = load_vocabulary(model_dir)
+        return cls(table, columns, idf, params)
+
+    @property
+    def n_features(self) -> int:
+        return len(self.table)
+
+    @property
+    def vocabulary(self) -> dict:
+        return dict(zip(self.table.tolist(), self.columns.tolist()))
+
+    vocabulary_ = vocabulary
+
+    def get_params(self, deep: bool = True) -> dict:
+        return dict(self.params)
+
+    def get_feature_names_out(self):
+        """Term per indeks kolom (array mmap itu sendiri bila kolom = posisi)."""
+        if self._identity:
+            return self.table
+        return np.asarray(self.table)[np.argsort(self.columns)]
+
+    def _counts(self, docs: list):
+        """Matriks jumlah token CSR, sama dengan ``CountVectorizer.transform``."""
+        lowercase = self.params["lowercase"]
+        decode_error = self.params["decode_error"]
+        tokens = []
+        for doc in docs:
+            if isinstance(doc, bytes):
+                doc = doc.decode("utf-8", decode_error)
+            tokens.append(self._findall(doc.lower() if lowercase else doc))
+        lengths = np.fromiter(map(len, tokens), dtype=np.intp, count=len(tokens))
+        flat = list(chain.from_iterable(tokens))
+
+        n_docs, n_features = len(docs), self.n_features
+        if flat:
+            queries = np.array(flat, dtype=self.table.dtype)
+            positions = np.searchsorted(self.table, queries)
+            positions[positions == n_features] = 0
+            # Token lebih panjang dari lebar tabel terpotong saat dikonversi, jadi pasti tidak ada
+            fits = np.fromiter(map(len, flat), dtype=np.intp, count=len(flat)) <= self._width
+            found = (np.asarray(self.table[positions]) == queries) & fits
+            rows = np.repeat(np.arange(n_docs), lengths)[found]
+            columns = positions[found] if self._identity else np.asarray(self.columns)[positions[found]]
+            keys, counts = np.unique(rows.astype(np.int64) * n_features + columns, return_counts=True)
+        else:
+            keys = counts = np.empty(0, dtype=np.int64)
+        indptr = np.zeros(n_docs + 1, dtype=np.int32)
+        np.cumsum(np.bincount(keys // n_features, minlength=n_docs), out=indptr[1:])
+        return sp.csr_matrix(
+            (counts.astype(np.float64), (keys % n_features).astype(np.int32), indptr),
+            shape=(n_docs, n_features),
+        )
+
+    def transform(self, raw_documents):
+        """Matriks TF-IDF CSR float64, identik dengan ``TfidfVectorizer.transform``."""
+        X = self._counts(list(raw_documents))
+        if self.params["sublinear_tf"]:
+            np.log(X.data, X.data)
+            X.data += 1.0
+        if self.params["use_idf"]:
+            X.data *= self.idf_[X.indices]
+        norm = self.params["norm"]
+        if norm is not None:
+            # Jumlah per baris berurutan seperti normalize() sklearn (bincount menjumlah sesuai urutan data)
+            values = X.data * X.data if norm == "l2" else np.abs(X.data)
+            rows = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))
+            totals = np.bincount(rows, weights=values, minlength=X.shape[0])
+            if norm == "l2":
+                totals = np.sqrt(totals)
+            totals[totals == 0.0] = 1.0
+            X.data /= totals[rows]
+        return X
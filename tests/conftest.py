@@ -0,0 +1,31 @@
+"""Konfigurasi pytest: akar repo di ``sys.path`` dan fixture bersama.
+
+Test dijalankan dari akar repo (``python -m pytest -q``); path relatif
+seperti ``Model/`` dan ``Dataset/`` mengikuti konvensi aplikasi.
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(autouse=True)
+def _repo_cwd(monkeypatch):
+    monkeypatch.chdir(ROOT)
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    """Salinan artefak ringkas ``Model/`` (tanpa registry) di folder sementara."""
+    import shutil
+
+    from deteksi_sms import artifacts
+
+    target = tmp_path / "Model"
+    target.mkdir()
+    for path in artifacts.artifact_files(os.path.join(ROOT, artifacts.MODEL_DIR)):
+        shutil.copy(path, target)
+    return str(target)
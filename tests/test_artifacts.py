@@ -0,0 +1,38 @@
+import os
+
+import numpy as np
+import pytest
+
+from deteksi_sms import artifacts
+from deteksi_sms.inference import LinearSVCScorer
+
+# Pickle SVC notebook dibuat dengan scikit-learn versi lain (InconsistentVersionWarning)
+pytestmark = pytest.mark.filterwarnings("ignore::UserWarning")
+
+
+def test_vectorizer_matches_notebook_kbest_features():
+    # Vectorizer tersimpan = TF-IDF + SelectKBest(chi2) notebook (x_kbest_feature)
+    assert artifacts.verify_vectorizer() <= 1e-12
+
+
+def test_compact_model_matches_pickled_svc():
+    assert artifacts.verify_model() == 0
+
+
+def test_shared_vectorizer_matches_reference_bit_for_bit():
+    # Vocabulary/IDF dari mmap harus menghasilkan matriks yang sama dengan TfidfVectorizer
+    assert artifacts.verify_shared() == 0
+
+
+def test_reexport_leaves_mapped_artifacts_intact(model_dir):
+    before, _ = artifacts.load_compact(model_dir)
+    weights = np.array(before.coef_t)
+    scorer = LinearSVCScorer(weights * 2, before.intercept_ + 1, before.classes_)
+    artifacts.export_compact(scorer, artifacts.load_compact(model_dir)[1], model_dir)
+
+    # Proses yang sudah mmap file lama tetap membaca bobot lama, bukan file yang ditulis ulang
+    assert np.array_equal(before.coef_t, weights)
+    after, _ = artifacts.load_compact(model_dir)
+    assert np.array_equal(after.coef_t, (weights * 2).astype(np.float32))
+    assert np.array_equal(after.intercept_, before.intercept_ + 1)
+    assert not [name for name in os.listdir(model_dir) if name.endswith(".tmp")]
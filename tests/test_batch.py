@@ -0,0 +1,64 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from deteksi_sms import artifacts
+from deteksi_sms.batch import LABELS, TEXT_COLUMN, classify_file, score_texts
+from deteksi_sms.preprocessing import get_preprocessor
+
+CHUNKSIZE = 7
+
+
+@pytest.fixture(scope="module")
+def model():
+    scorer, vectorizer = artifacts.load_model_and_vectorizer()
+    return get_preprocessor(), vectorizer, scorer
+
+
+@pytest.fixture(scope="module")
+def texts():
+    sample = pd.read_csv("Dataset/dataset_spam_sms.csv")[TEXT_COLUMN].astype(str)
+    texts = sample.iloc[::10].tolist()[:20]
+    # Sel kosong, spasi saja dan teks yang oleh pandas biasa dianggap NaN, tersebar di beberapa chunk
+    for position, text in [(0, ""), (6, "   "), (7, "NaN"), (13, "NA"), (14, "null"), (22, "")]:
+        texts.insert(position, text)
+    return texts
+
+
+def _csv(texts):
+    buffer = io.BytesIO()
+    pd.DataFrame({"id": range(len(texts)), TEXT_COLUMN: texts}).to_csv(buffer, index=False)
+    buffer.seek(0)
+    return buffer, "pesan.csv"
+
+
+def _xlsx(texts):
+    buffer = io.BytesIO()
+    # Sel kosong di Excel terbaca None oleh openpyxl
+    column = [None if text == "" else text for text in texts]
+    pd.DataFrame({"id": range(len(texts)), TEXT_COLUMN: column}).to_excel(buffer, index=False)
+    buffer.seek(0)
+    return buffer, "pesan.xlsx"
+
+
+@pytest.mark.parametrize("make_file", [_csv, _xlsx])
+def test_classify_file_matches_per_message_scoring(model, texts, make_file):
+    assert len(texts) > 3 * CHUNKSIZE
+    file, filename = make_file(texts)
+    progress = []
+    result = classify_file(file, filename, TEXT_COLUMN, *model, chunksize=CHUNKSIZE, progress=progress.append)
+
+    assert result[TEXT_COLUMN].tolist() == texts
+    expected = [int(score_texts([text], *model)[0][0]) for text in texts]
+    assert result["label"].tolist() == expected
+    assert result["kategori"].tolist() == [LABELS[label] for label in expected]
+    assert progress == [*range(CHUNKSIZE, len(texts), CHUNKSIZE), len(texts)]
+
+
+def test_classify_file_without_rows(model):
+    file, filename = _csv([])
+    result = classify_file(file, filename, TEXT_COLUMN, *model, chunksize=CHUNKSIZE)
+    assert result.empty and list(result.columns) == [TEXT_COLUMN, "label", "kategori"]
+    assert np.asarray(result["label"]).size == 0
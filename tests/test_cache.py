@@ -0,0 +1,67 @@
+import numpy as np
+
+from deteksi_sms import registry
+from deteksi_sms.cache import ResultCache, cached_scores
+from deteksi_sms.inference import LinearSVCScorer
+
+
+def test_hit_for_same_model_and_normalised_text():
+    cache = ResultCache("m1")
+    cache.put("Promo Pulsa ", 2, [0.1, -0.2, 0.3], "m1")
+    assert cache.get("  promo pulsa") == (2, (0.1, -0.2, 0.3))
+    assert cache.get("promo pulsa", "m1") == (2, (0.1, -0.2, 0.3))
+
+
+def test_result_from_another_model_is_neither_stored_nor_served():
+    cache = ResultCache("m2")
+    # Batch model lama selesai setelah pergantian versi
+    cache.put("hadiah undian", 1, [1.0, 1.0, 1.0], "m1")
+    assert cache.get("hadiah undian") is None
+    cache.put("hadiah undian", 1, [1.0, 1.0, 1.0], "m2")
+    assert cache.get("hadiah undian", "m1") is None
+    assert cache.get("hadiah undian", "m2") is not None
+
+
+def test_invalidate_drops_memory_and_sqlite_tiers(tmp_path):
+    db = str(tmp_path / "cache.db")
+    cache = ResultCache("m1", sqlite_path=db)
+    cache.put("halo", 0, [0.5], "m1")
+    assert ResultCache("m1", sqlite_path=db).get("halo") == (0, (0.5,))
+    cache.invalidate("m2")
+    assert cache.get("halo") is None
+    assert ResultCache("m2", sqlite_path=db).get("halo") is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_cached_scores_only_scores_misses():
+    cache = ResultCache("m1")
+    cache.put("a", 0, [0.0], "m1")
+    scored = []
+
+    def score(texts):
+        scored.extend(texts)
+        return np.ones(len(texts), dtype=int), np.ones((len(texts), 1))
+
+    labels, scores = cached_scores(["a", "b", "a"], cache, score, "m1")
+    assert scored == ["b"]
+    assert labels.tolist() == [0, 1, 0]
+    # Checksum model lain: semua dihitung ulang dan tidak mengisi cache
+    cached_scores(["a"], cache, score, "m0")
+    assert scored == ["b", "a"] and cache.get("a") == (0, (0.0,))
+
+
+def test_hot_model_swap_invalidates_cache(model_dir):
+    hot = registry.HotModel(model_dir, watch=False)
+    cache = ResultCache(hot.checksum())
+    hot.subscribe(lambda loaded: cache.invalidate(loaded.checksum))
+    cache.put("promo", 2, [0.0, 0.0, 0.0], hot.checksum())
+
+    loaded = hot.snapshot()
+    weights = np.array(loaded.scorer.coef_t) * 2
+    scorer = LinearSVCScorer(weights, loaded.scorer.intercept_, loaded.scorer.classes_)
+    version = hot.registry.publish(scorer, loaded.vectorizer, source="test")
+    hot.registry.activate(version)
+    hot.refresh()
+    assert hot.version == version
+    assert cache.model == hot.checksum() != loaded.checksum
+    assert cache.get("promo") is None
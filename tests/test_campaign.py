@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from deteksi_sms import campaign, registry
+from deteksi_sms.cache import cached_scores
+from deteksi_sms.inference import LinearSVCScorer
+
+TEMPLATE = "selamat nomor anda terpilih sebagai pemenang undian hadiah utama dari operator silakan hubungi agen resmi kami"
+OTHER = "besok rapat koordinasi panitia dimulai pukul sembilan pagi di ruang serbaguna kantor kecamatan jangan terlambat"
+
+
+def _index(model="m1", **options):
+    return campaign.CampaignIndex(str.lower, model, **options)
+
+
+def _distinct(n):
+    return [f"pesan ke {i} berisi kata unik{i} dan juga token khusus{i} lainnya" for i in range(n)]
+
+
+def _similarity(a, b):
+    sigs = campaign.signatures([a.split(), b.split()])
+    return np.count_nonzero(sigs[0] == sigs[1]) / campaign.NUM_PERM
+
+
+def test_signatures_and_band_keys():
+    tokens = [TEMPLATE.split(), OTHER.split(), TEMPLATE.split()]
+    sigs = campaign.signatures(tokens)
+    keys = campaign.band_keys(sigs)
+    assert sigs.shape == (3, campaign.NUM_PERM) and sigs.dtype == np.uint32
+    assert keys.shape == (3, campaign.BANDS)
+    # Signature per pesan tidak bergantung pada pesan lain di batch yang sama
+    assert np.array_equal(sigs[0], campaign.signatures([TEMPLATE.split()])[0])
+    assert np.array_equal(sigs[0], sigs[2]) and np.array_equal(keys[0], keys[2])
+    assert not (keys[0] == keys[1]).any()
+    assert campaign.signatures([]).shape == (0, campaign.NUM_PERM)
+
+
+def test_similarity_tracks_shared_shingles():
+    variant = TEMPLATE.replace("utama", "besar")
+    assert _similarity(TEMPLATE, variant) > 0.7
+    assert _similarity(TEMPLATE, OTHER) < 0.2
+
+
+def test_variant_gets_cluster_label_above_threshold():
+    index = _index()
+    index.put_many([TEMPLATE], [2], [[1.0, 2.0, 3.0]])
+    variant = TEMPLATE.replace("utama", "besar")
+    found, missing = index.lookup_many([variant, OTHER, "halo apa kabar"])
+    assert found == {0: (2, (1.0, 2.0, 3.0))} and missing == [1, 2]
+    stats = index.stats()
+    assert (stats["hits"], stats["misses"], stats["skipped_short"]) == (1, 1, 1)
+    assert [(row["label"], row["count"]) for row in index.campaigns()] == [(2, 2)]
+
+    strict = _index(threshold=1.0)
+    strict.put_many([TEMPLATE], [2], [[1.0, 2.0, 3.0]])
+    assert strict.lookup_many([variant])[1] == [0]
+    assert strict.lookup_many([TEMPLATE])[0] == {0: (2, (1.0, 2.0, 3.0))}
+
+
+def test_min_tokens_must_exceed_shingle_width():
+    with pytest.raises(ValueError):
+        _index(min_tokens=campaign.SHINGLE_WORDS)
+
+
+def test_oldest_cluster_is_evicted_at_capacity():
+    index = _index(max_memory_mb=3 * campaign.CLUSTER_BYTES / (1024 * 1024))
+    texts = _distinct(5)
+    for text in texts[:3]:
+        index.put_many([text], [0], [[0.0]])
+    index.lookup_many([texts[0]])  # texts[0] baru terlihat lagi, texts[1] kini yang tertua
+    index.put_many(texts[3:], [0, 0], [[0.0], [0.0]])
+    assert index.stats()["clusters"] == 3 and index.evictions == 2
+    found, _ = index.lookup_many(texts)
+    assert sorted(found) == [0, 3, 4]
+
+
+def test_expired_clusters_are_dropped(monkeypatch):
+    clock = [1_000.0]
+    monkeypatch.setattr(campaign.time, "time", lambda: clock[0])
+    index = _index(ttl_seconds=60)
+    index.put_many([TEMPLATE], [2], [[0.0]])
+    clock[0] += 61
+    index.put_many([OTHER], [0], [[0.0]])
+    assert index.stats()["clusters"] == 1
+    assert index.lookup_many([TEMPLATE])[1] == [0]
+
+
+def test_other_model_is_neither_read_nor_stored():
+    index = _index("m1")
+    index.put_many([TEMPLATE], [2], [[0.0]], "m0")
+    assert index.stats()["clusters"] == 0
+    index.put_many([TEMPLATE], [2], [[0.0]], "m1")
+    assert index.lookup_many([TEMPLATE], "m0")[1] == [0]
+    assert index.lookup_many([TEMPLATE], "m1")[0] == {0: (2, (0.0,))}
+
+
+def test_hot_model_swap_invalidates_campaigns(model_dir):
+    hot = registry.HotModel(model_dir, watch=False)
+    old = hot.snapshot()
+    index = _index(hot.checksum())
+    hot.subscribe(lambda loaded: index.invalidate(loaded.checksum))
+    index.put_many([TEMPLATE], [2], [[0.0, 0.0, 0.0]], old.checksum)
+
+    scorer = LinearSVCScorer(np.array(old.scorer.coef_t) * 2, old.scorer.intercept_, old.scorer.classes_)
+    version = hot.registry.publish(scorer, old.vectorizer, source="test")
+    hot.registry.activate(version)
+    hot.refresh()
+    assert index.model == hot.checksum() != old.checksum
+    assert index.lookup_many([TEMPLATE])[1] == [0]
+
+    # Batch yang mengambil snapshot sebelum swap dan selesai sesudahnya tidak mengisi indeks
+    def old_model(texts):
+        return np.full(len(texts), 2), np.zeros((len(texts), 3))
+
+    cached_scores([TEMPLATE], index, old_model, old.checksum)
+    assert index.stats()["clusters"] == 0
+    assert index.lookup_many([TEMPLATE], hot.checksum())[1] == [0]
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from deteksi_sms import artifacts
+from deteksi_sms.explain import Explainer
+from deteksi_sms.inference import LinearSVCScorer
+from deteksi_sms.preprocessing import get_preprocessor
+
+
+def naive_explanation(scorer, row, label, top_k):
+    """Kontribusi ``tfidf x bobot kelas`` token demi token, tanpa vektorisasi."""
+    c = list(scorer.classes_).index(label)
+    contributions = []
+    for j, value in zip(row.indices, row.data):
+        weight = 0.0
+        for k, (a, b) in enumerate(scorer.pairs):
+            if c == a:
+                weight += float(scorer.coef_t[j, k])
+            elif c == b:
+                weight -= float(scorer.coef_t[j, k])
+        if value * weight > 0:
+            contributions.append((j, value * weight))
+    # sorted stabil: bobot sama tetap urut posisi di baris CSR
+    return sorted(contributions, key=lambda item: -item[1])[:top_k]
+
+
+@pytest.fixture(scope="module")
+def shipped():
+    scorer, vectorizer = artifacts.load_model_and_vectorizer()
+    texts = get_preprocessor().process_many(pd.read_csv("Dataset/dataset_spam_sms.csv")["teks"].astype(str))
+    # Baris tanpa token vocabulary sama sekali
+    texts = ["", "qwertyuiop zxcvbnm", *texts]
+    return scorer, vectorizer, vectorizer.transform(texts)
+
+
+@pytest.mark.parametrize("top_k", [1, 5])
+def test_explain_matches_naive_contributions_for_every_class(shipped, top_k):
+    scorer, vectorizer, X = shipped
+    assert len(scorer.classes_) == 3 and np.diff(X.indptr)[:2].tolist() == [0, 0]
+    explainer = Explainer(scorer, vectorizer)
+    terms = vectorizer.get_feature_names_out()
+    for label in scorer.classes_:
+        explanations = explainer.explain(X, np.full(X.shape[0], label), top_k)
+        words = explanations.trigger_words()
+        for i in range(X.shape[0]):
+            expected = naive_explanation(scorer, X[i], label, top_k)
+            got = explanations[i]
+            assert [term for term, _ in got] == [str(terms[j]) for j, _ in expected]
+            assert np.allclose([w for _, w in got], [w for _, w in expected], rtol=1e-12, atol=0)
+            assert words[i] == ", ".join(str(terms[j]) for j, _ in expected)
+    assert explainer.explain(X[:2], [0, 0]).trigger_words().tolist() == ["", ""]
+
+
+def test_ties_keep_csr_order_and_respect_top_k():
+    vectorizer = TfidfVectorizer().fit(["alfa beta gama delta"])
+    # Empat token dengan bobot identik; kelas 0 menang di semua pasangan
+    scorer = LinearSVCScorer(np.ones((4, 3)), np.zeros(3), [0, 1, 2])
+    X = sp.csr_matrix(([0.5, 0.5, 0.5, 0.25], [2, 0, 3, 1], [0, 4]), shape=(1, 4))
+    explanations = Explainer(scorer, vectorizer).explain(X, [0], top_k=2)
+    assert explanations[0] == [("delta", 0.5 * 2), ("alfa", 0.5 * 2)]
+    assert explanations.trigger_words().tolist() == ["delta, alfa"]
+    # Untuk kelas 2 semua kontribusi negatif: tidak ada kata pemicu
+    assert Explainer(scorer, vectorizer).explain(X, [2])[0] == []
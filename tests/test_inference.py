@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.svm import SVC
+
+from deteksi_sms.explain import Explainer
+from deteksi_sms.inference import LinearSVCScorer
+from deteksi_sms.online import _targets
+
+TEXTS = [
+    "halo apa kabar", "halo besok rapat", "kabar baik halo", "rapat pagi ini",
+    "promo pulsa gratis", "gratis hadiah promo", "menang hadiah undian", "undian promo hadiah",
+    "diskon belanja hari ini", "diskon toko baru", "belanja diskon akhir bulan", "toko baru diskon",
+]
+LABELS = [0] * 4 + [1] * 4 + [2] * 4
+
+
+def _fit(n_classes: int):
+    n = 4 * n_classes
+    vectorizer = TfidfVectorizer().fit(TEXTS[:n])
+    X = vectorizer.transform(TEXTS[:n])
+    return SVC(kernel="linear").fit(X, LABELS[:n]), vectorizer, X
+
+
+@pytest.mark.parametrize("n_classes", [2, 3])
+def test_from_svc_matches_predict(n_classes):
+    svc, _, X = _fit(n_classes)
+    scorer = LinearSVCScorer.from_svc(svc)
+    assert np.array_equal(scorer.predict(X), svc.predict(X))
+
+
+def test_binary_scores_follow_ovo_convention():
+    # Skor > 0 berarti kelas pertama pasangan, sama seperti SVC multikelas
+    svc, _, X = _fit(2)
+    scorer = LinearSVCScorer.from_svc(svc)
+    assert np.allclose(scorer.decision_function(X)[:, 0], -svc.decision_function(X))
+    predicted = scorer.predict(X)
+    assert np.all(np.sign(scorer.decision_function(X)) == _targets(scorer, predicted))
+
+
+def test_binary_explainer_points_to_predicted_class():
+    svc, vectorizer, _ = _fit(2)
+    scorer = LinearSVCScorer.from_svc(svc)
+    X = vectorizer.transform(["promo hadiah gratis", "halo rapat"])
+    labels = scorer.predict(X)
+    assert labels.tolist() == [1, 0]
+    explanations = Explainer(scorer, vectorizer).explain(X, labels)
+    assert {term for term, _ in explanations[0]} <= {"promo", "hadiah", "gratis"}
+    assert {term for term, _ in explanations[1]} <= {"halo", "rapat"}
+    assert len(explanations[0]) and len(explanations[1])
+
+
+def test_from_svc_rejects_non_linear_kernel():
+    svc, _, X = _fit(2)
+    with pytest.raises(ValueError):
+        LinearSVCScorer.from_svc(SVC(kernel="rbf").fit(X, LABELS[:8]))
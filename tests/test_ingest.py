@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from deteksi_sms import ingest
+
+
+class Interrupted(Exception):
+    pass
+
+
+class _LabelsThatTrip(dict):
+    """``LABELS`` yang memutus penulisan di tengah chunk setelah ``after`` baris."""
+
+    def __init__(self, labels, after):
+        super().__init__(labels)
+        self.remaining = after
+
+    def get(self, *args):
+        self.remaining -= 1
+        if self.remaining < 0:
+            raise Interrupted
+        return super().get(*args)
+
+
+@pytest.fixture
+def dump(tmp_path):
+    path = tmp_path / "dump.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(23):
+            text = "selamat anda menang undian hadiah" if i % 3 else f"besok kita rapat jam {i}"
+            f.write(json.dumps({"text": text}) + "\n")
+    return str(path)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+def test_resume_after_interrupt_matches_uninterrupted_run(dump, model_dir, tmp_path, monkeypatch, suffix):
+    options = dict(model_dir=model_dir, workers=1, chunksize=5, quiet=True)
+    expected = tmp_path / f"expected{suffix}"
+    ingest.ingest(dump, str(expected), **options)
+
+    out = tmp_path / f"out{suffix}"
+    labels = ingest.LABELS
+    # Putus di baris ke-3 chunk ketiga: dua baris sudah masuk buffer output
+    monkeypatch.setattr(ingest, "LABELS", _LabelsThatTrip(labels, after=12))
+    with pytest.raises(Interrupted):
+        ingest.ingest(dump, str(out), **options)
+    state = ingest.load_checkpoint(str(out))
+    assert state["records"] == 10 and not state["done"]
+    assert out.stat().st_size == state["output_bytes"]
+
+    monkeypatch.setattr(ingest, "LABELS", labels)
+    state = ingest.ingest(dump, str(out), resume=True, **options)
+    assert state["done"] and state["records"] == 23
+    assert out.read_text(encoding="utf-8") == expected.read_text(encoding="utf-8")
+
+
+def test_corrupt_jsonl_line_is_skipped_and_counted(dump, model_dir, tmp_path, monkeypatch, caplog):
+    options = dict(model_dir=model_dir, workers=1, chunksize=5, quiet=True)
+    lines = open(dump, "rb").read().splitlines(keepends=True)
+    corrupt = tmp_path / "corrupt.jsonl"
+    bad = b'{"text": "pesan terpotong\n'
+    corrupt.write_bytes(b"".join(lines[:7]) + bad + b"".join(lines[7:]))
+    expected = tmp_path / "expected.csv"
+    ingest.ingest(dump, str(expected), **options)
+
+    out = tmp_path / "out.csv"
+    state = ingest.ingest(str(corrupt), str(out), **options)
+    assert state["done"] and (state["records"], state["skipped"]) == (23, 1)
+    assert out.read_text(encoding="utf-8") == expected.read_text(encoding="utf-8")
+    assert f"offset byte {len(b''.join(lines[:7]))}" in caplog.text
+
+    # Terputus setelah baris rusak terbaca: saat resume baris itu tidak dihitung dua kali
+    out = tmp_path / "resumed.csv"
+    labels = ingest.LABELS
+    monkeypatch.setattr(ingest, "LABELS", _LabelsThatTrip(labels, after=12))
+    with pytest.raises(Interrupted):
+        ingest.ingest(str(corrupt), str(out), **options)
+    assert ingest.load_checkpoint(str(out))["skipped"] == 1
+    monkeypatch.setattr(ingest, "LABELS", labels)
+    state = ingest.ingest(str(corrupt), str(out), resume=True, **options)
+    assert (state["records"], state["skipped"]) == (23, 1)
+    assert out.read_text(encoding="utf-8") == expected.read_text(encoding="utf-8")
@@ -0,0 +1,39 @@
+from deteksi_sms import online
+from deteksi_sms.feedback import FeedbackStore
+from deteksi_sms.preprocessing import get_preprocessor
+from deteksi_sms.registry import ModelRegistry
+
+SPAM = "selamat nomor anda menang hadiah mobil dari undian, hubungi kami sekarang"
+
+
+def test_records_stop_bounds_the_window(tmp_path):
+    store = FeedbackStore(str(tmp_path / "feedback.jsonl"))
+    for i in range(5):
+        store.append(f"pesan {i}", 0, 1)
+    assert [r["text"] for r in store.records(1, 3)] == ["pesan 1", "pesan 2"]
+
+
+def test_feedback_appended_during_update_is_used_exactly_once(model_dir, tmp_path, monkeypatch):
+    path = str(tmp_path / "feedback.jsonl")
+    store = FeedbackStore(path)
+    for i in range(3):
+        store.append(f"{SPAM} {i}", 0, 1)
+
+    count = FeedbackStore.count
+
+    def count_then_append(self):
+        # Koreksi baru masuk tepat setelah update membaca posisi akhir
+        n = count(self)
+        monkeypatch.setattr(FeedbackStore, "count", count)
+        store.append(f"{SPAM} terlambat", 0, 1)
+        return n
+
+    monkeypatch.setattr(FeedbackStore, "count", count_then_append)
+    report = online.update_from_feedback(get_preprocessor(), model_dir, path, max_drop=1.0)
+    assert report["feedback"] == 3
+    manifest = ModelRegistry(model_dir).manifest(report["version"])
+    assert (manifest["feedback_start"], manifest["feedback_end"]) == (0, 3)
+
+    second = online.update_from_feedback(get_preprocessor(), model_dir, path, max_drop=1.0)
+    assert second["feedback"] == 1
+    assert ModelRegistry(model_dir).manifest(second["version"])["feedback_end"] == 4
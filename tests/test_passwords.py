@@ -0,0 +1,85 @@
+import hashlib
+import threading
+
+import pytest
+
+from deteksi_sms import passwords
+from deteksi_sms.userstore import SQLiteUserStore
+
+
+@pytest.fixture(autouse=True)
+def cheap_cost(monkeypatch):
+    # Parameter biaya kecil supaya tes cepat; format dan alurnya tetap sama
+    monkeypatch.setattr(passwords, "SCRYPT_N", 2 ** 10)
+    monkeypatch.setattr(passwords, "PBKDF2_ITERATIONS", 1_000)
+
+
+@pytest.mark.parametrize("has_scrypt", [True, False])
+def test_round_trip_with_random_salt(monkeypatch, has_scrypt):
+    if has_scrypt and not hasattr(hashlib, "scrypt"):
+        pytest.skip("OpenSSL tanpa scrypt")
+    monkeypatch.setattr(passwords, "HAS_SCRYPT", has_scrypt)
+    first, second = passwords.hash_password("rahasia"), passwords.hash_password("rahasia")
+    assert first.startswith("scrypt$n=1024,r=8,p=1$" if has_scrypt else "pbkdf2_sha256$1000$")
+    assert first != second
+    assert passwords.verify_password("rahasia", first) and passwords.verify_password("rahasia", second)
+    assert not passwords.verify_password("Rahasia", first)
+    assert not passwords.needs_rehash(first)
+
+
+def test_legacy_sha256_verifies_and_is_upgraded_on_login(tmp_path):
+    legacy = hashlib.sha256("admin123".encode("utf-8")).hexdigest()
+    assert passwords.verify_password("admin123", legacy)
+    assert not passwords.verify_password("admin124", legacy)
+    assert passwords.needs_rehash(legacy)
+
+    # Alur login aplikasi_sms.py: hash baru hanya ditulis bila hash lama belum diganti sesi lain
+    store = SQLiteUserStore(str(tmp_path / "users.db"))
+    store.create_user("admin", legacy)
+    upgraded = passwords.hash_password("admin123")
+    assert store.set_hash("admin", upgraded, expected=legacy)
+    assert not store.set_hash("admin", passwords.hash_password("admin123"), expected=legacy)
+    assert store.get_hash("admin") == upgraded
+    assert passwords.verify_password("admin123", upgraded) and not passwords.needs_rehash(upgraded)
+
+
+def test_changed_cost_parameters_need_rehash(monkeypatch):
+    stored = passwords.hash_password("rahasia")
+    monkeypatch.setattr(passwords, "SCRYPT_N", 2 ** 11)
+    monkeypatch.setattr(passwords, "PBKDF2_ITERATIONS", 2_000)
+    assert passwords.needs_rehash(stored)
+    # Hash lama tetap bisa dipakai login karena parameternya ikut tersimpan
+    assert passwords.verify_password("rahasia", stored)
+
+
+@pytest.mark.parametrize("stored", [
+    "", None, "scrypt$n=1024", "bcrypt$10$c2FsdA==$a2V5", "scrypt$n=1024,r=8$c2FsdA==$a2V5",
+    "pbkdf2_sha256$banyak$c2FsdA==$a2V5", "pbkdf2_sha256$1000$bukan-base64!$a2V5",
+])
+def test_malformed_hash_never_verifies(stored):
+    assert not passwords.verify_password("rahasia", stored)
+
+
+def test_saturated_pool_raises_hashing_busy(monkeypatch):
+    monkeypatch.setattr(passwords, "_pending", threading.BoundedSemaphore(2))
+    monkeypatch.setattr(passwords, "HASH_QUEUE_TIMEOUT", 0.05)
+    release, started = threading.Event(), threading.Semaphore(0)
+
+    def slow():
+        started.release()
+        release.wait()
+
+    workers = [threading.Thread(target=passwords._run, args=(slow,)) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for _ in workers:
+        assert started.acquire(timeout=5)
+    try:
+        with pytest.raises(passwords.HashingBusy):
+            passwords.hash_password_pooled("rahasia")
+    finally:
+        release.set()
+        for worker in workers:
+            worker.join()
+    # Slot dikembalikan setelah hashing selesai
+    assert passwords.verify_password_pooled("rahasia", passwords.hash_password_pooled("rahasia"))
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from deteksi_sms import registry
+from deteksi_sms.inference import LinearSVCScorer
+
+
+def _rescaled(loaded, factor):
+    return LinearSVCScorer(np.array(loaded.scorer.coef_t) * factor, loaded.scorer.intercept_, loaded.scorer.classes_)
+
+
+def test_publish_activate_rollback(model_dir):
+    reg = registry.ModelRegistry(model_dir)
+    assert reg.active() == registry.BASE_VERSION
+    base = reg.load(registry.BASE_VERSION)
+
+    first = reg.publish(_rescaled(base, 2), base.vectorizer, source="test")
+    second = reg.publish(_rescaled(base, 3), base.vectorizer, parent=first, source="test")
+    assert reg.versions() == [first, second]
+    assert reg.verify(second) == []
+
+    reg.activate(second)
+    assert reg.active() == second
+    assert reg.rollback() == first
+    assert reg.rollback() == registry.BASE_VERSION
+    with pytest.raises(ValueError):
+        reg.rollback()
+
+
+def test_tampered_version_is_refused(model_dir):
+    reg = registry.ModelRegistry(model_dir)
+    base = reg.load(registry.BASE_VERSION)
+    version = reg.publish(_rescaled(base, 2), base.vectorizer, source="test")
+    name = sorted(reg.manifest(version)["files"])[0]
+    with open(f"{reg.path(version)}/{name}", "ab") as f:
+        f.write(b"\0")
+    assert reg.verify(version) == [name]
+    with pytest.raises(ValueError):
+        reg.activate(version)
+    assert reg.active() == registry.BASE_VERSION
+
+
+def test_hot_model_keeps_snapshot_until_refresh(model_dir):
+    hot = registry.HotModel(model_dir, watch=False)
+    before = hot.snapshot()
+    version = hot.registry.publish(_rescaled(before, 2), before.vectorizer, source="test")
+    hot.registry.activate(version)
+    # Snapshot lama tetap utuh; versi baru baru terpasang setelah refresh
+    assert hot.snapshot() is before
+    after = hot.refresh()
+    assert after.version == version and hot.snapshot() is after
+    assert before.version == registry.BASE_VERSION
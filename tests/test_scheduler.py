@@ -0,0 +1,67 @@
+import threading
+
+import pytest
+
+from deteksi_sms.scheduler import BatchScheduler
+
+
+def _labels(texts):
+    return [len(text) for text in texts], [[0.0] for _ in texts]
+
+
+def test_batches_concurrent_requests_and_splits_results():
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def score(texts):
+        calls.append(list(texts))
+        started.set()
+        release.wait(5)
+        return _labels(texts)
+
+    scheduler = BatchScheduler(score, max_batch=100, max_wait_ms=1)
+    first = scheduler.submit(["a"])
+    assert started.wait(5)
+    # Selama batch pertama berjalan, dua request berikutnya menunggu di antrian
+    futures = [scheduler.submit(["bb", "ccc"]), scheduler.submit(["dddd"])]
+    release.set()
+    assert first.result(5)[0] == [1]
+    assert futures[0].result(5)[0] == [2, 3]
+    assert futures[1].result(5)[0] == [4]
+    assert calls == [["a"], ["bb", "ccc", "dddd"]]
+    assert scheduler.metrics()["messages"] == 4
+
+
+def test_cancelled_future_is_skipped_and_worker_survives():
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def score(texts):
+        calls.append(list(texts))
+        started.set()
+        release.wait(5)
+        return _labels(texts)
+
+    scheduler = BatchScheduler(score, max_batch=100, max_wait_ms=1)
+    running = scheduler.submit(["sedang"])
+    assert started.wait(5)
+    cancelled = scheduler.submit(["batal"])
+    assert cancelled.cancel()
+    later = scheduler.submit(["nanti"])
+    release.set()
+    assert running.result(5)[0] == [6]
+    assert later.result(5)[0] == [5]
+    assert all("batal" not in batch for batch in calls)
+    # Thread pekerja masih hidup untuk request berikutnya
+    assert scheduler.classify(["lagi"], timeout=5)[0] == [4]
+
+
+def test_score_error_is_delivered_to_every_request():
+    def score(texts):
+        raise RuntimeError("model rusak")
+
+    scheduler = BatchScheduler(score, max_wait_ms=1)
+    with pytest.raises(RuntimeError):
+        scheduler.classify(["x"], timeout=5)
+    with pytest.raises(RuntimeError):
+        scheduler.classify(["y"], timeout=5)
@@ -0,0 +1,46 @@
+import asyncio
+import json
+
+from tornado.httpclient import AsyncHTTPClient
+from tornado.httpserver import HTTPServer
+from tornado.testing import bind_unused_port
+
+from deteksi_sms import service
+from deteksi_sms.inference import LinearSVCScorer
+
+
+def test_score_names_follow_the_scoring_snapshot(model_dir):
+    service.load_resources.cache_clear()
+    hot, _ = service.load_resources(model_dir)
+    hot.stop()
+    loaded = hot.snapshot()
+
+    async def run():
+        sock, port = bind_unused_port()
+        server = HTTPServer(service.make_app(model_dir))
+        server.add_sockets([sock])
+        client = AsyncHTTPClient()
+
+        async def scores():
+            response = await client.fetch(f"http://127.0.0.1:{port}/classify", method="POST",
+                                          body=json.dumps({"texts": ["halo"]}))
+            return json.loads(response.body)["results"][0]["scores"]
+
+        try:
+            before = await scores()
+            # Versi baru skema one-vs-rest: nama skor berubah dari "0v1" menjadi label kelas
+            scorer = LinearSVCScorer(loaded.scorer.coef_t, loaded.scorer.intercept_,
+                                     loaded.scorer.classes_, scheme="ovr")
+            version = hot.registry.publish(scorer, loaded.vectorizer, source="test")
+            hot.registry.activate(version)
+            hot.refresh()
+            return before, await scores()
+        finally:
+            server.stop()
+
+    try:
+        before, after = asyncio.run(run())
+    finally:
+        service.load_resources.cache_clear()
+    assert list(before) == loaded.scorer.score_names
+    assert list(after) == [str(label) for label in loaded.scorer.classes_]
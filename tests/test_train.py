@@ -0,0 +1,56 @@
+import csv
+import sys
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+from deteksi_sms import train
+
+
+def _write_work_file(path, rows):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["clean_text", "label"])
+        writer.writerows(rows)
+
+
+def test_shards_stay_near_chunksize_when_shard_count_is_capped(tmp_path, monkeypatch):
+    monkeypatch.setattr(train, "MAX_SHARDS", 2)
+    rows = [(f"pesan {i}", i % 3) for i in range(500)]
+    work = tmp_path / "clean.csv"
+    _write_work_file(work, rows)
+    shards = train.shuffle_to_shards(str(work), str(tmp_path), len(rows), chunksize=20, seed=0)
+    sizes = [len(pd.read_csv(path)) for path in shards]
+    assert max(sizes) <= train.MAX_SHARD_CHUNKS * 20
+    combined = pd.concat([pd.read_csv(path, keep_default_na=False) for path in shards])
+    assert Counter(map(tuple, combined.itertuples(index=False))) == Counter(rows)
+
+
+def test_document_frequency_ignores_holdout_rows(tmp_path):
+    # Setiap pesan punya satu token unik, jadi DF = jumlah baris train
+    words = [f"zq{a}{b}x" for a in "abcdefgh" for b in "abcde"]
+    source = tmp_path / "data.csv"
+    pd.DataFrame({"teks": words, "label": [i % 3 for i in range(len(words))]}).to_csv(source, index=False)
+    work, test = tmp_path / "clean.csv", tmp_path / "test.csv"
+    n_train, n_test, df, _ = train.preprocess_corpus(
+        str(source), str(work), str(test), "teks", "label", chunksize=16, workers=1, holdout=0.3, seed=1
+    )
+    assert n_test > 0 and n_train + n_test == len(words)
+    test_tokens = set(pd.read_csv(test)["clean_text"])
+    assert sum(df.values()) == n_train
+    assert not test_tokens & set(df)
+
+
+@pytest.mark.parametrize("argv", [
+    ["data.csv"],
+    ["data.csv", "--out", "Model"],
+    ["data.csv", "--out", "Model/registry"],
+    ["data.csv", "--out", "Model/registry/v0001"],
+    ["data.csv", "--out", "./Model/../Model/registry/v0002/sub"],
+])
+def test_cli_refuses_to_overwrite_registry_artifacts(monkeypatch, argv):
+    monkeypatch.setattr(sys, "argv", ["train", *argv])
+    with pytest.raises(SystemExit) as exc:
+        train.main()
+    assert exc.value.code == 2
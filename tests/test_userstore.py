@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from deteksi_sms.userstore import JsonUserStore, SQLiteUserStore, UserStore, open_user_store
+
+
+@pytest.fixture(params=["sqlite", "json"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteUserStore(str(tmp_path / "users.db"))
+    return JsonUserStore(str(tmp_path / "users.json"))
+
+
+def test_create_get_and_compare_and_set(store):
+    assert store.get_hash("danny") is None
+    assert store.create_user("danny", "h1")
+    assert not store.create_user("danny", "h2")
+    assert store.get_hash("danny") == "h1"
+    assert not store.set_hash("danny", "h3", expected="salah")
+    assert store.set_hash("danny", "h3", expected="h1")
+    assert store.get_hash("danny") == "h3"
+    assert not store.set_hash("tidak_ada", "h")
+    assert store.count() == 1
+
+
+def test_seed_only_hashes_missing_users(store):
+    store.create_user("admin", "lama")
+    hashed = []
+    store.seed({"admin": "pw", "baru": "pw2"}, hash_fn=lambda pw: hashed.append(pw) or f"#{pw}")
+    assert hashed == ["pw2"]
+    assert store.get_hash("admin") == "lama" and store.get_hash("baru") == "#pw2"
+
+
+def test_sqlite_migrates_json_once(tmp_path, monkeypatch):
+    legacy = tmp_path / "users.json"
+    legacy.write_text(json.dumps({"users": {"lama": "hash"}}), encoding="utf-8")
+    monkeypatch.setattr("deteksi_sms.userstore.USERS_JSON", str(legacy))
+    store = open_user_store(f"sqlite:{tmp_path / 'users.db'}")
+    assert store.get_hash("lama") == "hash"
+    assert store.migrate_from_json(str(legacy)) == 0
+
+
+def test_incomplete_backend_fails_at_construction():
+    class Partial(UserStore):
+        def get_hash(self, username):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        open_user_store("redis:localhost")